@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Benchmark startup and memory of the JSON versus compiled fixture loaders.
+
+Run with ``python benchmarks/bench_binary_store.py``. With the compiled
+format, time to first lookup and Python heap usage should stay roughly
+constant as the number of observations grows.
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from bls_mcp.data.binary_store import compile_fixture_file  # noqa: E402
+from bls_mcp.data.mock_data import MockDataProvider  # noqa: E402
+
+from synthetic import write_fixtures  # noqa: E402
+
+# (series, years of monthly history)
+DATASETS = [(100, 10), (1_000, 10), (2_000, 40)]
+
+
+async def first_lookup(fixtures_dir: Path, series_id: str) -> tuple[float, float]:
+    """Return (ms to first get_series, MiB of Python heap retained)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    provider = MockDataProvider(fixtures_dir=fixtures_dir)
+    await provider.get_series(series_id, start_year=2020)
+    elapsed = (time.perf_counter() - start) * 1e3
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del provider
+    return elapsed, current / 2**20
+
+
+async def main() -> None:
+    print(f"{'observations':>13} {'json ms':>9} {'json MiB':>9} {'bin ms':>9} {'bin MiB':>9}")
+    for n_series, years in DATASETS:
+        with tempfile.TemporaryDirectory() as tmp:
+            fixtures_dir = Path(tmp)
+            series_ids = write_fixtures(fixtures_dir, n_series, years=years, start_year=2025 - years)
+            json_ms, json_mib = await first_lookup(fixtures_dir, series_ids[-1])
+
+            compile_fixture_file(fixtures_dir / "historical_data.json")
+            bin_ms, bin_mib = await first_lookup(fixtures_dir, series_ids[-1])
+
+        print(
+            f"{n_series * years * 12:>13,} {json_ms:>9.1f} {json_mib:>9.1f} "
+            f"{bin_ms:>9.1f} {bin_mib:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
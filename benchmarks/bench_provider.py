@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark MockDataProvider lookups as the catalog grows.
+
+Run with ``python benchmarks/bench_provider.py``. Per-call latency of the
+indexed lookups should stay flat from 10 to 100k series.
+"""
+
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from bls_mcp.data.mock_data import MockDataProvider  # noqa: E402
+
+from synthetic import write_fixtures  # noqa: E402
+
+CATALOG_SIZES = [10, 100, 1_000, 10_000, 100_000]
+CALLS = 2_000
+
+
+async def time_calls(coro_factory, calls: int = CALLS) -> float:
+    """Return mean microseconds per awaited call."""
+    start = time.perf_counter()
+    for i in range(calls):
+        await coro_factory(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+async def bench_size(n_series: int) -> dict[str, float]:
+    """Benchmark the provider against a catalog of ``n_series`` series."""
+    with tempfile.TemporaryDirectory() as tmp:
+        series_ids = write_fixtures(Path(tmp), n_series, years=1)
+        provider = MockDataProvider(fixtures_dir=Path(tmp))
+
+        # Pay the one-time load and index cost outside the timed loops
+        await provider.get_series_info(series_ids[0])
+
+        rng = random.Random(0)
+        picks = [rng.choice(series_ids) for _ in range(CALLS)]
+
+        return {
+            "get_series": await time_calls(lambda i: provider.get_series(picks[i])),
+            "get_series_info": await time_calls(
+                lambda i: provider.get_series_info(picks[i])
+            ),
+            "list_series": await time_calls(
+                lambda i: provider.list_series(category="CPI", limit=50)
+            ),
+        }
+
+
+async def main() -> None:
+    print(f"{'series':>8} {'get_series':>12} {'get_info':>12} {'list(cat)':>12}  (us/call)")
+    for n_series in CATALOG_SIZES:
+        result = await bench_size(n_series)
+        print(
+            f"{n_series:>8} {result['get_series']:>12.2f} "
+            f"{result['get_series_info']:>12.2f} {result['list_series']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
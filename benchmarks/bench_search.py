@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark catalog search latency at catalog scale.
+
+Run with ``python benchmarks/bench_search.py``. Queries against a 200k series
+catalog should stay under a millisecond when the top results stand out; queries
+whose matches all score alike fall back to scoring every match.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from bls_mcp.data.search import SeriesSearchIndex  # noqa: E402
+
+from synthetic import AREAS, CATEGORIES, ITEMS, synthetic_series_id  # noqa: E402
+
+CATALOG_SIZES = [1_000, 10_000, 200_000]
+QUERIES = ["food", "energy west", "consumer price index", "transp", "medical care south", "CUUR00001234"]
+REPEATS = 200
+
+
+def build_catalog(n_series: int) -> list[dict]:
+    """Build a catalog whose titles reuse a small vocabulary, as BLS titles do."""
+    return [
+        {
+            "series_id": synthetic_series_id(i),
+            "series_title": (
+                f"Consumer Price Index: {ITEMS[i % len(ITEMS)]} in {AREAS[(i // 7) % len(AREAS)]}"
+                f" variant {i % 997}"
+            ),
+            "survey_name": f"{CATEGORIES[i % len(CATEGORIES)]} Survey",
+            "area": AREAS[(i // 7) % len(AREAS)],
+            "item": ITEMS[i % len(ITEMS)],
+            "category": CATEGORIES[i % len(CATEGORIES)],
+        }
+        for i in range(n_series)
+    ]
+
+
+def main() -> None:
+    for n_series in CATALOG_SIZES:
+        catalog = build_catalog(n_series)
+        start = time.perf_counter()
+        index = SeriesSearchIndex(catalog)
+        build_s = time.perf_counter() - start
+
+        print(f"\n{n_series:,} series (index built in {build_s:.1f}s)")
+        for query in QUERIES:
+            start = time.perf_counter()
+            for _ in range(REPEATS):
+                index.search(query, limit=10)
+            per_query_us = (time.perf_counter() - start) / REPEATS * 1e6
+            print(f"  {query!r:>24}: {per_query_us:8.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""Benchmark the provider, tools, serialization and HTTP transport at scale.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 10,1000] [--suites provider,tools]
+        [--output FILE] [--baseline FILE] [--threshold 0.25]
+
+Each dataset is generated to the fixture schema with about the given number
+of observations (default: 10, 1k, 100k and 1M). Every benchmark reports the
+median, 95th percentile and minimum time per call in microseconds; results
+are written as JSON (default: ``benchmarks/results/<timestamp>.json``).
+With ``--baseline`` the run is compared against earlier results, and the
+script exits with status 1 if any benchmark regressed past the threshold.
+
+Suites:
+    provider       MockDataProvider calls
+    tools          each tool's ``execute`` over a MockDataProvider
+    serialization  encoding tool results as JSON text
+    transport      ``/mcp`` round trips through a Starlette test client,
+                   over the full server stack (cache included)
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+# Tools log every call at INFO; keep that out of the measurements
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from bls_mcp.data.mock_data import MockDataProvider  # noqa: E402
+from bls_mcp.tools.compare_series import CompareSeriesTool  # noqa: E402
+from bls_mcp.tools.compute_series_stats import ComputeSeriesStatsTool  # noqa: E402
+from bls_mcp.tools.forecast_series import ForecastSeriesTool  # noqa: E402
+from bls_mcp.tools.get_series import GetSeriesTool  # noqa: E402
+from bls_mcp.tools.get_series_batch import GetSeriesBatchTool  # noqa: E402
+from bls_mcp.tools.get_series_info import GetSeriesInfoTool  # noqa: E402
+from bls_mcp.tools.list_series import ListSeriesTool  # noqa: E402
+from bls_mcp.tools.search_series import SearchSeriesTool  # noqa: E402
+from bls_mcp.utils.serialization import backend, dumps  # noqa: E402
+
+from compare_results import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    compare,
+    load_results,
+    print_comparison,
+)
+from synthetic import write_scaled_fixtures  # noqa: E402
+
+SIZES = [10, 1_000, 100_000, 1_000_000]
+SUITES = ["provider", "tools", "serialization", "transport"]
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Each benchmark runs for at least this long, and at least MIN_ITERATIONS times
+MIN_TIME = 0.2
+MIN_ITERATIONS = 5
+MAX_ITERATIONS = 20_000
+
+END_YEAR = 2024
+BATCH_SIZE = 20
+
+Stats = Dict[str, float]
+Call = Callable[[], Union[Awaitable[Any], Any]]
+
+
+def _summarize(samples: List[float]) -> Stats:
+    samples.sort()
+    return {
+        "median_us": statistics.median(samples),
+        "p95_us": samples[int(0.95 * (len(samples) - 1))],
+        "min_us": samples[0],
+        "iterations": len(samples),
+    }
+
+
+async def measure(call: Call, min_time: float = MIN_TIME) -> Stats:
+    """
+    Time repeated calls, after one warm-up call.
+
+    Args:
+        call: Function returning an awaitable or a plain result
+        min_time: Seconds to keep calling for
+
+    Returns:
+        Per-call statistics in microseconds
+    """
+
+    async def once() -> None:
+        result = call()
+        if inspect.isawaitable(result):
+            await result
+
+    await once()
+    samples: List[float] = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < MAX_ITERATIONS and (
+        len(samples) < MIN_ITERATIONS or time.perf_counter() < deadline
+    ):
+        start = time.perf_counter()
+        await once()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return _summarize(samples)
+
+
+def measure_sync(call: Callable[[], Any], min_time: float = MIN_TIME) -> Stats:
+    """Time repeated calls of a synchronous function, like ``measure``."""
+    call()
+    samples: List[float] = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < MAX_ITERATIONS and (
+        len(samples) < MIN_ITERATIONS or time.perf_counter() < deadline
+    ):
+        start = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return _summarize(samples)
+
+
+async def bench_provider(
+    fixtures_dir: Path, series_ids: List[str]
+) -> Dict[str, Stats]:
+    """Benchmark MockDataProvider calls."""
+    provider = MockDataProvider(fixtures_dir, journal=False)
+    await provider.warm()
+    series_id = series_ids[len(series_ids) // 2]
+    return {
+        "get_series": await measure(lambda: provider.get_series(series_id)),
+        "get_series_last_year": await measure(
+            lambda: provider.get_series(series_id, END_YEAR, END_YEAR)
+        ),
+        "get_columns": await measure(lambda: provider.get_columns(series_id)),
+        "get_series_info": await measure(lambda: provider.get_series_info(series_id)),
+        "list_series": await measure(
+            lambda: provider.list_series(category="CPI", limit=50)
+        ),
+        "search_series": await measure(
+            lambda: provider.search_series("food west", limit=10)
+        ),
+    }
+
+
+def _tool_calls(provider: MockDataProvider, series_ids: List[str]) -> Dict[str, Any]:
+    """Return ``name: (tool, arguments)`` for every benchmarked tool call."""
+    series_id = series_ids[len(series_ids) // 2]
+    calls = {
+        "get_series": (GetSeriesTool(provider), {"series_id": series_id}),
+        "get_series_yoy": (
+            GetSeriesTool(provider),
+            {"series_id": series_id, "transform": "yoy"},
+        ),
+        "get_series_batch": (
+            GetSeriesBatchTool(provider),
+            {"series_ids": series_ids[:BATCH_SIZE]},
+        ),
+        "list_series": (ListSeriesTool(provider), {"category": "CPI", "limit": 50}),
+        "get_series_info": (GetSeriesInfoTool(provider), {"series_id": series_id}),
+        "search_series": (SearchSeriesTool(provider), {"query": "food west"}),
+        "compute_series_stats": (
+            ComputeSeriesStatsTool(provider),
+            {"series_id": series_id},
+        ),
+        # Fitted models are cached, so this measures the repeat-call path
+        "forecast_series": (
+            ForecastSeriesTool(provider, max_workers=1),
+            {"series_id": series_id, "horizon": 12},
+        ),
+    }
+    if len(series_ids) >= 2:
+        calls["compare_series"] = (
+            CompareSeriesTool(provider),
+            {"series_ids": series_ids[:3], "start_year": END_YEAR - 4},
+        )
+    return calls
+
+
+async def bench_tools(fixtures_dir: Path, series_ids: List[str]) -> Dict[str, Stats]:
+    """Benchmark each tool's ``execute``."""
+    provider = MockDataProvider(fixtures_dir, journal=False)
+    await provider.warm()
+    results = {}
+    for name, (tool, arguments) in _tool_calls(provider, series_ids).items():
+        try:
+            stats = await measure(lambda: tool.execute(arguments))
+            result = await tool.execute(arguments)
+            if "error" in result:
+                # Still timed, but marked so it is not mistaken for real work
+                stats["error"] = result["error"]
+            results[name] = stats
+        finally:
+            if isinstance(tool, ForecastSeriesTool) and tool._engine is not None:
+                tool._engine.shutdown()
+    return results
+
+
+async def bench_serialization(
+    fixtures_dir: Path, series_ids: List[str]
+) -> Dict[str, Stats]:
+    """Benchmark encoding tool results as JSON text."""
+    provider = MockDataProvider(fixtures_dir, journal=False)
+    await provider.warm()
+    series_id = series_ids[len(series_ids) // 2]
+    payloads = {
+        "get_series": await GetSeriesTool(provider).execute({"series_id": series_id}),
+        "get_series_batch": await GetSeriesBatchTool(provider).execute(
+            {"series_ids": series_ids[:BATCH_SIZE]}
+        ),
+        "list_series": await ListSeriesTool(provider).execute({"limit": 100}),
+    }
+    return {
+        name: measure_sync(lambda payload=payload: dumps(payload))
+        for name, payload in payloads.items()
+    }
+
+
+def bench_transport(fixtures_dir: Path, series_ids: List[str]) -> Dict[str, Stats]:
+    """Benchmark ``/mcp`` round trips through a Starlette test client."""
+    from starlette.testclient import TestClient
+
+    from bls_mcp.server import BLSMCPServer
+    from bls_mcp.transports.sse import SSETransport
+
+    os.environ["MOCK_DATA_DIR"] = str(fixtures_dir)
+    series_id = series_ids[len(series_ids) // 2]
+    requests = {
+        "initialize": {"method": "initialize", "params": {}},
+        "tools_list": {"method": "tools/list"},
+        "get_series": {
+            "method": "tools/call",
+            "params": {"name": "get_series", "arguments": {"series_id": series_id}},
+        },
+        "get_series_batch": {
+            "method": "tools/call",
+            "params": {
+                "name": "get_series_batch",
+                "arguments": {"series_ids": series_ids[:BATCH_SIZE]},
+            },
+        },
+        "list_series": {
+            "method": "tools/call",
+            "params": {"name": "list_series", "arguments": {"limit": 50}},
+        },
+    }
+    try:
+        with TestClient(SSETransport(BLSMCPServer()).app) as client:
+            return {
+                name: measure_sync(
+                    lambda body=body: client.post(
+                        "/mcp", json={"jsonrpc": "2.0", "id": 1, **body}
+                    ).raise_for_status()
+                )
+                for name, body in requests.items()
+            }
+    finally:
+        del os.environ["MOCK_DATA_DIR"]
+
+
+async def bench_dataset(observations: int, suites: List[str]) -> Dict[str, Any]:
+    """Generate a dataset and run the selected suites against it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        fixtures_dir = Path(tmp)
+        start = time.perf_counter()
+        series_ids = write_scaled_fixtures(
+            fixtures_dir, observations, end_year=END_YEAR
+        )
+        print(
+            f"  generated {len(series_ids)} series in "
+            f"{time.perf_counter() - start:.1f}s",
+            file=sys.stderr,
+        )
+
+        benchmarks: Dict[str, Stats] = {}
+        async_suites = {
+            "provider": bench_provider,
+            "tools": bench_tools,
+            "serialization": bench_serialization,
+        }
+        for suite in suites:
+            if suite == "transport":
+                results = bench_transport(fixtures_dir, series_ids)
+            else:
+                results = await async_suites[suite](fixtures_dir, series_ids)
+            for name, stats in results.items():
+                benchmarks[f"{suite}.{name}"] = stats
+            print(f"  {suite}: {len(results)} benchmarks", file=sys.stderr)
+
+    return {"series": len(series_ids), "benchmarks": benchmarks}
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma-separated dataset sizes in observations",
+    )
+    parser.add_argument(
+        "--suites",
+        default=",".join(SUITES),
+        help=f"comma-separated suites to run ({', '.join(SUITES)})",
+    )
+    parser.add_argument("--output", type=Path, help="results file to write")
+    parser.add_argument(
+        "--baseline", type=Path, help="earlier results to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown fraction that counts as a regression (default: 0.25)",
+    )
+    return parser.parse_args()
+
+
+async def main() -> int:
+    """Run the suite and write, and optionally compare, its results."""
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    suites = [suite.strip() for suite in args.suites.split(",")]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        print(f"Unknown suites: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    results: Dict[str, Any] = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": backend(),
+            "min_time": MIN_TIME,
+        },
+        "datasets": {},
+    }
+    for observations in sizes:
+        print(f"{observations} observations", file=sys.stderr)
+        results["datasets"][str(observations)] = await bench_dataset(
+            observations, suites
+        )
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIR / f"{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+
+    if args.baseline is None:
+        for observations, entry in results["datasets"].items():
+            for name, stats in entry["benchmarks"].items():
+                print(
+                    f"{observations:>12} {name:<36} {stats['median_us']:>11.1f} us "
+                    f"(p95 {stats['p95_us']:.1f})"
+                )
+        return 0
+
+    rows = compare(load_results(args.baseline), results, args.threshold)
+    print_comparison(rows)
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
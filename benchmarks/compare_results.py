@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Compare two benchmark suite results and flag regressions.
+
+Usage:
+    python benchmarks/compare_results.py BASELINE.json CURRENT.json [--threshold 0.25]
+
+A benchmark regresses when its median is more than ``threshold`` (a
+fraction) slower than in the baseline. Exits with status 1 if any did.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+DEFAULT_THRESHOLD = 0.25
+# Differences smaller than this are timer noise, whatever the ratio
+MIN_DELTA_US = 2.0
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read a results file written by ``bench_suite.py``."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_us: float = MIN_DELTA_US,
+) -> List[Dict[str, Any]]:
+    """
+    Compare the benchmarks two runs have in common.
+
+    Args:
+        baseline: Results to compare against
+        current: Results of the run being checked
+        threshold: Slowdown, as a fraction of the baseline median, that
+            counts as a regression
+        min_delta_us: Smallest slowdown in microseconds that counts
+
+    Returns:
+        One row per benchmark with the medians, their ratio and whether it
+        regressed, in the current run's order
+    """
+    rows = []
+    for dataset, entry in current["datasets"].items():
+        base_entry = baseline["datasets"].get(dataset)
+        if base_entry is None:
+            continue
+        for name, stats in entry["benchmarks"].items():
+            base_stats = base_entry["benchmarks"].get(name)
+            if base_stats is None:
+                continue
+            base, new = base_stats["median_us"], stats["median_us"]
+            ratio = new / base if base else float("inf")
+            rows.append({
+                "dataset": dataset,
+                "benchmark": name,
+                "baseline_us": base,
+                "current_us": new,
+                "ratio": ratio,
+                "regressed": ratio > 1 + threshold and new - base > min_delta_us,
+            })
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]]) -> None:
+    """Print a comparison table, marking regressions."""
+    print(
+        f"{'observations':>12} {'benchmark':<36} {'base us':>11} "
+        f"{'now us':>11} {'ratio':>7}"
+    )
+    for row in rows:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(
+            f"{row['dataset']:>12} {row['benchmark']:<36} "
+            f"{row['baseline_us']:>11.1f} {row['current_us']:>11.1f} "
+            f"{row['ratio']:>7.2f}{flag}"
+        )
+    regressions = sum(row["regressed"] for row in rows)
+    print(f"\n{len(rows)} benchmarks compared, {regressions} regressed")
+
+
+def main() -> None:
+    """Compare the result files given on the command line."""
+    parser = argparse.ArgumentParser(description="Compare benchmark suite results")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="slowdown fraction that counts as a regression (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    rows = compare(
+        load_results(args.baseline), load_results(args.current), args.threshold
+    )
+    print_comparison(rows)
+    sys.exit(1 if any(row["regressed"] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
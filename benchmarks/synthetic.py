@@ -0,0 +1,120 @@
+"""Synthetic fixture builder shared by the benchmark scripts."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+]
+CATEGORIES = ["CPI", "PPI", "CES", "LAU", "JOLTS"]
+ITEMS = ["All Items", "Food", "Energy", "Housing", "Transportation", "Medical Care"]
+AREAS = ["U.S. City Average", "Northeast", "Midwest", "South", "West"]
+
+
+def synthetic_series_id(index: int) -> str:
+    """Return a valid, unique BLS-style series ID for ``index``."""
+    return f"CUUR{index:08d}SA"
+
+
+def write_fixtures(
+    fixtures_dir: Path,
+    n_series: int,
+    years: int = 5,
+    start_year: int = 2020,
+    months: Optional[int] = None,
+) -> list[str]:
+    """
+    Write a catalog of ``n_series`` series and their monthly history.
+
+    Args:
+        fixtures_dir: Directory to write ``cpi_series.json`` and
+            ``historical_data.json`` into
+        n_series: Number of series in the catalog
+        years: Years of monthly history per series
+        start_year: First year of history
+        months: Keep only this many of the most recent months per series
+            (default: all ``years * 12``)
+
+    Returns:
+        The generated series IDs
+    """
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    series_ids = [synthetic_series_id(i) for i in range(n_series)]
+
+    catalog = {
+        "series": [
+            {
+                "series_id": series_id,
+                "series_title": f"Synthetic {ITEMS[i % len(ITEMS)]} in {AREAS[i % len(AREAS)]}",
+                "survey_name": f"{CATEGORIES[i % len(CATEGORIES)]} Survey",
+                "area": AREAS[i % len(AREAS)],
+                "item": ITEMS[i % len(ITEMS)],
+                "seasonality": "Seasonally Adjusted" if i % 2 else "Not Seasonally Adjusted",
+                "base_period": "1982-84=100",
+                "category": CATEGORIES[i % len(CATEGORIES)],
+            }
+            for i, series_id in enumerate(series_ids)
+        ]
+    }
+    with open(fixtures_dir / "cpi_series.json", "w") as f:
+        json.dump(catalog, f)
+
+    # Newest first, as in the BLS responses
+    periods = [
+        (year, month)
+        for year in range(start_year + years - 1, start_year - 1, -1)
+        for month in range(12, 0, -1)
+    ][:months]
+
+    with open(fixtures_dir / "historical_data.json", "w") as f:
+        f.write("{")
+        for i, series_id in enumerate(series_ids):
+            data = [
+                {
+                    "year": str(year),
+                    "period": f"M{month:02d}",
+                    "period_name": MONTHS[month - 1],
+                    "value": f"{100 + i % 50 + (year - start_year) * 12 + month:.3f}",
+                }
+                for year, month in periods
+            ]
+            if i:
+                f.write(",")
+            f.write(json.dumps(series_id))
+            f.write(":")
+            json.dump({"series_id": series_id, "data": data}, f)
+        f.write("}")
+
+    return series_ids
+
+
+def write_scaled_fixtures(
+    fixtures_dir: Path, observations: int, max_months: int = 240, end_year: int = 2024
+) -> list[str]:
+    """
+    Write fixtures holding about ``observations`` data points in total.
+
+    Small datasets are one series with a short history; larger ones add
+    series of ``max_months`` each, so both result sizes and the catalog grow.
+
+    Args:
+        fixtures_dir: Directory to write the fixtures into
+        observations: Total data points to generate
+        max_months: Longest history per series
+        end_year: Last year of history
+
+    Returns:
+        The generated series IDs
+    """
+    months = min(observations, max_months)
+    n_series = max(1, round(observations / months))
+    years = -(-months // 12)
+    return write_fixtures(
+        fixtures_dir,
+        n_series,
+        years=years,
+        start_year=end_year - years + 1,
+        months=months,
+    )
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Regenerate the precomputed tool listing served before the tools are built.
+
+Usage:
+    python scripts/build_tool_listing.py
+
+Writes ``src/bls_mcp/tools/tool_listing.json``. Run it after changing a
+tool's name, description or input model; the test suite fails while the
+file is out of date.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from bls_mcp.server import TOOL_LISTING_PATH, BLSMCPServer
+
+
+def main() -> None:
+    """Write the listing generated from the tools' input models."""
+    definitions = BLSMCPServer().dispatcher.definitions
+    with open(TOOL_LISTING_PATH, "w") as f:
+        json.dump({"tools": definitions}, f, indent=2)
+        f.write("\n")
+    print(f"✅ Wrote {len(definitions)} tool definitions to {TOOL_LISTING_PATH}")
+
+
+if __name__ == "__main__":
+    main()
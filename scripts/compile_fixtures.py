@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Compile JSON historical data fixtures into the binary columnar format.
+
+Usage:
+    python scripts/compile_fixtures.py [FIXTURES_DIR]
+
+Writes ``historical_data.bin`` next to ``historical_data.json``. The mock data
+provider memory-maps the binary file whenever it is present and up to date.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from bls_mcp.data.binary_store import BinarySeriesStore, compile_fixture_file
+
+
+def main() -> None:
+    """Compile the fixtures directory given on the command line."""
+    fixtures_dir = (
+        Path(sys.argv[1])
+        if len(sys.argv) > 1
+        else src_path / "bls_mcp" / "data" / "fixtures"
+    )
+    json_path = fixtures_dir / "historical_data.json"
+
+    start = time.perf_counter()
+    output_path = compile_fixture_file(json_path)
+    elapsed = time.perf_counter() - start
+
+    store = BinarySeriesStore(output_path)
+    print(f"✅ Compiled {json_path} -> {output_path}")
+    print(
+        f"   {store.n_series} series, {store.n_rows} observations, "
+        f"{output_path.stat().st_size:,} bytes in {elapsed:.2f}s"
+    )
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,12 +26,27 @@ logger = get_logger(__name__)
 # Configuration
 MCP_SERVER_PORT = int(os.getenv("MCP_SERVER_PORT", "3000"))
 MCP_SERVER_HOST = os.getenv("MCP_SERVER_HOST", "localhost")
+MCP_WORKERS = int(os.getenv("MCP_WORKERS", "1"))
 
 
-async def main():
+async def serve():
+    """Run the MCP server over SSE in this process until it is stopped."""
+    logger.info("🎯 Starting MCP server...")
+    server = BLSMCPServer()
+
+    # Start SSE server for remote access
+    logger.info("🌐 Starting SSE transport for remote access...")
+    from bls_mcp.transports.sse import SSETransport
+
+    sse_transport = SSETransport(server)
+    await sse_transport.run(host=MCP_SERVER_HOST, port=MCP_SERVER_PORT)
+
+
+def main():
     """Start MCP server with ngrok tunnel."""
     logger.info("🚀 Starting BLS MCP Server with ngrok tunnel")
-    
+    public_url = None
+
     try:
         # Clean up any existing tunnels first
         logger.info("🧹 Cleaning up existing ngrok tunnels...")
@@ -48,16 +63,15 @@ async def main():
         logger.info(f"🔗 Public URL: {public_url}")
         logger.info(f"📡 Local server: http://{MCP_SERVER_HOST}:{MCP_SERVER_PORT}")
         
-        # Start MCP server
-        logger.info("🎯 Starting MCP server...")
-        server = BLSMCPServer()
-        
-        # Start SSE server for remote access
-        logger.info("🌐 Starting SSE transport for remote access...")
-        from bls_mcp.transports.sse import SSETransport
-        
-        sse_transport = SSETransport(server)
-        await sse_transport.run(host=MCP_SERVER_HOST, port=MCP_SERVER_PORT)
+        if MCP_WORKERS > 1:
+            # uvicorn runs its own event loops in the worker processes, so
+            # this blocks outside asyncio until shutdown
+            logger.info(f"🎯 Starting MCP server with {MCP_WORKERS} workers...")
+            from bls_mcp.transports.sse import run_workers
+
+            run_workers(host=MCP_SERVER_HOST, port=MCP_SERVER_PORT, workers=MCP_WORKERS)
+        else:
+            asyncio.run(serve())
         
     except KeyboardInterrupt:
         logger.info("🛑 Shutting down server...")
@@ -75,4 +89,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
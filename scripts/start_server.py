@@ -1,6 +1,18 @@
 #!/usr/bin/env python3
-"""Start the BLS MCP server with stdio transport."""
+"""Start the BLS MCP server.
 
+Usage:
+    python scripts/start_server.py                      # stdio transport
+    python scripts/start_server.py --http [--workers N] [--host H] [--port P]
+
+With ``--http`` the server speaks MCP over HTTP/SSE. ``--workers`` (default:
+``MCP_WORKERS``, or 1) runs that many worker processes sharing one port and
+one memory-mapped dataset.
+"""
+
+import argparse
+import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -8,7 +20,34 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-from bls_mcp.server import main
+from bls_mcp.server import BLSMCPServer, load_config, main
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Start the BLS MCP server")
+    parser.add_argument("--http", action="store_true", help="serve over HTTP/SSE")
+    parser.add_argument("--host", default=os.getenv("MCP_SERVER_HOST", "localhost"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("MCP_SERVER_PORT", "3000")))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("MCP_WORKERS", "1")),
+        help="worker processes for --http",
+    )
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    main()
+    load_config()
+    args = parse_args()
+    if not args.http:
+        main()
+    elif args.workers > 1:
+        from bls_mcp.transports.sse import run_workers
+
+        run_workers(host=args.host, port=args.port, workers=args.workers)
+    else:
+        from bls_mcp.transports.sse import SSETransport
+
+        asyncio.run(SSETransport(BLSMCPServer()).run(host=args.host, port=args.port))
@@ -1,7 +1,16 @@
 """BLS MCP Server - Model Context Protocol server for BLS data."""
 
-__version__ = "0.1.0"
+from typing import Any
 
-from .server import BLSMCPServer
+__version__ = "0.1.0"
 
 __all__ = ["BLSMCPServer"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the server, and with it the MCP SDK, only when it is asked for
+    if name == "BLSMCPServer":
+        from .server import BLSMCPServer
+
+        return BLSMCPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
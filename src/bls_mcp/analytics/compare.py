@@ -0,0 +1,161 @@
+"""Aligned multi-series comparison."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..data.series_store import SeriesColumns
+from .stats import SeriesArrays, pct_change, to_list
+
+# Values the comparison matrix can hold
+BASES = ("level", "yoy", "mom")
+
+
+def align(
+    series: Sequence[SeriesArrays], basis: Sequence[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Place several series on one time axis.
+
+    Args:
+        series: Series sharing one frequency
+        basis: One value array per series, aligned with its ``time``
+
+    Returns:
+        ``(time, matrix)``: the union of the series' times and a
+        ``(len(time), len(series))`` matrix with NaN where a series has no
+        observation
+    """
+    time = np.unique(np.concatenate([arrays.time for arrays in series]))
+    matrix = np.full((len(time), len(series)), np.nan)
+    for column, (arrays, values) in enumerate(zip(series, basis)):
+        matrix[np.searchsorted(time, arrays.time), column] = values
+    return time, matrix
+
+
+def _label(time: int, periods_per_year: int, prefix: str) -> str:
+    year, number = divmod(int(time), periods_per_year)
+    return f"{year}-{prefix}{number + 1:02d}"
+
+
+def compare_series(
+    columns: Sequence[SeriesColumns],
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    basis: str = "level",
+    weights: Optional[Sequence[float]] = None,
+) -> Dict[str, Any]:
+    """
+    Compare series over a common period.
+
+    The matrix holds ``basis`` values (levels, or year-over-year or
+    month-over-month percent changes) with one row per period and one
+    column per series. Correlations are of period-over-period changes,
+    over the periods where every series has one. Spreads are each
+    series' basis value minus the first series'. Contributions weight
+    each series' change over the range (first to last period where every
+    series has a value); without weights, each series counts equally.
+
+    Args:
+        columns: Columns of each series, in output order
+        start_year: Inclusive start year, or None for the full history
+        end_year: Inclusive end year, or None for the full history
+        basis: One of ``BASES``
+        weights: Optional weight per series, such as CPI relative importance
+
+    Returns:
+        Dictionary with the aligned matrix and comparison statistics
+
+    Raises:
+        ValueError: If the basis or weights are invalid, the series mix
+            frequencies, or there are no observations in range
+    """
+    if basis not in BASES:
+        raise ValueError(f"Unknown basis: {basis}")
+    if weights is not None and len(weights) != len(columns):
+        raise ValueError("weights must have one entry per series")
+
+    # Look back a year so changes are defined at the start of the range
+    series = [
+        SeriesArrays(c, start_year - 1 if start_year else None, end_year) for c in columns
+    ]
+    frequencies = {arrays.periods_per_year for arrays in series if len(arrays)}
+    if len(frequencies) > 1:
+        raise ValueError("Series have different frequencies and cannot be aligned")
+    if not frequencies:
+        raise ValueError("No observations in the requested range")
+    ppy = frequencies.pop()
+    prefix = next(arrays.prefix for arrays in series if len(arrays))
+
+    changes = [pct_change(arrays, 1) for arrays in series]
+    if basis == "level":
+        values = [arrays.values for arrays in series]
+    elif basis == "yoy":
+        values = [pct_change(arrays, ppy) for arrays in series]
+    else:
+        values = changes
+
+    time, matrix = align(series, values)
+    _, levels = align(series, [arrays.values for arrays in series])
+    _, change_matrix = align(series, changes)
+
+    # Restrict to the requested range
+    first = int(np.searchsorted(time, start_year * ppy)) if start_year else 0
+    time, matrix = time[first:], matrix[first:]
+    levels, change_matrix = levels[first:], change_matrix[first:]
+    if len(time) == 0:
+        raise ValueError("No observations in the requested range")
+
+    complete = np.isfinite(change_matrix).all(axis=1)
+    if complete.sum() > 2:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = np.corrcoef(change_matrix[complete], rowvar=False)
+        correlation = np.atleast_2d(correlation)
+    else:
+        correlation = np.full((len(series), len(series)), np.nan)
+
+    spreads = matrix - matrix[:, :1]
+    finite_spreads = np.where(np.isfinite(spreads), spreads, 0.0)
+    counts = np.isfinite(spreads).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_spread = np.where(counts > 0, finite_spreads.sum(axis=0) / counts, np.nan)
+
+    common = np.flatnonzero(np.isfinite(levels).all(axis=1))
+    if len(common) > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (levels[common[-1]] / levels[common[0]] - 1.0) * 100.0
+        span: List[Optional[str]] = [
+            _label(time[common[0]], ppy, prefix),
+            _label(time[common[-1]], ppy, prefix),
+        ]
+    else:
+        change = np.full(len(series), np.nan)
+        span = [None, None]
+    w = (
+        np.asarray(weights, dtype=np.float64)
+        if weights is not None
+        else np.full(len(series), 1.0 / len(series))
+    )
+    points = w * change
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = points / points.sum()
+
+    return {
+        "series_ids": [c.series_id for c in columns],
+        "basis": basis,
+        "periods": [_label(t, ppy, prefix) for t in time],
+        "matrix": [to_list(row) for row in matrix],
+        "correlation": [to_list(row) for row in correlation],
+        "spreads": {
+            "baseline": columns[0].series_id,
+            "latest": to_list(spreads[-1]),
+            "mean": to_list(mean_spread),
+        },
+        "contributions": {
+            "span": span,
+            "change_pct": to_list(change),
+            "weights": to_list(w),
+            "pct_points": to_list(points),
+            "share": to_list(share),
+        },
+    }
@@ -0,0 +1,429 @@
+"""Simple forecasting models and a process-pool engine to run them."""
+
+import asyncio
+import hashlib
+import math
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from statistics import NormalDist
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from ..data.coalesce import SingleFlight
+from ..utils.logger import get_logger
+from .stats import SeriesArrays, to_list
+
+logger = get_logger(__name__)
+
+MODELS = ("seasonal_naive", "ets", "ar")
+
+# Smoothing parameter grids searched by the ETS fit
+_ALPHAS = np.linspace(0.05, 0.95, 10)
+_BETAS = np.array([0.0, 0.01, 0.05, 0.1, 0.2, 0.4])
+_GAMMAS = np.array([0.0, 0.05, 0.1, 0.2, 0.4, 0.6])
+
+Fitted = Dict[str, Any]
+
+
+def regularize(time: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Put observations on a gap-free time grid.
+
+    Missing periods and missing values are filled by linear interpolation
+    between their neighbours.
+
+    Args:
+        time: Ascending period counts, as in ``SeriesArrays.time``
+        values: Observed values
+
+    Returns:
+        Values for every period from ``time[0]`` to ``time[-1]``
+    """
+    known = np.isfinite(values)
+    if not known.any():
+        raise ValueError("Series has no numeric observations")
+    grid = np.arange(time[known][0], time[known][-1] + 1)
+    return np.interp(grid, time[known], values[known])
+
+
+def _fit_seasonal_naive(y: np.ndarray, season: int) -> Fitted:
+    m = season if len(y) > season else 1
+    errors = y[m:] - y[:-m]
+    sigma = float(np.sqrt(np.mean(errors**2))) if len(errors) else 0.0
+    return {"params": {"season": m}, "state": {"last": y[-m:].tolist()}, "sigma": sigma}
+
+
+def _fit_ets(y: np.ndarray, season: int) -> Fitted:
+    """Additive Holt-Winters, choosing smoothing parameters by grid search."""
+    n = len(y)
+    m = season if season > 1 and n >= 2 * season else 1
+    if n < 3:
+        raise ValueError("ETS needs at least 3 observations")
+
+    # Every parameter combination runs in one pass over the series
+    alpha, beta, gamma = (g.ravel() for g in np.meshgrid(_ALPHAS, _BETAS, _GAMMAS))
+    if m == 1:
+        level0, trend0 = y[0], y[1] - y[0]
+        seasonal0 = np.zeros(1)
+        gamma = np.zeros_like(gamma)
+    else:
+        level0 = y[:m].mean()
+        trend0 = (y[m : 2 * m].mean() - level0) / m
+        seasonal0 = y[:m] - level0
+
+    size = len(alpha)
+    level = np.full(size, level0)
+    trend = np.full(size, trend0)
+    seasonal = np.tile(seasonal0, (size, 1))
+    sse = np.zeros(size)
+    for t in range(n):
+        s = seasonal[:, t % m]
+        error = y[t] - (level + trend + s)
+        sse += error**2
+        new_level = alpha * (y[t] - s) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        seasonal[:, t % m] = gamma * (y[t] - new_level) + (1 - gamma) * s
+        level = new_level
+
+    best = int(np.argmin(sse))
+    dof = max(n - 3 - (m - 1), 1)
+    # Order seasonal states so index 0 is the first forecast period
+    order = (np.arange(m) + n) % m
+    return {
+        "params": {
+            "alpha": float(alpha[best]),
+            "beta": float(beta[best]),
+            "gamma": float(gamma[best]),
+            "season": m,
+        },
+        "state": {
+            "level": float(level[best]),
+            "trend": float(trend[best]),
+            "seasonal": seasonal[best, order].tolist(),
+        },
+        "sigma": float(np.sqrt(sse[best] / dof)),
+    }
+
+
+def _ar_design(d: np.ndarray, p: int, start: int) -> Tuple[np.ndarray, np.ndarray]:
+    rows = len(d) - start
+    lags = [d[start - k : len(d) - k] for k in range(1, p + 1)]
+    return np.column_stack([np.ones(rows), *lags]), d[start:]
+
+
+def _fit_ar(y: np.ndarray, season: int) -> Fitted:
+    """AR(p) on first differences, with p chosen by AIC."""
+    d = np.diff(y)
+    max_p = max(1, min(season + 1, len(d) // 5))
+    if len(d) < max_p + 3:
+        raise ValueError("AR needs more observations")
+
+    # Compare orders on the same sample
+    best_p, best_aic = 1, math.inf
+    for p in range(1, max_p + 1):
+        x, target = _ar_design(d, p, max_p)
+        coef, *_ = np.linalg.lstsq(x, target, rcond=None)
+        sse = float(((target - x @ coef) ** 2).sum())
+        aic = len(target) * math.log(max(sse, 1e-12) / len(target)) + 2 * (p + 1)
+        if aic < best_aic:
+            best_p, best_aic = p, aic
+
+    x, target = _ar_design(d, best_p, best_p)
+    coef, *_ = np.linalg.lstsq(x, target, rcond=None)
+    residuals = target - x @ coef
+    sigma = float(np.sqrt((residuals**2).sum() / max(len(target) - best_p - 1, 1)))
+    return {
+        "params": {
+            "p": best_p,
+            "intercept": float(coef[0]),
+            "phi": coef[1:].tolist(),
+        },
+        # Most recent difference first
+        "state": {"last": float(y[-1]), "recent": d[::-1][:best_p].tolist()},
+        "sigma": sigma,
+    }
+
+
+_FITTERS = {"seasonal_naive": _fit_seasonal_naive, "ets": _fit_ets, "ar": _fit_ar}
+
+
+def fit_model(model: str, values: np.ndarray, season: int) -> Fitted:
+    """
+    Fit a model to a gap-free series.
+
+    Runs in a worker process; arguments and result are plain picklable data.
+
+    Args:
+        model: One of ``MODELS``
+        values: Regularized observations, oldest first
+        season: Periods per year
+
+    Returns:
+        Fitted parameters, final state and residual standard deviation
+
+    Raises:
+        ValueError: If the model is unknown or the series is too short
+    """
+    if model not in _FITTERS:
+        raise ValueError(f"Unknown model: {model}")
+    fitted = _FITTERS[model](np.asarray(values, dtype=np.float64), season)
+    fitted["model"] = model
+    return fitted
+
+
+def _fit_observations(
+    model: str, time: np.ndarray, values: np.ndarray, season: int
+) -> Fitted:
+    """Regularize observations and fit a model to them, in a worker process."""
+    return fit_model(model, regularize(time, values), season)
+
+
+def _known_span(time: np.ndarray, values: np.ndarray) -> Tuple[int, int]:
+    """
+    Return the first and last periods with a numeric value.
+
+    Scans in from both ends, so it is constant time unless the series
+    starts or ends with missing values.
+    """
+    first = 0
+    while first < len(values) and not math.isfinite(values[first]):
+        first += 1
+    if first == len(values):
+        raise ValueError("Series has no numeric observations")
+    last = len(values) - 1
+    while not math.isfinite(values[last]):
+        last -= 1
+    return int(time[first]), int(time[last])
+
+
+def predict(fitted: Fitted, horizon: int, level: float = 95.0) -> Dict[str, np.ndarray]:
+    """
+    Forecast from a fitted model.
+
+    Intervals assume normal errors; for ETS they use the usual
+    approximation for additive Holt-Winters.
+
+    Args:
+        fitted: Result of ``fit_model``
+        horizon: Number of periods ahead
+        level: Interval coverage in percent
+
+    Returns:
+        ``mean``, ``lower`` and ``upper`` arrays of length ``horizon``
+    """
+    model, params, state = fitted["model"], fitted["params"], fitted["state"]
+    h = np.arange(1, horizon + 1)
+
+    if model == "seasonal_naive":
+        last = np.asarray(state["last"])
+        m = len(last)
+        mean = last[(h - 1) % m]
+        scale = np.sqrt((h - 1) // m + 1)
+    elif model == "ets":
+        seasonal = np.asarray(state["seasonal"])
+        m = len(seasonal)
+        mean = state["level"] + h * state["trend"] + seasonal[(h - 1) % m]
+        j = np.arange(1, horizon)
+        c = params["alpha"] * (1 + j * params["beta"]) + params["gamma"] * (j % m == 0)
+        scale = np.sqrt(1 + np.concatenate([[0.0], np.cumsum(c**2)]))
+    else:
+        phi = np.asarray(params["phi"])
+        recent = list(state["recent"])
+        steps = []
+        for _ in range(horizon):
+            step = params["intercept"] + float(np.dot(phi, recent[: len(phi)]))
+            steps.append(step)
+            recent.insert(0, step)
+        mean = state["last"] + np.cumsum(steps)
+        # Psi weights of the differences, accumulated for the levels
+        psi = np.zeros(horizon)
+        psi[0] = 1.0
+        for k in range(1, horizon):
+            psi[k] = sum(phi[i] * psi[k - 1 - i] for i in range(min(k, len(phi))))
+        scale = np.sqrt(np.cumsum(np.cumsum(psi) ** 2))
+
+    z = NormalDist().inv_cdf(0.5 + level / 200.0)
+    width = z * fitted["sigma"] * scale
+    return {"mean": mean, "lower": mean - width, "upper": mean + width}
+
+
+def _rounded(value: Any) -> Any:
+    """Round floats, and lists of floats, for output."""
+    if isinstance(value, float):
+        return round(value, 4)
+    if isinstance(value, list):
+        return [_rounded(v) for v in value]
+    return value
+
+
+class ForecastEngine:
+    """
+    Fits forecasting models in a bounded process pool.
+
+    Fitting is CPU-bound, so it runs outside the event loop, at most
+    ``max_workers`` fits at a time; further requests wait for a slot.
+    Fitted models are cached per (series, model, season, last period,
+    number of periods and a digest of the observed values), so a repeat
+    forecast only evaluates the cached model, while a new or revised
+    observation refits it. Concurrent requests for the same fit share one.
+    A pool left broken by a crashed worker is replaced.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, cache_size: int = 256) -> None:
+        """
+        Initialize the engine; worker processes start on first use.
+
+        Args:
+            max_workers: Worker processes (default: ``FORECAST_MAX_WORKERS``,
+                or up to 4 by CPU count)
+            cache_size: Fitted models kept
+        """
+        if max_workers is None:
+            max_workers = int(
+                os.getenv("FORECAST_MAX_WORKERS", str(min(4, os.cpu_count() or 1)))
+            )
+        self.max_workers = max(1, max_workers)
+        self.cache_size = cache_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._fitted: "OrderedDict[Hashable, Fitted]" = OrderedDict()
+        self._flight = SingleFlight()
+        self.fits = 0
+        self.cache_hits = 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned workers do not inherit the server's threads or sockets
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Shut down a broken pool, unless another fit already replaced it."""
+        if self._executor is pool:
+            self._executor = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def fit(
+        self,
+        key: Hashable,
+        model: str,
+        time: np.ndarray,
+        values: np.ndarray,
+        season: int,
+    ) -> Tuple[Fitted, bool]:
+        """
+        Return the fitted model for ``key``, fitting it in the pool if needed.
+
+        The observations are regularized in the worker, not on the event loop.
+
+        Returns:
+            ``(fitted, cached)``
+        """
+        fitted = self._fitted.get(key)
+        if fitted is not None:
+            self._fitted.move_to_end(key)
+            self.cache_hits += 1
+            return fitted, True
+
+        async def run() -> Fitted:
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.max_workers)
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                pool = self._pool()
+                try:
+                    result = await loop.run_in_executor(
+                        pool, _fit_observations, model, time, values, season
+                    )
+                except BrokenProcessPool:
+                    # A worker died (OOM, segfault); retry once on a new pool
+                    logger.warning("Forecast worker pool broke; starting a new one")
+                    self._discard_pool(pool)
+                    result = await loop.run_in_executor(
+                        self._pool(), _fit_observations, model, time, values, season
+                    )
+            self.fits += 1
+            self._fitted[key] = result
+            while len(self._fitted) > self.cache_size:
+                self._fitted.popitem(last=False)
+            return result
+
+        # Fitted models are only read, and cache hits share them already
+        return await self._flight.do(key, run, lambda fitted: fitted), False
+
+    async def forecast(
+        self,
+        arrays: SeriesArrays,
+        model: str,
+        horizon: int,
+        level: float = 95.0,
+    ) -> Dict[str, Any]:
+        """
+        Forecast a series.
+
+        Args:
+            arrays: Training observations
+            model: One of ``MODELS``
+            horizon: Number of periods ahead
+            level: Interval coverage in percent
+
+        Returns:
+            Forecast periods, mean and interval bounds, with model details
+
+        Raises:
+            ValueError: If the model is unknown or the series is too short
+        """
+        if model not in MODELS:
+            raise ValueError(f"Unknown model: {model}")
+        if len(arrays) == 0:
+            raise ValueError("No observations to fit")
+
+        first_time, last_time = _known_span(arrays.time, arrays.values)
+        ppy = arrays.periods_per_year
+        # Hashed in C straight from the buffer, so a revision anywhere in
+        # the history refits without a Python-level pass over the values
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(arrays.values), digest_size=16
+        ).digest()
+        key = (
+            arrays.columns.series_id,
+            last_time,
+            last_time - first_time + 1,
+            model,
+            ppy,
+            digest,
+        )
+        fitted, cached = await self.fit(key, model, arrays.time, arrays.values, ppy)
+        bounds = predict(fitted, horizon, level)
+
+        periods: List[str] = []
+        for t in range(last_time + 1, last_time + horizon + 1):
+            year, number = divmod(t, ppy)
+            periods.append(f"{year}-{arrays.prefix}{number + 1:02d}")
+
+        return {
+            "model": model,
+            "params": {k: _rounded(v) for k, v in fitted["params"].items()},
+            "sigma": round(fitted["sigma"], 4),
+            "level": level,
+            "cached": cached,
+            "forecast": {
+                "period": periods,
+                "mean": to_list(bounds["mean"]),
+                "lower": to_list(bounds["lower"]),
+                "upper": to_list(bounds["upper"]),
+            },
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
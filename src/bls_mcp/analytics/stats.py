@@ -0,0 +1,239 @@
+"""Vectorized statistics over BLS series observations."""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..data.series_store import PERIODS_PER_YEAR, SeriesColumns
+
+FREQUENCY_NAMES = {"M": "monthly", "Q": "quarterly", "S": "semiannual", "A": "annual"}
+
+# Decimal places kept in results
+PRECISION = 4
+
+
+class SeriesArrays:
+    """
+    The regular observations of one series as NumPy arrays.
+
+    Period averages such as M13 (annual average) are dropped. ``time`` counts
+    periods since year 0 (``year * periods_per_year + period - 1``), so a lag
+    of ``k`` periods is a difference of ``k`` regardless of gaps in the data.
+    ``rows`` maps each observation back to its row in the source columns.
+    """
+
+    __slots__ = ("columns", "prefix", "periods_per_year", "time", "values", "rows")
+
+    def __init__(
+        self,
+        columns: SeriesColumns,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> None:
+        """
+        View a year range of stored columns as arrays, without copying values.
+
+        Args:
+            columns: Time-sorted series columns
+            start_year: Inclusive start year, or None for no lower bound
+            end_year: Inclusive end year, or None for no upper bound
+        """
+        lo, hi = columns.year_slice(start_year, end_year)
+        self.columns = columns
+        self.prefix = columns.periods[hi - 1][0] if hi > lo else "M"
+        self.periods_per_year = PERIODS_PER_YEAR.get(self.prefix, 1)
+
+        ordinals = np.frombuffer(columns.ordinals, dtype=np.intc)[lo:hi]
+        values = np.frombuffer(columns.values, dtype=np.float64)[lo:hi]
+        number = ordinals % 100
+        regular = (number >= 1) & (number <= self.periods_per_year)
+
+        self.rows = np.flatnonzero(regular) + lo
+        self.time = (ordinals[regular] // 100) * self.periods_per_year + number[regular] - 1
+        self.values = values[regular]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def frequency(self) -> str:
+        """Name of the series frequency, e.g. 'monthly'."""
+        return FREQUENCY_NAMES.get(self.prefix, "annual")
+
+    def label(self, i: int) -> str:
+        """Return a 'YYYY-Pnn' label for observation ``i``."""
+        row = int(self.rows[i])
+        return f"{self.columns.years[row]}-{self.columns.periods[row]}"
+
+    def lagged(self, lag: int) -> np.ndarray:
+        """
+        Return each observation's value ``lag`` periods earlier.
+
+        Observations are matched on time, so gaps in the data give NaN rather
+        than a comparison with the wrong period.
+        """
+        n = len(self.time)
+        if n == 0:
+            return np.empty(0)
+        target = self.time - lag
+        index = np.searchsorted(self.time, target)
+        clipped = np.minimum(index, n - 1)
+        found = (index < n) & (self.time[clipped] == target)
+        return np.where(found, self.values[clipped], np.nan)
+
+
+def pct_change(arrays: SeriesArrays, lag: int) -> np.ndarray:
+    """Percent change of each observation against ``lag`` periods earlier."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (arrays.values / arrays.lagged(lag) - 1.0) * 100.0
+
+
+def annualize(pct: np.ndarray, lag: int, periods_per_year: int) -> np.ndarray:
+    """Compound a percent change over ``lag`` periods to an annual rate."""
+    with np.errstate(invalid="ignore"):
+        return ((1.0 + pct / 100.0) ** (periods_per_year / lag) - 1.0) * 100.0
+
+
+def rolling(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean and sample standard deviation over ``window`` observations.
+
+    Returns:
+        Array of shape ``(2, len(values))``; the first ``window - 1`` entries
+        of each row are NaN
+    """
+    out = np.full((2, len(values)), np.nan)
+    if window < 1 or len(values) < window:
+        return out
+    windows = sliding_window_view(values, window)
+    out[0, window - 1 :] = windows.mean(axis=1)
+    if window > 1:
+        out[1, window - 1 :] = windows.std(axis=1, ddof=1)
+    return out
+
+
+def to_list(values: np.ndarray) -> List[Optional[float]]:
+    """Round an array for output, with NaN as None."""
+    rounded = np.round(values, PRECISION)
+    return [None if v != v else v for v in rounded.tolist()]
+
+
+def _number(value: Any) -> Optional[float]:
+    """Round a scalar for output, with NaN as None."""
+    value = float(value)
+    return None if value != value else round(value, PRECISION)
+
+
+def _point(arrays: SeriesArrays, i: int) -> Dict[str, Any]:
+    return {"period": arrays.label(i), "value": _number(arrays.values[i])}
+
+
+def _summary(values: np.ndarray) -> Optional[Dict[str, Optional[float]]]:
+    """Mean, min and max of the finite entries, or None if there are none."""
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return None
+    return {
+        "mean": _number(finite.mean()),
+        "min": _number(finite.min()),
+        "max": _number(finite.max()),
+    }
+
+
+def compute_series_stats(
+    columns: SeriesColumns,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    window: int = 12,
+    include_series: bool = False,
+) -> Dict[str, Any]:
+    """
+    Summarize a series over a year range.
+
+    Changes are computed against observations before ``start_year`` where
+    they exist, so the first year of the range has year-over-year rates.
+
+    Args:
+        columns: Time-sorted series columns
+        start_year: Inclusive start year, or None for the full history
+        end_year: Inclusive end year, or None for the full history
+        window: Rolling window length, in observations
+        include_series: Also return every transformed value, column by column
+
+    Returns:
+        Dictionary of statistics
+
+    Raises:
+        ValueError: If the range holds no observations
+    """
+    # Look back a year so lagged changes are defined at the start of the range
+    arrays = SeriesArrays(
+        columns, start_year - 1 if start_year else None, end_year
+    )
+    ppy = arrays.periods_per_year
+
+    change = pct_change(arrays, 1)
+    yoy = pct_change(arrays, ppy)
+    annualized = annualize(change, 1, ppy)
+    roll = rolling(arrays.values, window)
+
+    # Restrict everything to the requested range
+    first = 0
+    if start_year:
+        first = int(np.searchsorted(arrays.time, start_year * ppy))
+    values = arrays.values[first:]
+    if len(values) == 0:
+        raise ValueError(f"No observations for '{columns.series_id}' in the requested range")
+    change, yoy, annualized, roll = change[first:], yoy[first:], annualized[first:], roll[:, first:]
+    last = len(arrays) - 1
+
+    finite = np.isfinite(values)
+    result: Dict[str, Any] = {
+        "series_id": columns.series_id,
+        "frequency": arrays.frequency,
+        "observations": len(values),
+        "start": _point(arrays, first),
+        "end": _point(arrays, last),
+        "latest": {
+            **_point(arrays, last),
+            "change_pct": _number(change[-1]),
+            "annualized_pct": _number(annualized[-1]),
+            "yoy_pct": _number(yoy[-1]),
+        },
+    }
+
+    if finite.any():
+        result["min"] = _point(arrays, first + int(np.nanargmin(values)))
+        result["max"] = _point(arrays, first + int(np.nanargmax(values)))
+        result["mean"] = _number(values[finite].mean())
+        result["std"] = _number(values[finite].std(ddof=1)) if finite.sum() > 1 else None
+
+    years = (arrays.time[last] - arrays.time[first]) / ppy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = values[-1] / values[0]
+        result["total_change_pct"] = _number((ratio - 1.0) * 100.0)
+        result["cagr_pct"] = (
+            _number((ratio ** (1.0 / years) - 1.0) * 100.0) if years > 0 else None
+        )
+
+    result["change_pct"] = _summary(change)
+    result["yoy_pct"] = _summary(yoy)
+    result["rolling"] = {
+        "window": window,
+        "mean": _number(roll[0, -1]),
+        "std": _number(roll[1, -1]),
+    }
+
+    if include_series:
+        result["series"] = {
+            "period": [arrays.label(i) for i in range(first, last + 1)],
+            "value": to_list(values),
+            "change_pct": to_list(change),
+            "annualized_pct": to_list(annualized),
+            "yoy_pct": to_list(yoy),
+            "rolling_mean": to_list(roll[0]),
+            "rolling_std": to_list(roll[1]),
+        }
+
+    return result
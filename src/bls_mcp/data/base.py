@@ -0,0 +1,265 @@
+"""Base data provider interface for BLS MCP server."""
+
+import copy
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..utils.logger import get_logger
+from ..utils.pagination import cursor_scope, decode_cursor, encode_cursor
+from .series_store import SeriesColumns
+
+logger = get_logger(__name__)
+
+# Catalog fields list_series filters on besides ``category``
+SERIES_FILTERS = ("survey_name", "area", "item", "seasonality")
+
+
+class DataProvider(ABC):
+    """Async interface shared by every BLS data source."""
+
+    # Whether get_series without a start year returns the complete history
+    full_history: bool = True
+
+    # Whether get_columns returns stored columns rather than rebuilding them
+    columnar: bool = False
+
+    # Whether apply_updates merges data; otherwise updates are ignored
+    accepts_updates: bool = False
+
+    @abstractmethod
+    async def get_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get data for a specific series.
+
+        Args:
+            series_id: BLS series ID (e.g., 'CUUR0000SA0')
+            start_year: Optional start year filter
+            end_year: Optional end year filter
+
+        Returns:
+            Dictionary with ``series_id``, ``data``, ``metadata`` and ``count``
+
+        Raises:
+            ValueError: If series not found
+        """
+        pass
+
+    async def iter_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a series in chunks for streaming responses.
+
+        The first chunk is a header with ``series_id``, ``metadata`` and
+        ``count``; each following chunk is ``{"data": [...]}`` with at most
+        ``page_size`` points. This default fetches the whole series with
+        ``get_series``; providers with paged storage override it.
+
+        Raises:
+            ValueError: If series not found
+        """
+        result = await self.get_series(series_id, start_year, end_year)
+        async for chunk in paginate_result(result, page_size):
+            yield chunk
+
+    async def get_columns(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> SeriesColumns:
+        """
+        Get a series as time-sorted columns for numeric work.
+
+        The columns cover at least the requested years and may hold more;
+        callers narrow them with ``SeriesColumns.year_slice``. This default
+        builds them from ``get_series``; providers with columnar storage
+        (``columnar = True``) return their stored columns directly.
+
+        Raises:
+            ValueError: If series not found
+        """
+        result = await self.get_series(series_id, start_year, end_year)
+        return SeriesColumns.from_points(series_id, result["data"])
+
+    @abstractmethod
+    async def list_series(
+        self, category: Optional[str] = None, limit: int = 50, **filters: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        List available series with optional filtering.
+
+        Filters are case-insensitive exact matches and are combined with AND;
+        filters set to None are ignored.
+
+        Args:
+            category: Optional category filter (e.g., 'CPI')
+            limit: Maximum number of results
+            **filters: Other catalog field filters: ``survey_name``, ``area``,
+                ``item`` and ``seasonality`` (see ``SERIES_FILTERS``)
+
+        Returns:
+            List of series metadata dictionaries
+        """
+        pass
+
+    async def list_series_page(
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        **filters: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        List one page of series, continuing from a cursor.
+
+        The default asks ``list_series`` for every series up to the end of
+        the page; providers with a catalog index read only the page.
+
+        Args:
+            category: Optional category filter (e.g., 'CPI')
+            limit: Page size
+            cursor: ``next_cursor`` of the previous page, or None for the first
+            **filters: Other catalog field filters, as for ``list_series``
+
+        Returns:
+            Dictionary with ``series``, ``next_cursor`` (None on the last
+            page) and ``total`` (None if unknown)
+
+        Raises:
+            ValueError: If the cursor is invalid or from another query
+        """
+        _check_filters(filters)
+        scope = cursor_scope("list_series", category=category, **filters)
+        offset = decode_cursor(cursor, scope) if cursor else 0
+        series = await self.list_series(
+            category=category, limit=offset + limit + 1, **filters
+        )
+        more = len(series) > offset + limit
+        return {
+            "series": series[offset : offset + limit],
+            "next_cursor": encode_cursor(offset + limit, scope) if more else None,
+            "total": None,
+        }
+
+    @abstractmethod
+    async def get_series_info(self, series_id: str) -> Dict[str, Any]:
+        """
+        Get metadata information about a specific series.
+
+        Args:
+            series_id: BLS series ID
+
+        Returns:
+            Dictionary with series metadata
+
+        Raises:
+            ValueError: If series not found
+        """
+        pass
+
+    @abstractmethod
+    async def search_series(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search for series by title or description.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results
+
+        Returns:
+            List of matching series
+        """
+        pass
+
+    async def warm(self) -> None:
+        """Load data and build indexes ahead of the first request."""
+
+    async def apply_updates(self, updates: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """
+        Merge new and revised observations into the provider's data.
+
+        Providers whose data cannot be updated (``accepts_updates = False``)
+        ignore the updates and report no changes.
+
+        Args:
+            updates: Series ID to BLS data points
+
+        Returns:
+            Series ID to the first changed row, for each series that changed
+        """
+        if updates:
+            logger.warning(
+                "%s does not accept data updates; ignored %s series",
+                type(self).__name__,
+                len(updates),
+            )
+        return {}
+
+    async def aclose(self) -> None:
+        """Release any resources held by the provider."""
+
+
+def _check_filters(filters: Dict[str, Optional[str]]) -> None:
+    """
+    Reject filter names other than ``SERIES_FILTERS``.
+
+    Raises:
+        TypeError: If a filter is not one of ``SERIES_FILTERS``
+    """
+    unknown = set(filters) - set(SERIES_FILTERS)
+    if unknown:
+        raise TypeError(f"Unknown series filters: {', '.join(sorted(unknown))}")
+
+
+def copy_result(
+    result: Dict[str, Any], data: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Copy a ``get_series`` result so the caller can mutate it freely.
+
+    Data points are copied one level deep (plus their footnotes), which is
+    all the nesting BLS observations have; everything else is deep-copied.
+
+    Args:
+        result: Result to copy
+        data: Data points to use instead of ``result["data"]``
+
+    Returns:
+        A result sharing no mutable state with ``result``
+    """
+    copied = copy.deepcopy(
+        {key: value for key, value in result.items() if key != "data"}
+    )
+    points = copied["data"] = []
+    for point in result["data"] if data is None else data:
+        point = dict(point)
+        if "footnotes" in point:
+            point["footnotes"] = copy.deepcopy(point["footnotes"])
+        points.append(point)
+    if data is not None:
+        copied["count"] = len(points)
+    return copied
+
+
+async def paginate_result(
+    result: Dict[str, Any], page_size: int
+) -> AsyncIterator[Dict[str, Any]]:
+    """Split a ``get_series`` result into a header chunk and data pages."""
+    data = result["data"]
+    yield {
+        "series_id": result["series_id"],
+        "metadata": result["metadata"],
+        "count": result["count"],
+    }
+    for start in range(0, len(data), page_size):
+        yield {"data": data[start : start + page_size]}
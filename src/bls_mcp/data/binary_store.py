@@ -0,0 +1,535 @@
+"""Compact binary fixture format with memory-mapped, per-series decoding.
+
+``historical_data.json`` is compiled into a single file laid out as::
+
+    header       magic, version, counts and section offsets
+    index        one fixed-width record per series, sorted by series ID
+    ordinals     int32 per observation, (year, period) ordinal
+    values       float64 per observation
+    value_refs   int32 per observation, original value string
+    period_refs  int32 per observation, period code
+    name_refs    int32 per observation, period name
+    note_refs    int32 per observation, footnotes as JSON (-1 if absent)
+    extra_refs   int32 per observation, other keys as JSON (-1 if absent)
+    str_offsets  uint64 per string plus one, offsets into the string blob
+    str_blob     UTF-8 string table
+
+Rows of a series are contiguous and time-sorted. Opening the file only maps
+it and reads the header; a series is decoded into ``SeriesColumns`` the first
+time it is requested, so startup cost and resident memory do not grow with
+the number of observations.
+"""
+
+import json
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .series_store import CORE_FIELDS, SeriesColumns, period_ordinal
+
+MAGIC = b"BLSCOL\x00\x01"
+VERSION = 1
+
+# magic, version, n_series, n_rows, n_strings, then 10 section offsets
+_HEADER = struct.Struct("<8sIIQQ10Q")
+# row_start, row_count, series_id string ref, flags
+_INDEX_RECORD = struct.Struct("<qqii")
+_FLAG_DESCENDING = 1
+
+_INT_COLUMNS = ("ordinals", "value_refs", "period_refs", "name_refs", "note_refs", "extra_refs")
+
+
+def _align(offset: int, alignment: int = 8) -> int:
+    """Round ``offset`` up to a multiple of ``alignment``."""
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class _StringTable:
+    """
+    String table spooled to disk while compiling.
+
+    Strings are deduplicated until ``max_remembered`` distinct ones have been
+    seen; later new strings are appended without being remembered. Codes,
+    period names and footnotes repeat from the first series on, so they stay
+    shared, while memory no longer grows with the number of distinct values.
+    """
+
+    def __init__(self, max_remembered: int) -> None:
+        self.max_remembered = max_remembered
+        self.ids: Dict[str, int] = {}
+        self.count = 0
+        self.blob = tempfile.TemporaryFile()
+        self.offsets = tempfile.TemporaryFile()
+        self._blob_size = 0
+        self._write_offset(0)
+
+    def _write_offset(self, offset: int) -> None:
+        self.offsets.write(struct.pack("<Q", offset))
+
+    def add(self, value: str) -> int:
+        ref = self.ids.get(value)
+        if ref is None:
+            ref = self.count
+            self.count += 1
+            if len(self.ids) < self.max_remembered:
+                self.ids[value] = ref
+            encoded = value.encode("utf-8")
+            self.blob.write(encoded)
+            self._blob_size += len(encoded)
+            self._write_offset(self._blob_size)
+        return ref
+
+    def close(self) -> None:
+        self.blob.close()
+        self.offsets.close()
+
+
+class BinaryStoreWriter:
+    """
+    Write the binary fixture format one series at a time.
+
+    Columns are spooled to temporary files as series are added and joined
+    into the output on ``close``, so memory use depends on the largest
+    series and the number of series, not on the number of observations.
+    Series may be added in any order; the index is sorted when writing.
+
+    Example:
+        with BinaryStoreWriter("historical_data.bin") as writer:
+            for series_id, points in generate():
+                writer.add_series(series_id, points)
+    """
+
+    def __init__(
+        self, output_path: Union[str, Path], max_shared_strings: int = 1 << 16
+    ) -> None:
+        """
+        Start a compiled fixture file.
+
+        Args:
+            output_path: Destination file, replaced atomically on ``close``
+            max_shared_strings: Distinct strings remembered for deduplication
+        """
+        self.output_path = Path(output_path)
+        self._strings = _StringTable(max_shared_strings)
+        self._columns = {name: tempfile.TemporaryFile() for name in _INT_COLUMNS}
+        self._values = tempfile.TemporaryFile()
+        self._index: List[Tuple[str, bytes]] = []
+        self.n_rows = 0
+
+    def _write(self, spool: IO[bytes], column: "array[Any]") -> None:
+        if sys.byteorder != "little":
+            column.byteswap()
+        spool.write(column.tobytes())
+
+    def add_series(self, series_id: str, points: Sequence[Mapping[str, Any]]) -> None:
+        """
+        Append a series.
+
+        Args:
+            series_id: Series ID, which must not have been added before
+            points: Observations in the ``historical_data.json`` shape, in
+                any order
+        """
+        strings = self._strings
+        columns: Dict[str, "array[Any]"] = {name: array("i") for name in _INT_COLUMNS}
+        values = array("d")
+
+        keyed = sorted(
+            (period_ordinal(int(p["year"]), p["period"]), i) for i, p in enumerate(points)
+        )
+        descending = len(points) < 2 or period_ordinal(
+            int(points[0]["year"]), points[0]["period"]
+        ) >= period_ordinal(int(points[-1]["year"]), points[-1]["period"])
+
+        for ordinal, i in keyed:
+            point = points[i]
+            columns["ordinals"].append(ordinal)
+            try:
+                values.append(float(point["value"]))
+            except (TypeError, ValueError):
+                values.append(float("nan"))
+            columns["value_refs"].append(strings.add(point["value"]))
+            columns["period_refs"].append(strings.add(point["period"]))
+            columns["name_refs"].append(strings.add(point.get("period_name", "")))
+            columns["note_refs"].append(
+                strings.add(json.dumps(point["footnotes"])) if "footnotes" in point else -1
+            )
+            extra = {
+                k: v for k, v in point.items() if k not in CORE_FIELDS and k != "footnotes"
+            }
+            columns["extra_refs"].append(strings.add(json.dumps(extra)) if extra else -1)
+
+        record = _INDEX_RECORD.pack(
+            self.n_rows,
+            len(points),
+            strings.add(series_id),
+            _FLAG_DESCENDING if descending else 0,
+        )
+        self._index.append((series_id, record))
+        self.n_rows += len(points)
+
+        for name, column in columns.items():
+            self._write(self._columns[name], column)
+        self._write(self._values, values)
+
+    def close(self) -> Path:
+        """
+        Write the output file and remove the spooled columns.
+
+        Returns:
+            Path of the written file
+        """
+        self._index.sort(key=lambda entry: entry[0])
+        index = b"".join(record for _, record in self._index)
+        spools: List[IO[bytes]] = [
+            self._columns["ordinals"],
+            self._values,
+            self._columns["value_refs"],
+            self._columns["period_refs"],
+            self._columns["name_refs"],
+            self._columns["note_refs"],
+            self._columns["extra_refs"],
+            self._strings.offsets,
+            self._strings.blob,
+        ]
+        sizes = [len(index)] + [spool.tell() for spool in spools]
+        offsets = []
+        position = _HEADER.size
+        for size in sizes:
+            position = _align(position)
+            offsets.append(position)
+            position += size
+
+        tmp_path = self.output_path.with_suffix(self.output_path.suffix + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(
+                    _HEADER.pack(
+                        MAGIC,
+                        VERSION,
+                        len(self._index),
+                        self.n_rows,
+                        self._strings.count,
+                        *offsets,
+                    )
+                )
+                f.write(b"\x00" * (offsets[0] - f.tell()))
+                f.write(index)
+                for offset, spool in zip(offsets[1:], spools):
+                    f.write(b"\x00" * (offset - f.tell()))
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, f)
+            tmp_path.replace(self.output_path)
+        finally:
+            self.abort()
+        return self.output_path
+
+    def abort(self) -> None:
+        """Discard the spooled columns without writing the output file."""
+        for spool in (*self._columns.values(), self._values):
+            spool.close()
+        self._strings.close()
+
+    def __enter__(self) -> "BinaryStoreWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def compile_historical_data(
+    historical: Mapping[str, Any], output_path: Union[str, Path]
+) -> Path:
+    """
+    Compile parsed ``historical_data.json`` content into the binary format.
+
+    Args:
+        historical: Mapping of series ID to ``{"series_id", "data"}``
+        output_path: Destination file
+
+    Returns:
+        Path of the written file
+    """
+    with BinaryStoreWriter(output_path) as writer:
+        for series_id in sorted(historical):
+            writer.add_series(series_id, historical[series_id]["data"])
+    return writer.output_path
+
+
+def compile_fixture_file(
+    json_path: Union[str, Path], output_path: Optional[Union[str, Path]] = None
+) -> Path:
+    """
+    Compile a ``historical_data.json`` file next to itself.
+
+    Args:
+        json_path: Path to the JSON fixture
+        output_path: Destination, defaults to the same name with ``.bin``
+
+    Returns:
+        Path of the written file
+    """
+    json_path = Path(json_path)
+    with open(json_path, "r") as f:
+        historical = json.load(f)
+    return compile_historical_data(
+        historical, output_path or json_path.with_suffix(".bin")
+    )
+
+
+class _SeriesIdView(Sequence[str]):
+    """Lazy, sorted view of the series IDs in the index, for bisecting."""
+
+    def __init__(self, store: "BinarySeriesStore") -> None:
+        self._store = store
+
+    def __len__(self) -> int:
+        return self._store.n_series
+
+    def __getitem__(self, i):  # type: ignore[no-untyped-def]
+        if not 0 <= i < self._store.n_series:
+            raise IndexError(i)
+        return self._store._string(self._store._record(i)[2])
+
+
+class BinarySeriesStore(Mapping[str, SeriesColumns]):
+    """
+    Read-only mapping of series ID to columns, backed by a memory map.
+
+    Series are decoded on first access and kept in a bounded LRU so that
+    resident memory stays proportional to the working set, not the file.
+    """
+
+    def __init__(self, path: Union[str, Path], max_decoded: int = 4096) -> None:
+        """
+        Map a compiled fixture file.
+
+        Args:
+            path: Path to a file written by ``compile_historical_data``
+            max_decoded: Maximum number of decoded series kept in memory
+
+        Raises:
+            ValueError: If the file is not a compiled fixture of this version,
+                or is truncated
+        """
+        self.path = Path(path)
+        self.max_decoded = max_decoded
+        with open(self.path, "rb") as f:
+            if f.seek(0, 2) < _HEADER.size:
+                # Also covers empty files, which cannot be mapped
+                raise ValueError(f"{self.path} is not a compiled fixture file")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open(_HEADER.unpack_from(self._mmap, 0))
+        except Exception:
+            self._mmap.close()
+            raise
+        self._ids = _SeriesIdView(self)
+        self._decoded: "OrderedDict[str, SeriesColumns]" = OrderedDict()
+
+    def _open(self, header: Tuple[Any, ...]) -> None:
+        """Check the header against the file and map the sections."""
+        magic, version, n_series, n_rows, n_strings, *offsets = header
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a compiled fixture file")
+        if version != VERSION:
+            raise ValueError(
+                f"{self.path} is compiled fixture version {version}, expected {VERSION}"
+            )
+
+        # Every section must lie inside the file; the header is not trusted
+        sizes = [
+            n_series * _INDEX_RECORD.size,
+            4 * n_rows,
+            8 * n_rows,
+            *(4 * n_rows for _ in range(5)),
+            8 * (n_strings + 1),
+        ]
+        file_size = len(self._mmap)
+        for offset, size in zip(offsets, sizes):
+            if offset < _HEADER.size or offset + size > file_size:
+                raise ValueError(f"{self.path} is truncated or corrupt")
+        blob_end = struct.unpack_from("<Q", self._mmap, offsets[8] + 8 * n_strings)[0]
+        if offsets[9] < _HEADER.size or offsets[9] + blob_end > file_size:
+            raise ValueError(f"{self.path} is truncated or corrupt")
+
+        self.n_series = n_series
+        self.n_rows = n_rows
+        view = memoryview(self._mmap)
+        (
+            self._index_offset,
+            ordinals_offset,
+            values_offset,
+            value_refs_offset,
+            period_refs_offset,
+            name_refs_offset,
+            note_refs_offset,
+            extra_refs_offset,
+            str_offsets_offset,
+            self._blob_offset,
+        ) = offsets
+        self._ordinals = view[ordinals_offset : ordinals_offset + 4 * n_rows]
+        self._values = view[values_offset : values_offset + 8 * n_rows]
+        self._value_refs = view[value_refs_offset : value_refs_offset + 4 * n_rows]
+        self._period_refs = view[period_refs_offset : period_refs_offset + 4 * n_rows]
+        self._name_refs = view[name_refs_offset : name_refs_offset + 4 * n_rows]
+        self._note_refs = view[note_refs_offset : note_refs_offset + 4 * n_rows]
+        self._extra_refs = view[extra_refs_offset : extra_refs_offset + 4 * n_rows]
+        self._str_offsets = view[
+            str_offsets_offset : str_offsets_offset + 8 * (n_strings + 1)
+        ]
+
+    def close(self) -> None:
+        """Release decoded series and unmap the file."""
+        self._decoded.clear()
+        for name in (
+            "_ordinals",
+            "_values",
+            "_value_refs",
+            "_period_refs",
+            "_name_refs",
+            "_note_refs",
+            "_extra_refs",
+            "_str_offsets",
+        ):
+            getattr(self, name).release()
+        self._mmap.close()
+
+    def _record(self, i: int) -> tuple:
+        return _INDEX_RECORD.unpack_from(
+            self._mmap, self._index_offset + i * _INDEX_RECORD.size
+        )
+
+    def _string(self, ref: int) -> str:
+        start, end = struct.unpack_from("<QQ", self._str_offsets, ref * 8)
+        base = self._blob_offset
+        return self._mmap[base + start : base + end].decode("utf-8")
+
+    def _find(self, series_id: str) -> Optional[int]:
+        i = bisect_left(self._ids, series_id)
+        if i < self.n_series and self._ids[i] == series_id:
+            return i
+        return None
+
+    def _int_slice(self, column: memoryview, start: int, count: int) -> "array[int]":
+        result = array("i")
+        result.frombytes(column[start * 4 : (start + count) * 4])
+        if sys.byteorder != "little":
+            result.byteswap()
+        return result
+
+    def _decode(self, i: int) -> SeriesColumns:
+        row_start, row_count, id_ref, flags = self._record(i)
+
+        ordinals = self._int_slice(self._ordinals, row_start, row_count)
+        values = array("d")
+        values.frombytes(self._values[row_start * 8 : (row_start + row_count) * 8])
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        strings: Dict[int, str] = {}
+
+        def lookup(ref: int) -> str:
+            value = strings.get(ref)
+            if value is None:
+                value = strings[ref] = self._string(ref)
+            return value
+
+        periods = [lookup(r) for r in self._int_slice(self._period_refs, row_start, row_count)]
+        period_names = [
+            lookup(r) for r in self._int_slice(self._name_refs, row_start, row_count)
+        ]
+        value_strs = [
+            lookup(r) for r in self._int_slice(self._value_refs, row_start, row_count)
+        ]
+
+        footnotes: List[Any] = []
+        local_notes: Dict[int, int] = {}
+        footnote_refs = array("i")
+        for ref in self._int_slice(self._note_refs, row_start, row_count):
+            if ref < 0:
+                footnote_refs.append(-1)
+                continue
+            if ref not in local_notes:
+                local_notes[ref] = len(footnotes)
+                footnotes.append(json.loads(lookup(ref)))
+            footnote_refs.append(local_notes[ref])
+
+        extras: Dict[int, Dict[str, Any]] = {}
+        for row, ref in enumerate(self._int_slice(self._extra_refs, row_start, row_count)):
+            if ref >= 0:
+                extras[row] = json.loads(lookup(ref))
+
+        return SeriesColumns(
+            self._string(id_ref),
+            ordinals,
+            values,
+            [str(ordinal // 100) for ordinal in ordinals],
+            periods,
+            period_names,
+            value_strs,
+            footnote_refs,
+            footnotes,
+            extras,
+            bool(flags & _FLAG_DESCENDING),
+        )
+
+    def __getitem__(self, series_id: str) -> SeriesColumns:
+        columns = self._decoded.get(series_id)
+        if columns is not None:
+            self._decoded.move_to_end(series_id)
+            return columns
+
+        i = self._find(series_id)
+        if i is None:
+            raise KeyError(series_id)
+
+        columns = self._decode(i)
+        self._decoded[series_id] = columns
+        if len(self._decoded) > self.max_decoded:
+            self._decoded.popitem(last=False)
+        return columns
+
+    def __contains__(self, series_id: object) -> bool:
+        if not isinstance(series_id, str):
+            return False
+        return series_id in self._decoded or self._find(series_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return self.n_series
+
+    def row_count(self, series_id: str) -> int:
+        """
+        Return the number of observations for a series without decoding it.
+
+        Raises:
+            KeyError: If the series is not in the store
+        """
+        i = self._find(series_id)
+        if i is None:
+            raise KeyError(series_id)
+        return int(self._record(i)[1])
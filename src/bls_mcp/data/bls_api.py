@@ -0,0 +1,442 @@
+"""Data provider backed by the public BLS API v2."""
+
+import asyncio
+import time
+from collections import deque
+from datetime import date
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ..utils.logger import get_logger
+from .base import DataProvider, copy_result
+from .mock_data import MockDataProvider
+
+logger = get_logger(__name__)
+
+BLS_API_URL = "https://api.bls.gov/publicAPI/v2/"
+
+# Published BLS API v2 limits. Requests without a registration key are held
+# to the much lower v1 limits.
+REGISTERED_LIMITS = {"daily": 500, "series": 50, "years": 20}
+UNREGISTERED_LIMITS = {"daily": 25, "series": 25, "years": 10}
+WINDOW_LIMIT = 50
+WINDOW_SECONDS = 10.0
+
+# get_series_info answers are kept this long, for at most this many series
+INFO_TTL_SECONDS = 3600.0
+MAX_INFO_ENTRIES = 4096
+
+YearRange = Tuple[Optional[int], Optional[int]]
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when the daily BLS API request quota has been used up."""
+
+
+class RateBudget:
+    """
+    Track the BLS request quota so bursts are queued instead of rejected.
+
+    A sliding window caps requests per ``window_seconds``; callers over the
+    window limit wait for the oldest request to age out. The daily quota is
+    a hard limit and raises ``QuotaExceededError`` once exhausted.
+    """
+
+    def __init__(
+        self,
+        daily_limit: int,
+        window_limit: int = WINDOW_LIMIT,
+        window_seconds: float = WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            daily_limit: Requests allowed per calendar day
+            window_limit: Requests allowed per sliding window
+            window_seconds: Length of the sliding window
+            clock: Monotonic clock, injectable for tests
+            today: Current date, injectable for tests
+        """
+        self.daily_limit = daily_limit
+        self.window_limit = window_limit
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._today = today
+        self._day = today()
+        self._used_today = 0
+        self._recent: Deque[float] = deque()
+
+    @property
+    def remaining_today(self) -> int:
+        """Requests left in today's quota."""
+        self._roll_day()
+        return self.daily_limit - self._used_today
+
+    def _roll_day(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._used_today = 0
+
+    async def acquire(self) -> None:
+        """
+        Reserve one request, waiting for window capacity if needed.
+
+        Raises:
+            QuotaExceededError: If the daily quota is exhausted
+        """
+        while True:
+            self._roll_day()
+            if self._used_today >= self.daily_limit:
+                raise QuotaExceededError(
+                    f"BLS API daily quota of {self.daily_limit} requests exhausted"
+                )
+
+            now = self._clock()
+            while self._recent and now - self._recent[0] >= self.window_seconds:
+                self._recent.popleft()
+
+            if len(self._recent) < self.window_limit:
+                self._recent.append(now)
+                self._used_today += 1
+                return
+
+            await asyncio.sleep(self._recent[0] + self.window_seconds - now)
+
+
+def _cancel_waiting(waiters: Dict[str, List["asyncio.Future[Any]"]]) -> None:
+    """Cancel every future in ``waiters`` that is still unresolved."""
+    for futures in waiters.values():
+        for future in futures:
+            if not future.done():
+                future.cancel()
+
+
+class BLSApiProvider(DataProvider):
+    """
+    Provides live data from the BLS public API.
+
+    Concurrent ``get_series`` calls for the same year range are merged into
+    one multi-series POST. All requests share a single keep-alive HTTP
+    client and a ``RateBudget``. The API has no catalog listing endpoint, so
+    listing and search are served from a local catalog provider.
+    """
+
+    # Without a year range the API returns only the most recent years
+    full_history = False
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = BLS_API_URL,
+        catalog_provider: Optional[DataProvider] = None,
+        batch_window: float = 0.01,
+        timeout: float = 30.0,
+        max_connections: int = 10,
+        budget: Optional[RateBudget] = None,
+        info_ttl: float = INFO_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the BLS API provider.
+
+        Args:
+            api_key: BLS registration key; unregistered limits apply without one
+            base_url: API root, overridable for tests
+            catalog_provider: Source of series metadata, listing and search.
+                Defaults to the bundled mock catalog.
+            batch_window: Seconds to wait for more calls to join a batch
+            timeout: HTTP timeout in seconds
+            max_connections: Size of the keep-alive connection pool
+            budget: Request budget, defaults to the published BLS limits
+            info_ttl: Seconds a ``get_series_info`` answer is reused, since
+                each one costs a request from the daily quota
+            clock: Monotonic clock for ``info_ttl``, injectable for tests
+        """
+        limits = REGISTERED_LIMITS if api_key else UNREGISTERED_LIMITS
+        self.api_key = api_key
+        self.base_url = base_url
+        self.catalog_provider = catalog_provider or MockDataProvider()
+        self.batch_window = batch_window
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_series_per_request = limits["series"]
+        self.max_years_per_request = limits["years"]
+        self.budget = budget or RateBudget(limits["daily"])
+        self.info_ttl = info_ttl
+        self._clock = clock
+
+        self._client: Any = None
+        self._pending: Dict[YearRange, Dict[str, List["asyncio.Future[Any]"]]] = {}
+        self._timers: Dict[YearRange, asyncio.TimerHandle] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._info: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def _get_client(self) -> Any:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            try:
+                import httpx
+            except ImportError as e:
+                raise ImportError(
+                    "The BLS API provider requires httpx. "
+                    "Install it with: pip install 'bls-mcp[api]'"
+                ) from e
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Cancel batches in progress and close the shared HTTP client."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        for waiters in self._pending.values():
+            _cancel_waiting(waiters)
+        self._pending.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _year_chunks(self, start_year: Optional[int], end_year: Optional[int]) -> List[YearRange]:
+        """
+        Split a year range into spans the API accepts, newest first.
+
+        The API requires both bounds when either is given and rejects spans
+        longer than ``max_years_per_request``.
+        """
+        if start_year is None and end_year is None:
+            return [(None, None)]
+
+        span = self.max_years_per_request
+        end = end_year if end_year is not None else date.today().year
+        start = start_year if start_year is not None else end - span + 1
+
+        chunks: List[YearRange] = []
+        while end >= start:
+            chunks.append((max(start, end - span + 1), end))
+            end -= span
+        return chunks
+
+    async def _post(self, series_ids: List[str], years: YearRange) -> Dict[str, Any]:
+        """Send one multi-series request and return the parsed body."""
+        payload: Dict[str, Any] = {"seriesid": series_ids}
+        if years[0] is not None:
+            payload["startyear"] = str(years[0])
+            payload["endyear"] = str(years[1])
+        if self.api_key:
+            payload["registrationkey"] = self.api_key
+            payload["catalog"] = True
+
+        await self.budget.acquire()
+        logger.debug("POST timeseries/data/ for %s series, years %s", len(series_ids), years)
+        response = await self._get_client().post("timeseries/data/", json=payload)
+        response.raise_for_status()
+        body: Dict[str, Any] = response.json()
+
+        if body.get("status") != "REQUEST_SUCCEEDED":
+            messages = "; ".join(body.get("message", [])) or body.get("status", "unknown")
+            raise RuntimeError(f"BLS API request failed: {messages}")
+        return body
+
+    @staticmethod
+    def _convert_point(point: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a BLS API observation onto the fixture data point schema."""
+        converted: Dict[str, Any] = {
+            "year": point["year"],
+            "period": point["period"],
+            "period_name": point.get("periodName", ""),
+            "value": point["value"],
+        }
+        footnotes = [f for f in point.get("footnotes", []) if f]
+        if footnotes:
+            converted["footnotes"] = footnotes
+        return converted
+
+    async def _fetch_batch(
+        self, years: YearRange, waiters: Dict[str, List["asyncio.Future[Any]"]]
+    ) -> None:
+        """
+        Fetch every waiting series in one request per year chunk.
+
+        Waiters are resolved with their data or the error; ``_flush``
+        cancels any left over if the task itself is cancelled.
+        """
+        series_ids = list(waiters)
+        found: Dict[str, Dict[str, Any]] = {sid: {"data": [], "catalog": None} for sid in series_ids}
+        try:
+            for chunk in self._year_chunks(*years):
+                body = await self._post(series_ids, chunk)
+                for series in body.get("Results", {}).get("series", []):
+                    entry = found.get(series.get("seriesID"))
+                    if entry is None:
+                        continue
+                    entry["data"].extend(self._convert_point(p) for p in series.get("data", []))
+                    if series.get("catalog"):
+                        entry["catalog"] = series["catalog"]
+
+            for series_id, futures in waiters.items():
+                for future in futures:
+                    if future.done():
+                        continue
+                    if found[series_id]["data"]:
+                        # Every caller gets its own copy to mutate
+                        future.set_result(copy_result(found[series_id]))
+                    else:
+                        future.set_exception(
+                            ValueError(f"Series '{series_id}' not found in BLS API")
+                        )
+        except Exception as e:
+            for futures in waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _flush(self, years: YearRange) -> None:
+        """Send the pending batch for a year range."""
+        timer = self._timers.pop(years, None)
+        if timer is not None:
+            timer.cancel()
+        waiters = self._pending.pop(years, None)
+        if not waiters:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._fetch_batch(years, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        # A task cancelled before or during the request never resolves its
+        # waiters itself; cancel them so coalesced callers do not hang
+        task.add_done_callback(lambda _: _cancel_waiting(waiters))
+
+    async def _fetch(
+        self, series_id: str, start_year: Optional[int], end_year: Optional[int]
+    ) -> Dict[str, Any]:
+        """Queue a series for the next batch and wait for its data."""
+        loop = asyncio.get_running_loop()
+        years = (start_year, end_year)
+        future: "asyncio.Future[Any]" = loop.create_future()
+
+        group = self._pending.setdefault(years, {})
+        group.setdefault(series_id, []).append(future)
+
+        if len(group) >= self.max_series_per_request:
+            self._flush(years)
+        elif years not in self._timers:
+            self._timers[years] = loop.call_later(self.batch_window, self._flush, years)
+
+        result: Dict[str, Any] = await future
+        return result
+
+    async def _metadata(self, series_id: str) -> Optional[Dict[str, Any]]:
+        """Look up catalog metadata for a series, if the catalog knows it."""
+        try:
+            info = await self.catalog_provider.get_series_info(series_id)
+        except ValueError:
+            return None
+        return {
+            k: v for k, v in info.items() if k not in ("data_point_count", "available_data")
+        }
+
+    async def get_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get data for a specific series from the BLS API.
+
+        Args:
+            series_id: BLS series ID (e.g., 'CUUR0000SA0')
+            start_year: Optional start year filter
+            end_year: Optional end year filter
+
+        Returns:
+            Dictionary with series data
+
+        Raises:
+            ValueError: If series not found
+            QuotaExceededError: If the daily request quota is exhausted
+        """
+        fetched = await self._fetch(series_id, start_year, end_year)
+        metadata = await self._metadata(series_id) or fetched["catalog"] or {}
+        data_points = fetched["data"]
+
+        return {
+            "series_id": series_id,
+            "data": data_points,
+            "metadata": metadata,
+            "count": len(data_points),
+        }
+
+    async def list_series(
+        self, category: Optional[str] = None, limit: int = 50, **filters: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """List series from the local catalog."""
+        return await self.catalog_provider.list_series(
+            category=category, limit=limit, **filters
+        )
+
+    async def list_series_page(
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        **filters: Optional[str],
+    ) -> Dict[str, Any]:
+        """List a page of series from the local catalog."""
+        return await self.catalog_provider.list_series_page(
+            category=category, limit=limit, cursor=cursor, **filters
+        )
+
+    async def get_series_info(self, series_id: str) -> Dict[str, Any]:
+        """
+        Get metadata for a series, with its availability in the BLS API.
+
+        Answers are reused for ``info_ttl`` seconds, so repeated lookups do
+        not spend the request quota.
+
+        Raises:
+            ValueError: If neither the catalog nor the API knows the series
+        """
+        now = self._clock()
+        cached = self._info.get(series_id)
+        if cached is not None and now - cached[0] < self.info_ttl:
+            return dict(cached[1])
+
+        metadata = await self._metadata(series_id)
+        try:
+            fetched = await self._fetch(series_id, None, None)
+        except ValueError:
+            if metadata is None:
+                raise ValueError(f"Series '{series_id}' not found")
+            info = {**metadata, "data_point_count": 0, "available_data": False}
+        else:
+            info = {
+                **(metadata or fetched["catalog"] or {"series_id": series_id}),
+                "data_point_count": len(fetched["data"]),
+                "available_data": True,
+            }
+
+        self._info.pop(series_id, None)
+        if len(self._info) >= MAX_INFO_ENTRIES:
+            del self._info[next(iter(self._info))]
+        self._info[series_id] = (now, info)
+        return dict(info)
+
+    async def search_series(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search series in the local catalog."""
+        return await self.catalog_provider.search_series(query, limit=limit)
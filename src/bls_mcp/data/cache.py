@@ -0,0 +1,461 @@
+"""Tiered response cache in front of a data provider."""
+
+import asyncio
+import json
+import sqlite3
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from .base import DataProvider, copy_result, paginate_result
+from .series_store import SeriesColumns
+
+CacheKey = Tuple[str, Optional[int], Optional[int]]
+_Entry = Tuple[Dict[str, Any], List[int], int, float]
+
+# Typical day of month each survey publishes, keyed by series ID prefix.
+# BLS releases at 8:30 a.m. Eastern, which is 13:30 UTC outside DST.
+DEFAULT_RELEASE_DAYS = {
+    "CU": 12,  # CPI-U
+    "CW": 12,  # CPI-W
+    "SU": 12,  # Chained CPI
+    "AP": 12,  # Average prices
+    "WP": 14,  # PPI commodities
+    "PC": 14,  # PPI industries
+    "CE": 7,  # Current Employment Statistics
+    "LN": 7,  # Current Population Survey
+    "LA": 20,  # Local Area Unemployment
+    "JT": 8,  # JOLTS
+}
+DEFAULT_RELEASE_DAY = 15
+RELEASE_TIME_UTC = (13, 30)
+
+
+class ReleaseCalendar:
+    """
+    Predict when a series next gets new data, to expire cached copies.
+
+    Explicit release datetimes can be supplied per series ID prefix (e.g.
+    from the published BLS schedule). Prefixes without a schedule fall back
+    to a monthly release on a typical day of the month.
+    """
+
+    def __init__(
+        self,
+        schedules: Optional[Dict[str, Sequence[datetime]]] = None,
+        release_days: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize the calendar.
+
+        Args:
+            schedules: Series ID prefix to timezone-aware release datetimes
+            release_days: Series ID prefix to typical release day of month
+        """
+        self.schedules = {
+            prefix: sorted(dates) for prefix, dates in (schedules or {}).items()
+        }
+        self.release_days = {**DEFAULT_RELEASE_DAYS, **(release_days or {})}
+
+    def _prefix_for(self, series_id: str, table: Dict[str, Any]) -> Optional[str]:
+        for length in range(min(len(series_id), 4), 0, -1):
+            if series_id[:length] in table:
+                return series_id[:length]
+        return None
+
+    def next_release(self, series_id: str, now: Optional[datetime] = None) -> datetime:
+        """
+        Return the next release datetime after ``now`` for a series.
+
+        Args:
+            series_id: BLS series ID
+            now: Reference time, defaults to the current UTC time
+
+        Returns:
+            Timezone-aware UTC datetime of the next expected release
+        """
+        now = now or datetime.now(timezone.utc)
+
+        prefix = self._prefix_for(series_id, self.schedules)
+        if prefix is not None:
+            for release in self.schedules[prefix]:
+                if release > now:
+                    return release
+
+        prefix = self._prefix_for(series_id, self.release_days)
+        day = self.release_days[prefix] if prefix else DEFAULT_RELEASE_DAY
+        hour, minute = RELEASE_TIME_UTC
+
+        year, month = now.year, now.month
+        for _ in range(2):
+            release = datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+            if release > now:
+                return release
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return release
+
+
+def _covers(cached: CacheKey, wanted: CacheKey) -> bool:
+    """Return True if the cached year range contains the wanted one."""
+    _, cached_start, cached_end = cached
+    _, start, end = wanted
+    start_ok = not cached_start or (bool(start) and cached_start <= start)
+    end_ok = not cached_end or (bool(end) and cached_end >= end)
+    return start_ok and end_ok
+
+
+def _year_keys(result: Dict[str, Any]) -> List[int]:
+    """
+    Return an ascending bisect key per data point of a get_series result.
+
+    BLS returns points newest first, so descending series are keyed on the
+    negated year.
+    """
+    years = [int(point["year"]) for point in result["data"]]
+    if years and years[0] > years[-1]:
+        return [-year for year in years]
+    return years
+
+
+def _slice_result(
+    result: Dict[str, Any], keys: List[int], start: Optional[int], end: Optional[int]
+) -> Dict[str, Any]:
+    """Copy the part of a cached get_series result within a year range."""
+    lo, hi = 0, len(keys)
+    if keys and keys[0] < 0:
+        start, end = (-end if end else None), (-start if start else None)
+    if start:
+        lo = bisect_left(keys, start)
+    if end:
+        hi = bisect_right(keys, end)
+    return copy_result(result, result["data"][lo:max(lo, hi)])
+
+
+def estimate_size(result: Dict[str, Any]) -> int:
+    """
+    Estimate the memory held by a get_series result, in bytes.
+
+    Counts the container and string objects of each data point; shared
+    metadata is counted once.
+    """
+    size = sys.getsizeof(result) + sys.getsizeof(result.get("data", []))
+    for point in result.get("data", []):
+        size += sys.getsizeof(point)
+        for value in point.values():
+            size += sys.getsizeof(value)
+    for value in result.get("metadata", {}).values():
+        size += sys.getsizeof(value)
+    return size
+
+
+class _DiskCache:
+    """SQLite-backed persistent cache tier."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10.0, check_same_thread=False)
+        # WAL lets worker processes sharing the file read while one writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, series_id TEXT NOT NULL, "
+            "payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_series ON responses (series_id)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(key: CacheKey) -> str:
+        return json.dumps(key)
+
+    def get(self, key: CacheKey, now: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM responses WHERE key = ?",
+                (self._key(key),),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (self._key(key),))
+                self._conn.commit()
+                return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, key: CacheKey, result: Dict[str, Any], expires_at: float) -> None:
+        payload = json.dumps(result, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (self._key(key), key[0], payload, expires_at),
+            )
+            self._conn.commit()
+
+    def invalidate(self, series_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE series_id = ?", (series_id,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingDataProvider(DataProvider):
+    """
+    Cache ``get_series`` results in memory and, optionally, on disk.
+
+    The memory tier is an LRU bounded by an estimated byte size. A request
+    that misses its exact key is served from any cached range of the same
+    series that contains it. Misses fall through to the SQLite tier, then
+    to the wrapped provider. Entries expire at the series' next scheduled
+    BLS release. Other provider methods pass straight through.
+    """
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_path: Optional[Union[str, Path]] = None,
+        calendar: Optional[ReleaseCalendar] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            provider: Data provider to cache
+            max_bytes: Memory cap for the in-process tier
+            disk_path: SQLite file for the persistent tier; None disables it
+            calendar: Release calendar used to compute expiry times
+        """
+        self.provider = provider
+        self.full_history = provider.full_history
+        self.columnar = provider.columnar
+        self.accepts_updates = provider.accepts_updates
+        self.max_bytes = max_bytes
+        self.calendar = calendar or ReleaseCalendar()
+        self._disk = _DiskCache(disk_path) if disk_path else None
+
+        # key -> (result, year keys, size, expires_at); results are never
+        # handed out, callers get copies
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._keys_by_series: Dict[str, Set[CacheKey]] = {}
+        # Bumped by invalidate; a fetch that started under an older
+        # generation is returned but not cached
+        self._generations: Dict[str, int] = {}
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.superset_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters and current memory usage."""
+        lookups = self.hits + self.superset_hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "superset_hits": self.superset_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": (lookups - self.misses) / lookups if lookups else 0.0,
+        }
+
+    def _expires_at(self, series_id: str) -> float:
+        return self.calendar.next_release(series_id).timestamp()
+
+    def _remove(self, key: CacheKey) -> None:
+        _, _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+        keys = self._keys_by_series.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_series[key[0]]
+
+    def _store(self, key: CacheKey, result: Dict[str, Any], expires_at: float) -> None:
+        """Cache a private copy of ``result``."""
+        size = estimate_size(result)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        result = copy_result(result)
+        self._entries[key] = (result, _year_keys(result), size, expires_at)
+        self._keys_by_series.setdefault(key[0], set()).add(key)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _lookup(self, key: CacheKey, now: float) -> Optional[Dict[str, Any]]:
+        """Find an exact or superset entry in the memory tier and copy it."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[3] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy_result(entry[0])
+            self._remove(key)
+
+        for cached in list(self._keys_by_series.get(key[0], ())):
+            result, keys, _, expires_at = self._entries[cached]
+            if expires_at <= now:
+                self._remove(cached)
+                continue
+            # Without a start year some providers return only recent history
+            if not cached[1] and not self.full_history:
+                continue
+            if _covers(cached, key):
+                self._entries.move_to_end(cached)
+                self.superset_hits += 1
+                return _slice_result(result, keys, key[1], key[2])
+        return None
+
+    def invalidate(self, series_id: str) -> None:
+        """Drop every cached range of a series from both tiers."""
+        self._generations[series_id] = self._generations.get(series_id, 0) + 1
+        for key in list(self._keys_by_series.get(series_id, ())):
+            self._remove(key)
+        if self._disk is not None:
+            self._disk.invalidate(series_id)
+
+    def clear(self) -> None:
+        """Drop every entry from the memory tier."""
+        self._entries.clear()
+        self._keys_by_series.clear()
+        self.current_bytes = 0
+
+    async def get_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get series data, serving from cache where possible."""
+        key: CacheKey = (series_id, start_year, end_year)
+        now = time.time()
+
+        cached = self._lookup(key, now)
+        if cached is not None:
+            return cached
+
+        # An invalidate while either tier is being read means the result
+        # may predate the change, so it is returned but not kept
+        generation = self._generations.get(series_id, 0)
+        if self._disk is not None:
+            stored = await asyncio.to_thread(self._disk.get, key, now)
+            if stored is not None:
+                self.disk_hits += 1
+                result, expires_at = stored
+                if self._generations.get(series_id, 0) == generation:
+                    self._store(key, result, expires_at)
+                return result
+
+        self.misses += 1
+        result = await self.provider.get_series(series_id, start_year, end_year)
+        if self._generations.get(series_id, 0) != generation:
+            return result
+        expires_at = self._expires_at(series_id)
+        self._store(key, result, expires_at)
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.put, key, result, expires_at)
+        return result
+
+    async def iter_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a series from cache, or straight from the wrapped provider.
+
+        Streamed misses are not cached, so large series never have to be
+        held in memory in full.
+        """
+        cached = self._lookup((series_id, start_year, end_year), time.time())
+        if cached is None:
+            self.misses += 1
+            chunks = self.provider.iter_series(series_id, start_year, end_year, page_size)
+        else:
+            chunks = paginate_result(cached, page_size)
+        async for chunk in chunks:
+            yield chunk
+
+    async def get_columns(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> SeriesColumns:
+        """
+        Get series columns.
+
+        Columnar providers are asked directly; otherwise the columns are
+        built from the cached ``get_series`` result.
+        """
+        if self.provider.columnar:
+            return await self.provider.get_columns(series_id, start_year, end_year)
+        return await super().get_columns(series_id, start_year, end_year)
+
+    async def list_series(
+        self, category: Optional[str] = None, limit: int = 50, **filters: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """List series from the wrapped provider."""
+        return await self.provider.list_series(
+            category=category, limit=limit, **filters
+        )
+
+    async def list_series_page(
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        **filters: Optional[str],
+    ) -> Dict[str, Any]:
+        """List a page of series from the wrapped provider."""
+        return await self.provider.list_series_page(
+            category=category, limit=limit, cursor=cursor, **filters
+        )
+
+    async def get_series_info(self, series_id: str) -> Dict[str, Any]:
+        """Get series metadata from the wrapped provider."""
+        return await self.provider.get_series_info(series_id)
+
+    async def search_series(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search series in the wrapped provider."""
+        return await self.provider.search_series(query, limit=limit)
+
+    async def warm(self) -> None:
+        """Warm the wrapped provider."""
+        await self.provider.warm()
+
+    async def apply_updates(self, updates: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Update the wrapped provider, then drop the changed series from the cache."""
+        changed = await self.provider.apply_updates(updates)
+        for series_id in changed:
+            self.invalidate(series_id)
+        return changed
+
+    async def aclose(self) -> None:
+        """Close the disk tier and the wrapped provider."""
+        if self._disk is not None:
+            self._disk.close()
+        await self.provider.aclose()
@@ -0,0 +1,165 @@
+"""In-memory indexes over the BLS series catalog."""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Catalog fields that get a secondary index. Lookups on these fields are
+# case-insensitive, matching the historical behaviour of ``list_series``.
+INDEXED_FIELDS = ("category", "survey_name", "area", "item", "seasonality")
+
+QueryKey = Tuple[Tuple[str, str], ...]
+
+# Multi-field filter results kept, so paging through one is O(page size)
+MAX_CACHED_QUERIES = 256
+
+
+def _normalize(value: Any) -> str:
+    """Normalize an indexed field value for case-insensitive lookups."""
+    return str(value).upper()
+
+
+class SeriesCatalogIndex:
+    """
+    Primary and secondary indexes over a list of series metadata entries.
+
+    The indexes are built once from the catalog and are read-only afterwards,
+    so every lookup is a dictionary access rather than a catalog scan.
+    """
+
+    def __init__(self, series: Iterable[Dict[str, Any]]) -> None:
+        """
+        Build indexes for the given catalog entries.
+
+        Args:
+            series: Series metadata dictionaries, each with a ``series_id``
+        """
+        self._series: List[Dict[str, Any]] = list(series)
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_field: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+
+        self._queries: "OrderedDict[QueryKey, List[Dict[str, Any]]]" = OrderedDict()
+
+        for entry in self._series:
+            self._by_id[entry["series_id"]] = entry
+            for field in INDEXED_FIELDS:
+                value = entry.get(field)
+                if value is None:
+                    continue
+                self._by_field[field].setdefault(_normalize(value), []).append(entry)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __contains__(self, series_id: object) -> bool:
+        return series_id in self._by_id
+
+    @property
+    def series(self) -> List[Dict[str, Any]]:
+        """All catalog entries in their original order."""
+        return self._series
+
+    def get(self, series_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a series by ID.
+
+        Args:
+            series_id: BLS series ID
+
+        Returns:
+            Series metadata, or None if the series is not in the catalog
+        """
+        return self._by_id.get(series_id)
+
+    def values(self, field: str) -> List[str]:
+        """
+        List the distinct normalized values of an indexed field.
+
+        Args:
+            field: One of ``INDEXED_FIELDS``
+
+        Returns:
+            Distinct values, upper-cased
+        """
+        return list(self._by_field[field])
+
+    def find(self, **filters: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Return catalog entries matching every given field filter.
+
+        Filters set to None are ignored. With no active filters the full
+        catalog is returned. With one filter the precomputed posting list is
+        returned as-is; with several, the smallest posting list is scanned
+        and the result kept for later calls with the same filters.
+
+        Args:
+            **filters: Field name to value, for fields in ``INDEXED_FIELDS``
+
+        Returns:
+            Matching series metadata in catalog order. The list is shared
+            with the index and must not be mutated by callers.
+
+        Raises:
+            ValueError: If a filter names a field that is not indexed
+        """
+        active = {k: v for k, v in filters.items() if v is not None}
+        for field in active:
+            if field not in self._by_field:
+                raise ValueError(f"Field '{field}' is not indexed")
+
+        if not active:
+            return self._series
+
+        postings = [
+            self._by_field[field].get(_normalize(value), [])
+            for field, value in active.items()
+        ]
+        if len(postings) == 1:
+            return postings[0]
+
+        key: QueryKey = tuple(
+            sorted((field, _normalize(value)) for field, value in active.items())
+        )
+        found = self._queries.get(key)
+        if found is not None:
+            self._queries.move_to_end(key)
+            return found
+
+        postings.sort(key=len)
+        smallest, rest = postings[0], postings[1:]
+        rest_ids = [{id(entry) for entry in posting} for posting in rest]
+        found = [
+            entry
+            for entry in smallest
+            if all(id(entry) in ids for ids in rest_ids)
+        ]
+        self._queries[key] = found
+        if len(self._queries) > MAX_CACHED_QUERIES:
+            self._queries.popitem(last=False)
+        return found
+
+    def iter_page(
+        self, offset: int, limit: int, **filters: Optional[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one page of the entries matching ``filters``.
+
+        Entries are read by position from the (precomputed) match list, so
+        a page costs O(limit) however deep into the results it starts.
+
+        Args:
+            offset: Position of the first entry to yield
+            limit: Maximum number of entries to yield
+            **filters: As for ``find``
+
+        Raises:
+            ValueError: If a filter names a field that is not indexed
+        """
+        matches = self.find(**filters)
+        for i in range(offset, min(offset + limit, len(matches))):
+            yield matches[i]
+
+    def count(self, **filters: Optional[str]) -> int:
+        """Return the number of entries matching ``filters``."""
+        return len(self.find(**filters))
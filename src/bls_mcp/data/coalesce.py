@@ -0,0 +1,209 @@
+"""Single-flight coalescing of concurrent identical provider calls."""
+
+import asyncio
+import copy
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from .base import DataProvider, copy_result
+from .series_store import SeriesColumns
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time and share its outcome.
+
+    The first caller for a key starts the work as a task; callers that
+    arrive while it is in flight await the same task. The task is shielded,
+    so a cancelled caller does not cancel the work for everyone else. Each
+    caller gets its own copy of the result, so one caller mutating it
+    cannot affect the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being fetched."""
+        return len(self._in_flight)
+
+    async def do(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        copier: Callable[[T], T] = copy.deepcopy,
+    ) -> T:
+        """
+        Await the in-flight call for ``key``, starting it if there is none.
+
+        Args:
+            key: Identity of the call; equal keys share one execution
+            factory: Zero-argument coroutine function performing the call
+            copier: Function copying the shared result for this caller
+
+        Returns:
+            A copy of the shared result
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.deduplicated += 1
+        else:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+
+            def _forget(done: "asyncio.Future[Any]") -> None:
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+
+            task.add_done_callback(_forget)
+
+        result: T = await asyncio.shield(task)
+        return copier(result)
+
+
+class CoalescingDataProvider(DataProvider):
+    """
+    Collapse concurrent identical calls to a data provider into one.
+
+    Sits between the tools and the (cached) provider so a burst of clients
+    asking for the same series at once costs a single fetch.
+    """
+
+    def __init__(self, provider: DataProvider) -> None:
+        """
+        Initialize the coalescing layer.
+
+        Args:
+            provider: Data provider to coalesce calls to
+        """
+        self.provider = provider
+        self.full_history = provider.full_history
+        self.columnar = provider.columnar
+        self.accepts_updates = provider.accepts_updates
+        self.flight = SingleFlight()
+
+    @property
+    def deduplicated(self) -> int:
+        """Number of calls served by another caller's in-flight fetch."""
+        return self.flight.deduplicated
+
+    def stats(self) -> Dict[str, int]:
+        """Return coalescing counters."""
+        return {
+            "calls": self.flight.calls,
+            "deduplicated": self.flight.deduplicated,
+            "in_flight": self.flight.in_flight,
+        }
+
+    async def get_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get series data, sharing any identical in-flight fetch."""
+        return await self.flight.do(
+            ("get_series", series_id, start_year, end_year),
+            lambda: self.provider.get_series(series_id, start_year, end_year),
+            copy_result,
+        )
+
+    async def iter_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a series from the wrapped provider without coalescing."""
+        async for chunk in self.provider.iter_series(
+            series_id, start_year, end_year, page_size
+        ):
+            yield chunk
+
+    async def get_columns(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> SeriesColumns:
+        """
+        Get series columns.
+
+        Columnar providers are asked directly; otherwise the columns are
+        built from a coalesced ``get_series`` call.
+        """
+        if self.provider.columnar:
+            return await self.provider.get_columns(series_id, start_year, end_year)
+        return await super().get_columns(series_id, start_year, end_year)
+
+    async def list_series(
+        self, category: Optional[str] = None, limit: int = 50, **filters: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """List series, sharing any identical in-flight call."""
+        return await self.flight.do(
+            ("list_series", category, limit, *sorted(filters.items())),
+            lambda: self.provider.list_series(
+                category=category, limit=limit, **filters
+            ),
+        )
+
+    async def list_series_page(
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        **filters: Optional[str],
+    ) -> Dict[str, Any]:
+        """List a page of series, sharing any identical in-flight call."""
+        return await self.flight.do(
+            ("list_series_page", category, limit, cursor, *sorted(filters.items())),
+            lambda: self.provider.list_series_page(
+                category=category, limit=limit, cursor=cursor, **filters
+            ),
+        )
+
+    async def get_series_info(self, series_id: str) -> Dict[str, Any]:
+        """Get series metadata, sharing any identical in-flight call."""
+        return await self.flight.do(
+            ("get_series_info", series_id),
+            lambda: self.provider.get_series_info(series_id),
+        )
+
+    async def search_series(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search series, sharing any identical in-flight call."""
+        return await self.flight.do(
+            ("search_series", query, limit),
+            lambda: self.provider.search_series(query, limit=limit),
+        )
+
+    async def warm(self) -> None:
+        """Warm the wrapped provider."""
+        await self.provider.warm()
+
+    async def apply_updates(self, updates: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """Update the wrapped provider."""
+        return await self.provider.apply_updates(updates)
+
+    async def aclose(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.aclose()
@@ -0,0 +1,183 @@
+"""Derived series (percent changes) materialized next to the raw columns."""
+
+import math
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .series_store import PERIODS_PER_YEAR, SeriesColumns, period_ordinal
+
+# Transforms get_series can return, as named in its ``transform`` argument:
+# year-over-year, period-over-period (month-over-month for monthly series)
+# and the change over the last quarter of a year, compounded to an annual rate
+TRANSFORMS = ("yoy", "mom", "annualized_3m")
+
+# Decimal places kept in transformed values
+PRECISION = 3
+
+
+def _lag_spec(transform: str, periods_per_year: int) -> Optional[Tuple[int, float]]:
+    """
+    Return ``(lag, exponent)`` for a transform at a given frequency.
+
+    The transform is ``((value / value[-lag]) ** exponent - 1) * 100``, or
+    None when the frequency is too coarse for it.
+
+    Raises:
+        ValueError: If the transform is unknown
+    """
+    if transform == "yoy":
+        return periods_per_year, 1.0
+    if transform == "mom":
+        return 1, 1.0
+    if transform == "annualized_3m":
+        if periods_per_year < 4:
+            return None
+        lag = periods_per_year // 4
+        return lag, periods_per_year / lag
+    raise ValueError(f"Unknown transform: {transform}")
+
+
+class DerivedColumns:
+    """
+    Transformed values of one series, row-aligned with its ``SeriesColumns``.
+
+    Each transform is a float array with one entry per row (NaN where it is
+    undefined, e.g. before the first full year or for M13 averages). A value
+    depends only on earlier rows, so when observations are appended or
+    revised only the rows from the first change onward are recomputed.
+    """
+
+    __slots__ = ("columns", "periods_per_year", "_values")
+
+    def __init__(self, columns: SeriesColumns) -> None:
+        """
+        Compute every transform for a series.
+
+        Args:
+            columns: Series columns to derive from
+        """
+        self.columns = columns
+        self.periods_per_year = 1
+        self._values: Dict[str, "array[float]"] = {name: array("d") for name in TRANSFORMS}
+        self.extend()
+
+    def __len__(self) -> int:
+        return len(self._values[TRANSFORMS[0]])
+
+    def copy(self, columns: SeriesColumns) -> "DerivedColumns":
+        """Return a copy bound to ``columns``, a copy of this series' columns."""
+        clone = DerivedColumns.__new__(DerivedColumns)
+        clone.columns = columns
+        clone.periods_per_year = self.periods_per_year
+        clone._values = {name: array("d", values) for name, values in self._values.items()}
+        return clone
+
+    def values(self, transform: str) -> "array[float]":
+        """
+        Return a transform's values in ascending row order.
+
+        Raises:
+            ValueError: If the transform is unknown
+        """
+        if transform not in self._values:
+            raise ValueError(f"Unknown transform: {transform}")
+        return self._values[transform]
+
+    def invalidate_from(self, row: int) -> None:
+        """Recompute every row from ``row`` on, after the columns changed there."""
+        for values in self._values.values():
+            del values[row:]
+        self.extend()
+
+    def extend(self) -> None:
+        """Compute the rows added to the columns since the last call."""
+        columns = self.columns
+        start, end = len(self), len(columns)
+        if start >= end:
+            return
+
+        periods = columns.periods
+        self.periods_per_year = PERIODS_PER_YEAR.get(periods[end - 1][:1], 1)
+        ppy = self.periods_per_year
+        ordinals = columns.ordinals
+        raw = columns.values
+        nan = math.nan
+
+        for name, out in self._values.items():
+            spec = _lag_spec(name, ppy)
+            if spec is None:
+                out.extend([nan] * (end - start))
+                continue
+            lag, exponent = spec
+            for i in range(start, end):
+                ordinal = ordinals[i]
+                number = ordinal % 100
+                if not 1 <= number <= ppy:
+                    out.append(nan)
+                    continue
+                # Step back ``lag`` periods and find that observation
+                t = (ordinal // 100) * ppy + number - 1 - lag
+                target = (t // ppy) * 100 + t % ppy + 1
+                j = bisect_left(ordinals, target, 0, i)
+                if j == i or ordinals[j] != target:
+                    out.append(nan)
+                    continue
+                previous = raw[j]
+                if previous == 0 or previous != previous:
+                    out.append(nan)
+                    continue
+                out.append(((raw[i] / previous) ** exponent - 1.0) * 100.0)
+
+
+def derived_columns(columns: SeriesColumns) -> DerivedColumns:
+    """Return a series' derived columns, materializing them on first use."""
+    if columns.derived is None:
+        columns.derived = DerivedColumns(columns)
+    return columns.derived
+
+
+def materialize(store: Iterable[SeriesColumns]) -> int:
+    """
+    Materialize the derived columns of every series in a store.
+
+    Returns:
+        Number of series materialized
+    """
+    count = 0
+    for columns in store:
+        derived_columns(columns)
+        count += 1
+    return count
+
+
+def annotate(
+    points: List[Dict[str, Any]], columns: SeriesColumns, transform: str
+) -> List[Dict[str, Any]]:
+    """
+    Add a transform's value to each data point as ``<transform>_pct``.
+
+    Points are copied, not modified. ``columns`` must cover the points and
+    should reach a year before them, so the earliest points have values.
+
+    Args:
+        points: BLS data point dictionaries
+        columns: Columns of the same series
+        transform: One of ``TRANSFORMS``
+
+    Returns:
+        New data point dictionaries
+
+    Raises:
+        ValueError: If the transform is unknown
+    """
+    values = derived_columns(columns).values(transform)
+    ordinals = columns.ordinals
+    key = f"{transform}_pct"
+    annotated = []
+    for point in points:
+        ordinal = period_ordinal(int(point["year"]), point["period"])
+        i = bisect_left(ordinals, ordinal)
+        value = values[i] if i < len(values) and ordinals[i] == ordinal else math.nan
+        annotated.append({**point, key: None if value != value else round(value, PRECISION)})
+    return annotated
@@ -0,0 +1,151 @@
+"""Timing of data provider calls for server metrics."""
+
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..metrics import ServerMetrics, record_phase
+from .base import DataProvider
+from .series_store import SeriesColumns
+
+
+class InstrumentedDataProvider(DataProvider):
+    """
+    Record the latency of every call to a data provider.
+
+    Each call is observed in the ``bls_mcp_provider_call_seconds`` histogram
+    and added to the provider phase of the tool call it was made for. As the
+    outermost layer, the time includes waiting on a coalesced fetch or the
+    cache, which is what the calling tool experiences.
+    """
+
+    def __init__(self, provider: DataProvider, metrics: ServerMetrics) -> None:
+        """
+        Initialize the instrumentation layer.
+
+        Args:
+            provider: Data provider to time
+            metrics: Metrics to record into
+        """
+        self.provider = provider
+        self.full_history = provider.full_history
+        self.columnar = provider.columnar
+        self.accepts_updates = provider.accepts_updates
+        self.metrics = metrics
+
+    def _record(self, method: str, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        self.metrics.provider_seconds.observe(elapsed, method)
+        record_phase("provider", elapsed)
+
+    async def get_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get series data from the wrapped provider."""
+        start = time.perf_counter()
+        try:
+            return await self.provider.get_series(series_id, start_year, end_year)
+        finally:
+            self._record("get_series", start)
+
+    async def iter_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a series from the wrapped provider.
+
+        Only the time spent producing chunks is recorded, not the time the
+        consumer spends between them.
+        """
+        chunks = self.provider.iter_series(series_id, start_year, end_year, page_size)
+        spent = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    spent += time.perf_counter() - start
+                yield chunk
+        finally:
+            self.metrics.provider_seconds.observe(spent, "iter_series")
+            record_phase("provider", spent)
+
+    async def get_columns(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> SeriesColumns:
+        """Get series columns from the wrapped provider."""
+        start = time.perf_counter()
+        try:
+            return await self.provider.get_columns(series_id, start_year, end_year)
+        finally:
+            self._record("get_columns", start)
+
+    async def list_series(
+        self, category: Optional[str] = None, limit: int = 50, **filters: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """List series from the wrapped provider."""
+        start = time.perf_counter()
+        try:
+            return await self.provider.list_series(
+                category=category, limit=limit, **filters
+            )
+        finally:
+            self._record("list_series", start)
+
+    async def list_series_page(
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        **filters: Optional[str],
+    ) -> Dict[str, Any]:
+        """List a page of series from the wrapped provider."""
+        start = time.perf_counter()
+        try:
+            return await self.provider.list_series_page(
+                category=category, limit=limit, cursor=cursor, **filters
+            )
+        finally:
+            self._record("list_series_page", start)
+
+    async def get_series_info(self, series_id: str) -> Dict[str, Any]:
+        """Get series metadata from the wrapped provider."""
+        start = time.perf_counter()
+        try:
+            return await self.provider.get_series_info(series_id)
+        finally:
+            self._record("get_series_info", start)
+
+    async def search_series(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Search series in the wrapped provider."""
+        start = time.perf_counter()
+        try:
+            return await self.provider.search_series(query, limit=limit)
+        finally:
+            self._record("search_series", start)
+
+    async def warm(self) -> None:
+        """Warm the wrapped provider."""
+        await self.provider.warm()
+
+    async def apply_updates(
+        self, updates: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        """Update the wrapped provider."""
+        return await self.provider.apply_updates(updates)
+
+    async def aclose(self) -> None:
+        """Close the wrapped provider."""
+        await self.provider.aclose()
@@ -1,18 +1,84 @@
 """Mock data provider for BLS MCP server."""
 
+import asyncio
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional
 
+from ..utils.logger import get_logger
+from ..utils.pagination import cursor_scope, decode_cursor, encode_cursor
+from .base import DataProvider
+from .binary_store import BinarySeriesStore, compile_fixture_file
+from .catalog import SeriesCatalogIndex
+from .derived import materialize
+from .search import SeriesSearchIndex
+from .series_store import LayeredSeriesStore, SeriesColumns, build_series_store
 
-class MockDataProvider:
+logger = get_logger(__name__)
+
+# Append-only log of applied updates, replayed over the fixtures on load
+JOURNAL_NAME = "historical_updates.jsonl"
+
+BUNDLED_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def default_cache_dir(fixtures_dir: Path) -> Path:
+    """
+    Return a user-writable directory for files derived from a fixtures directory.
+
+    The base is ``BLS_MCP_CACHE_DIR``, else ``$XDG_CACHE_HOME/bls-mcp``, else
+    ``~/.cache/bls-mcp``; each fixtures directory gets its own subdirectory.
+    """
+    base = os.getenv("BLS_MCP_CACHE_DIR")
+    if base:
+        root = Path(base).expanduser()
+    else:
+        root = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "bls-mcp"
+    digest = hashlib.sha1(str(fixtures_dir.resolve()).encode()).hexdigest()[:12]
+    return root / digest
+
+
+class MockDataProvider(DataProvider):
     """Provides mock BLS data for testing and development."""
 
-    def __init__(self) -> None:
-        """Initialize mock data provider."""
-        self.fixtures_dir = Path(__file__).parent / "fixtures"
+    columnar = True
+    accepts_updates = True
+
+    def __init__(
+        self,
+        fixtures_dir: Optional[Path] = None,
+        journal: bool = True,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize mock data provider.
+
+        Args:
+            fixtures_dir: Directory holding the JSON fixtures. Defaults to the
+                fixtures bundled with the package.
+            journal: Record applied updates in the cache directory so they
+                survive a restart
+            cache_dir: Directory for files derived from the fixtures: the
+                compiled dataset and the update journal. Defaults to the
+                fixtures directory for custom fixtures, and to
+                ``default_cache_dir`` for the bundled ones, so the installed
+                package is never written to.
+        """
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else BUNDLED_FIXTURES_DIR
+        if cache_dir is None:
+            cache_dir = (
+                self.fixtures_dir if fixtures_dir else default_cache_dir(self.fixtures_dir)
+            )
+        self.cache_dir = Path(cache_dir)
+        self.journal = journal
+        # Incremented each time updated data is published
+        self.data_version = 0
         self._series_catalog: Optional[Dict[str, Any]] = None
-        self._historical_data: Optional[Dict[str, Any]] = None
+        self._historical_data: Optional[Mapping[str, SeriesColumns]] = None
+        self._catalog_index: Optional[SeriesCatalogIndex] = None
+        self._search_index: Optional[SeriesSearchIndex] = None
 
     def _load_series_catalog(self) -> Dict[str, Any]:
         """Load series catalog from JSON fixture."""
@@ -22,14 +88,199 @@ class MockDataProvider:
                 self._series_catalog = json.load(f)
         return self._series_catalog
 
-    def _load_historical_data(self) -> Dict[str, Any]:
-        """Load historical data from JSON fixture."""
+    def _get_catalog_index(self) -> SeriesCatalogIndex:
+        """Return the catalog index, building it on first use."""
+        if self._catalog_index is None:
+            catalog = self._load_series_catalog()
+            self._catalog_index = SeriesCatalogIndex(catalog["series"])
+        return self._catalog_index
+
+    def _get_search_index(self) -> SeriesSearchIndex:
+        """Return the full-text search index, building it on first use."""
+        if self._search_index is None:
+            self._search_index = SeriesSearchIndex(self._get_catalog_index().series)
+        return self._search_index
+
+    def _load_historical_data(self) -> Mapping[str, SeriesColumns]:
+        """
+        Load historical data into columnar storage.
+
+        A compiled ``historical_data.bin``, next to the JSON fixture or in the
+        cache directory, is memory-mapped when it is at least as new as the
+        JSON fixture; otherwise the JSON fixture is parsed in full. Updates
+        recorded in the journal are replayed on top.
+        """
         if self._historical_data is None:
             data_path = self.fixtures_dir / "historical_data.json"
-            with open(data_path, "r") as f:
-                self._historical_data = json.load(f)
+            store: Optional[Mapping[str, SeriesColumns]] = self._open_binary()
+            if store is None:
+                with open(data_path, "r") as f:
+                    store = build_series_store(json.load(f))
+            self._historical_data = self._replay_journal(store)
         return self._historical_data
 
+    def _replay_journal(self, store: Mapping[str, SeriesColumns]) -> Mapping[str, SeriesColumns]:
+        """Layer the series changed by journaled updates over a loaded store."""
+        journal_path = self.cache_dir / JOURNAL_NAME
+        if not journal_path.exists():
+            return store
+
+        updated: Dict[str, SeriesColumns] = {}
+        with open(journal_path, "r") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    series_id = entry["series_id"]
+                except (ValueError, KeyError, TypeError):
+                    # A write cut short by a crash; appends after it start on
+                    # a fresh line, so later entries are still good
+                    logger.warning("Skipping torn line %s of %s", number, journal_path)
+                    continue
+                columns = updated.get(series_id)
+                if columns is None:
+                    columns = (
+                        store[series_id].copy()
+                        if series_id in store
+                        else SeriesColumns.from_points(series_id, [])
+                    )
+                    updated[series_id] = columns
+                # Workers sharing the fixtures may each journal the same release
+                points = columns.changed_points(entry["data"])
+                if points:
+                    columns.merge_points(points)
+        return LayeredSeriesStore(store, updated) if updated else store
+
+    def _append_journal(self, entries: List[Dict[str, Any]]) -> None:
+        """Append applied updates to the journal, one JSON line per series."""
+        lines = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        data = lines.encode()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / JOURNAL_NAME, "ab+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell():
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # The previous append was cut short; end its line first
+                    data = b"\n" + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _open_binary(self) -> Optional[BinarySeriesStore]:
+        """
+        Map the first compiled fixture that is current and readable, if any.
+
+        A compiled file that is empty, truncated or from another format
+        version is skipped with a warning, so the JSON fixture still loads.
+        """
+        data_path = self.fixtures_dir / "historical_data.json"
+        for directory in (self.fixtures_dir, self.cache_dir):
+            binary_path = directory / "historical_data.bin"
+            try:
+                if data_path.exists() and (
+                    binary_path.stat().st_mtime < data_path.stat().st_mtime
+                ):
+                    continue
+                return BinarySeriesStore(binary_path)
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring compiled fixture %s: %s", binary_path, e)
+        return None
+
+    def ensure_compiled(self) -> Path:
+        """
+        Compile ``historical_data.bin`` into the cache directory if no current,
+        readable compiled fixture exists.
+
+        Run once before starting worker processes: each worker then
+        memory-maps the same file, so the dataset is held once in the OS
+        page cache rather than parsed into every process.
+
+        Returns:
+            Path to the compiled fixture
+
+        Raises:
+            OSError: If the cache directory is not writable
+        """
+        store = self._open_binary()
+        if store is not None:
+            store.close()
+            return store.path
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        binary_path = self.cache_dir / "historical_data.bin"
+        compile_fixture_file(self.fixtures_dir / "historical_data.json", binary_path)
+        return binary_path
+
+    async def warm(self) -> None:
+        """
+        Load the dataset, build the catalog and search indexes, and
+        materialize the derived series.
+
+        Derived series of a memory-mapped store are left to be materialized
+        as each series is decoded, so warming does not decode the whole file.
+        """
+        historical = self._load_historical_data()
+        self._get_search_index()
+        base = historical.base if isinstance(historical, LayeredSeriesStore) else historical
+        if isinstance(base, dict):
+            materialize(historical.values())
+
+    async def apply_updates(self, updates: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
+        """
+        Merge new and revised observations, publishing them all at once.
+
+        Each changed series is merged into a copy of its columns (derived
+        values are copied too and recomputed only from the first changed
+        row), and the copies are published by swapping in a new layered
+        store. Requests holding the previous columns, such as a stream in
+        progress, finish on a consistent old version; nothing is locked.
+        Points identical to stored rows are ignored, so replaying a release
+        changes nothing. Applied points are then appended to the journal.
+
+        Args:
+            updates: Series ID to BLS data points
+
+        Returns:
+            Series ID to the first changed row, for each series that changed
+        """
+        historical = self._load_historical_data()
+        replaced: Dict[str, SeriesColumns] = {}
+        changed: Dict[str, int] = {}
+        entries: List[Dict[str, Any]] = []
+
+        for series_id, points in updates.items():
+            current = historical[series_id] if series_id in historical else None
+            if current is None:
+                columns = SeriesColumns.from_points(series_id, [])
+            else:
+                points = current.changed_points(points)
+                if not points:
+                    continue
+                columns = current.copy()
+            changed[series_id] = columns.merge_points(points)
+            replaced[series_id] = columns
+            entries.append({"series_id": series_id, "data": points})
+
+        if not replaced:
+            return {}
+
+        # Publish: one reference swap, with no await since the store was read
+        if isinstance(historical, LayeredSeriesStore):
+            self._historical_data = historical.replace(replaced)
+        else:
+            self._historical_data = LayeredSeriesStore(historical, replaced)
+        self.data_version += 1
+
+        if self.journal:
+            try:
+                await asyncio.to_thread(self._append_journal, entries)
+            except OSError as e:
+                logger.warning("Could not journal updates, they will not survive a restart: %s", e)
+        return changed
+
     async def get_series(
         self,
         series_id: str,
@@ -55,26 +306,11 @@ class MockDataProvider:
         if series_id not in historical:
             raise ValueError(f"Series '{series_id}' not found in mock data")
 
-        series_data = historical[series_id]
-        data_points = series_data["data"]
-
-        # Filter by year range if specified
-        if start_year is not None or end_year is not None:
-            filtered_points = []
-            for point in data_points:
-                year = int(point["year"])
-                if start_year and year < start_year:
-                    continue
-                if end_year and year > end_year:
-                    continue
-                filtered_points.append(point)
-            data_points = filtered_points
+        # Binary search the time-sorted columns for the year range
+        data_points = historical[series_id].rows(start_year, end_year)
 
         # Get series metadata
-        catalog = self._load_series_catalog()
-        metadata = next(
-            (s for s in catalog["series"] if s["series_id"] == series_id), {}
-        )
+        metadata = self._get_catalog_index().get(series_id) or {}
 
         return {
             "series_id": series_id,
@@ -83,32 +319,143 @@ class MockDataProvider:
             "count": len(data_points),
         }
 
+    async def iter_series(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a series as a header chunk followed by pages of data points.
+
+        Pages are built from the columnar store one at a time, so memory use
+        does not depend on the length of the series.
+
+        Raises:
+            ValueError: If series not found
+        """
+        historical = self._load_historical_data()
+
+        if series_id not in historical:
+            raise ValueError(f"Series '{series_id}' not found in mock data")
+
+        columns = historical[series_id]
+        lo, hi = columns.year_slice(start_year, end_year)
+        yield {
+            "series_id": series_id,
+            "metadata": self._get_catalog_index().get(series_id) or {},
+            "count": hi - lo,
+        }
+        for page in columns.iter_pages(lo, hi, page_size):
+            yield {"data": page}
+
+    async def get_columns(
+        self,
+        series_id: str,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> SeriesColumns:
+        """
+        Get the stored columns for a series, covering its full history.
+
+        Raises:
+            ValueError: If series not found
+        """
+        historical = self._load_historical_data()
+
+        if series_id not in historical:
+            raise ValueError(f"Series '{series_id}' not found in mock data")
+        return historical[series_id]
+
     async def list_series(
-        self, category: Optional[str] = None, limit: int = 50
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        survey_name: Optional[str] = None,
+        area: Optional[str] = None,
+        item: Optional[str] = None,
+        seasonality: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         List available series with optional filtering.
 
+        Filters are case-insensitive exact matches and are combined with AND.
+
         Args:
             category: Optional category filter (e.g., 'CPI')
             limit: Maximum number of results
+            survey_name: Optional survey name filter
+            area: Optional area filter (e.g., 'U.S. City Average')
+            item: Optional item filter (e.g., 'Food')
+            seasonality: Optional seasonality filter
 
         Returns:
             List of series metadata dictionaries
         """
-        catalog = self._load_series_catalog()
-        series_list = catalog["series"]
-
-        # Filter by category if specified
-        if category:
-            series_list = [
-                s for s in series_list if s.get("category", "").upper() == category.upper()
-            ]
+        series_list = self._get_catalog_index().find(
+            category=category or None,
+            survey_name=survey_name or None,
+            area=area or None,
+            item=item or None,
+            seasonality=seasonality or None,
+        )
 
         # Apply limit
-        series_list = series_list[:limit]
+        return series_list[:limit]
+
+    async def list_series_page(
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        survey_name: Optional[str] = None,
+        area: Optional[str] = None,
+        item: Optional[str] = None,
+        seasonality: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        List one page of series, continuing from a cursor.
+
+        The cursor is an offset into the catalog index's match list for the
+        filters, which is built once per filter combination, so each page
+        costs O(limit) regardless of its position.
+
+        Args:
+            category: Optional category filter (e.g., 'CPI')
+            limit: Page size
+            cursor: ``next_cursor`` of the previous page, or None for the first
+            survey_name: Optional survey name filter
+            area: Optional area filter
+            item: Optional item filter
+            seasonality: Optional seasonality filter
+
+        Returns:
+            Dictionary with ``series``, ``next_cursor`` (None on the last
+            page) and ``total``
+
+        Raises:
+            ValueError: If the cursor is invalid or from another query
+        """
+        filters = {
+            "category": category or None,
+            "survey_name": survey_name or None,
+            "area": area or None,
+            "item": item or None,
+            "seasonality": seasonality or None,
+        }
+        scope = cursor_scope("list_series", **filters)
+        offset = decode_cursor(cursor, scope) if cursor else 0
 
-        return series_list
+        index = self._get_catalog_index()
+        series = list(index.iter_page(offset, limit, **filters))
+        total = index.count(**filters)
+        end = offset + len(series)
+        return {
+            "series": series,
+            "next_cursor": encode_cursor(end, scope) if end < total else None,
+            "total": total,
+        }
 
     async def get_series_info(self, series_id: str) -> Dict[str, Any]:
         """
@@ -123,48 +470,39 @@ class MockDataProvider:
         Raises:
             ValueError: If series not found
         """
-        catalog = self._load_series_catalog()
-
-        for series in catalog["series"]:
-            if series["series_id"] == series_id:
-                # Get data point count
-                historical = self._load_historical_data()
-                data_count = 0
-                if series_id in historical:
-                    data_count = len(historical[series_id]["data"])
+        series = self._get_catalog_index().get(series_id)
+        if series is None:
+            raise ValueError(f"Series '{series_id}' not found")
 
-                return {
-                    **series,
-                    "data_point_count": data_count,
-                    "available_data": series_id in historical,
-                }
+        # Get data point count
+        historical = self._load_historical_data()
+        data_count = 0
+        if isinstance(historical, (BinarySeriesStore, LayeredSeriesStore)):
+            # Read the count from the index without decoding the series
+            if series_id in historical:
+                data_count = historical.row_count(series_id)
+        elif series_id in historical:
+            data_count = len(historical[series_id])
 
-        raise ValueError(f"Series '{series_id}' not found")
+        return {
+            **series,
+            "data_point_count": data_count,
+            "available_data": series_id in historical,
+        }
 
     async def search_series(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
-        Search for series by title or description.
+        Search for series by title, item, area, survey and category.
+
+        Results are ranked with BM25; query words also match as prefixes.
 
         Args:
             query: Search query string
             limit: Maximum number of results
 
         Returns:
-            List of matching series
+            List of matching series, best match first
         """
-        catalog = self._load_series_catalog()
-        query_lower = query.lower()
-
-        results = []
-        for series in catalog["series"]:
-            # Search in title and item fields
-            title = series.get("series_title", "").lower()
-            item = series.get("item", "").lower()
-
-            if query_lower in title or query_lower in item:
-                results.append(series)
-
-            if len(results) >= limit:
-                break
-
-        return results
+        return [
+            series for series, _ in self._get_search_index().search(query, limit=limit)
+        ]
@@ -0,0 +1,222 @@
+"""Incremental refresh of provider data from a source of new releases."""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..utils.logger import get_logger
+from .base import DataProvider
+
+logger = get_logger(__name__)
+
+# Series ID to the new or revised data points of one release
+Updates = Dict[str, List[Dict[str, Any]]]
+
+
+def parse_release(content: Dict[str, Any]) -> Updates:
+    """
+    Read a release payload into updates.
+
+    Releases use the ``historical_data.json`` layout, a mapping of series ID
+    to ``{"series_id", "data"}``; a bare list of points per series is also
+    accepted.
+
+    Raises:
+        ValueError: If the payload is not a mapping of series to points, or
+            a point lacks a valid ``year``, ``period`` or ``value``
+    """
+    if not isinstance(content, dict):
+        raise ValueError("Release must map series IDs to data points")
+    updates: Updates = {}
+    for series_id, entry in content.items():
+        points = entry.get("data") if isinstance(entry, dict) else entry
+        if not isinstance(points, list):
+            raise ValueError(f"Release entry for '{series_id}' has no data points")
+        for point in points:
+            _check_point(series_id, point)
+        updates[series_id] = points
+    return updates
+
+
+def _check_point(series_id: str, point: Any) -> None:
+    """Raise ValueError unless a release point has the fields merging needs."""
+    if not isinstance(point, dict):
+        raise ValueError(f"Release entry for '{series_id}' has a non-object point")
+    missing = [name for name in ("year", "period", "value") if name not in point]
+    if missing:
+        raise ValueError(
+            f"Release point for '{series_id}' is missing {', '.join(missing)}"
+        )
+    try:
+        int(point["year"])
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Release point for '{series_id}' has invalid year {point['year']!r}"
+        ) from None
+    if not isinstance(point["period"], str) or not point["period"]:
+        raise ValueError(
+            f"Release point for '{series_id}' has invalid period {point['period']!r}"
+        )
+
+
+class ReleaseFeed(ABC):
+    """Source of data releases the refresher polls."""
+
+    @abstractmethod
+    def poll(self) -> List[Tuple[str, Updates]]:
+        """
+        Return the releases published since the last poll.
+
+        Called from a worker thread, so implementations may block on I/O.
+
+        Returns:
+            ``(name, updates)`` pairs, oldest first
+        """
+        pass
+
+    def acknowledge(self, name: str) -> None:
+        """
+        Record that a release returned by ``poll`` has been applied.
+
+        Releases that are not acknowledged may be returned again.
+        """
+
+
+class ReleaseDirectory(ReleaseFeed):
+    """
+    Watch a directory of release files.
+
+    Every ``*.json`` file is a release. A file is read when it first
+    appears and again whenever its size or modification time changes, so
+    a release can be revised by rewriting its file. Files are applied in
+    name order; dated names (``2024-11.json``) keep releases in sequence.
+    A file is only marked as seen once it has been applied, or once it has
+    been read in full and rejected as malformed.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize the feed.
+
+        Args:
+            path: Directory to watch; it need not exist yet
+        """
+        self.path = Path(path)
+        self._seen: Dict[str, Tuple[int, int]] = {}
+        # Signatures of files returned by poll and not yet acknowledged
+        self._pending: Dict[str, Tuple[int, int]] = {}
+
+    def poll(self) -> List[Tuple[str, Updates]]:
+        """Return the releases whose files are new or changed."""
+        if not self.path.is_dir():
+            return []
+
+        releases = []
+        for file in sorted(self.path.glob("*.json")):
+            try:
+                stat = file.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if self._seen.get(file.name) == signature:
+                    continue
+                with open(file, "r") as f:
+                    content = json.load(f)
+            except (OSError, ValueError) as e:
+                # Possibly still being written; retry on the next poll
+                logger.warning("Skipping release %s: %s", file.name, e)
+                continue
+            try:
+                updates = parse_release(content)
+            except ValueError as e:
+                # Complete but malformed; skip it until the file is rewritten
+                logger.error("Rejected release %s: %s", file.name, e)
+                self._seen[file.name] = signature
+                continue
+            self._pending[file.name] = signature
+            releases.append((file.name, updates))
+        return releases
+
+    def acknowledge(self, name: str) -> None:
+        """Mark a polled file as seen, until its size or modification time changes."""
+        signature = self._pending.pop(name, None)
+        if signature is not None:
+            self._seen[name] = signature
+
+
+class DataRefresher:
+    """
+    Poll a release feed and apply new data to a provider.
+
+    The provider applies updates copy-on-write and publishes each release
+    with a single reference swap, so requests are never blocked and never
+    see a half-applied release.
+    """
+
+    def __init__(
+        self, provider: DataProvider, feed: ReleaseFeed, interval: float = 60.0
+    ) -> None:
+        """
+        Initialize the refresher.
+
+        Args:
+            provider: Provider stack to update (its cache layers are
+                invalidated for the series that change)
+            feed: Source of releases
+            interval: Seconds between polls
+        """
+        self.provider = provider
+        self.feed = feed
+        self.interval = interval
+        self.releases = 0
+        self.series_updated = 0
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def refresh(self) -> Dict[str, int]:
+        """
+        Apply every release published since the last call.
+
+        A release that fails to apply is logged and left unacknowledged, so
+        it is retried on the next call; later releases are still applied.
+
+        Returns:
+            Series ID to the first changed row, for each series that changed
+        """
+        changed: Dict[str, int] = {}
+        for name, updates in await asyncio.to_thread(self.feed.poll):
+            try:
+                applied = await self.provider.apply_updates(updates)
+            except Exception as e:
+                logger.error("Could not apply release %s: %s", name, e)
+                continue
+            self.feed.acknowledge(name)
+            for series_id, row in applied.items():
+                changed[series_id] = min(row, changed.get(series_id, row))
+            self.releases += 1
+            logger.info("Applied release %s: %s series changed", name, len(applied))
+        self.series_updated += len(changed)
+        return changed
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("Data refresh failed: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start polling in the background."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling; a release cut short is either fully published or not at all."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
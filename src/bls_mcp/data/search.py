@@ -0,0 +1,217 @@
+"""Inverted-index full-text search over the series catalog."""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Catalog fields that are searchable, with their term-frequency weight
+SEARCH_FIELDS = {
+    "series_title": 1.0,
+    "item": 2.0,
+    "area": 1.0,
+    "survey_name": 0.5,
+    "category": 1.5,
+    "series_id": 1.0,
+}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Blocks of postings read per term before a query whose top results do not
+# stand out from the rest falls back to scoring every matching document
+MAX_ROUNDS = 8
+
+# Score multiplier for terms matched by prefix rather than exactly
+PREFIX_WEIGHT = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SeriesSearchIndex:
+    """
+    BM25-ranked inverted index over catalog entries.
+
+    Each term keeps two posting lists: one ordered by impact (the term's
+    BM25 contribution to a document), read from the head to collect
+    candidates, and one ordered by document, used to score those candidates
+    exactly. Candidates are collected with the threshold algorithm: lists
+    are read a block at a time until the k-th best score reaches the sum of
+    the impacts at the current read positions, which bounds the score of
+    every document not yet seen. Queries whose top results do not separate
+    from the rest within a few blocks score every matching document
+    instead, so rankings are always exact.
+    """
+
+    def __init__(self, series: Iterable[Dict[str, Any]], depth: int = 50) -> None:
+        """
+        Build the index.
+
+        Args:
+            series: Series metadata dictionaries
+            depth: Minimum number of postings read per query term per round
+        """
+        self._series: List[Dict[str, Any]] = list(series)
+        self.depth = depth
+
+        doc_terms: List[Counter] = []
+        doc_lengths: List[int] = []
+        for entry in self._series:
+            weighted: Counter = Counter()
+            length = 0
+            for field, weight in SEARCH_FIELDS.items():
+                tokens = tokenize(str(entry.get(field, "")))
+                length += len(tokens)
+                for token in tokens:
+                    weighted[token] += weight
+            doc_terms.append(weighted)
+            doc_lengths.append(length)
+
+        n_docs = len(self._series)
+        avg_length = sum(doc_lengths) / n_docs if n_docs else 0.0
+
+        raw: Dict[str, List[Tuple[int, float]]] = {}
+        for doc, weighted in enumerate(doc_terms):
+            for term, tf in weighted.items():
+                raw.setdefault(term, []).append((doc, tf))
+
+        # term -> (docs by impact, impacts desc, docs ascending, impacts by doc)
+        self._postings: Dict[
+            str, Tuple["array[int]", "array[float]", "array[int]", "array[float]"]
+        ] = {}
+        for term, postings in raw.items():
+            df = len(postings)
+            idf = math.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+            scored = []
+            for doc, tf in postings:
+                norm = 1.0 - B + B * doc_lengths[doc] / avg_length if avg_length else 1.0
+                scored.append((doc, idf * tf * (K1 + 1.0) / (tf + K1 * norm)))
+
+            by_doc = array("i", (doc for doc, _ in scored))
+            by_doc_impacts = array("f", (impact for _, impact in scored))
+            scored.sort(key=lambda posting: -posting[1])
+            self._postings[term] = (
+                array("i", (doc for doc, _ in scored)),
+                array("f", (impact for _, impact in scored)),
+                by_doc,
+                by_doc_impacts,
+            )
+
+        self._vocabulary = sorted(self._postings)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def _expand(self, token: str, max_expansions: int) -> List[Tuple[str, float]]:
+        """Return (term, weight) pairs matching a query token."""
+        terms: List[Tuple[str, float]] = []
+        if token in self._postings:
+            terms.append((token, 1.0))
+
+        start = bisect_left(self._vocabulary, token)
+        for term in self._vocabulary[start : start + max_expansions + 1]:
+            if not term.startswith(token):
+                break
+            if term != token:
+                terms.append((term, PREFIX_WEIGHT))
+        return terms[: max_expansions + 1]
+
+    def _impact(self, term: str, doc: int) -> float:
+        """Return a term's BM25 contribution to a document, 0 if absent."""
+        _, _, docs, impacts = self._postings[term]
+        i = bisect_left(docs, doc)
+        if i < len(docs) and docs[i] == doc:
+            return float(impacts[i])
+        return 0.0
+
+    def search(
+        self, query: str, limit: int = 10, max_expansions: int = 20
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Rank catalog entries against a query.
+
+        Every query token matches the exact term and, at a discount, up to
+        ``max_expansions`` terms that start with it.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            max_expansions: Maximum prefix expansions per query token
+
+        Returns:
+            ``(series, score)`` pairs, best first
+        """
+        terms: Dict[str, float] = {}
+        for token in tokenize(query):
+            for term, weight in self._expand(token, max_expansions):
+                terms[term] = max(terms.get(term, 0.0), weight)
+        if not terms or limit < 1:
+            return []
+
+        best = self._threshold_top(terms, limit)
+        if best is None:
+            best = self._exhaustive_top(terms, limit)
+        best.sort(key=lambda item: (-item[0], -item[1]))
+        return [(self._series[-doc], score) for score, doc in best]
+
+    def _threshold_top(
+        self, terms: Dict[str, float], limit: int
+    ) -> Optional[List[Tuple[float, int]]]:
+        """
+        Collect the top ``limit`` ``(score, -doc)`` pairs from list heads.
+
+        Returns:
+            The pairs in heap order, or None if the ranking was not settled
+            within ``MAX_ROUNDS`` blocks per term
+        """
+        depth = max(self.depth, limit * 5)
+        positions = dict.fromkeys(terms, 0)
+        seen = set()
+        # Min-heap of the best (score, -doc) so far; the root is the weakest
+        best: List[Tuple[float, int]] = []
+        for _ in range(MAX_ROUNDS):
+            for term, position in positions.items():
+                for doc in self._postings[term][0][position : position + depth]:
+                    if doc in seen:
+                        continue
+                    seen.add(doc)
+                    score = sum(
+                        weight * self._impact(t, doc) for t, weight in terms.items()
+                    )
+                    if len(best) < limit:
+                        heapq.heappush(best, (score, -doc))
+                    elif (score, -doc) > best[0]:
+                        heapq.heapreplace(best, (score, -doc))
+                positions[term] = position + depth
+
+            # Upper bound on the score of any document not read yet
+            threshold = 0.0
+            for term, position in positions.items():
+                impacts = self._postings[term][1]
+                if position < len(impacts):
+                    threshold += terms[term] * impacts[position]
+            if threshold == 0.0 or (len(best) == limit and best[0][0] >= threshold):
+                return best
+        return None
+
+    def _exhaustive_top(
+        self, terms: Dict[str, float], limit: int
+    ) -> List[Tuple[float, int]]:
+        """Score every document containing a query term; keep the top ``limit``."""
+        scores = [0.0] * len(self._series)
+        matched = set()
+        for term, weight in terms.items():
+            _, _, docs, impacts = self._postings[term]
+            for doc, impact in zip(docs, impacts):
+                scores[doc] += weight * impact
+            matched.update(docs)
+        return heapq.nlargest(limit, ((scores[doc], -doc) for doc in matched))
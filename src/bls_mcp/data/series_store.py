@@ -0,0 +1,430 @@
+"""Columnar, time-sorted storage for BLS series observations."""
+
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# Fields every observation carries, in the order they appear in BLS payloads
+CORE_FIELDS = ("year", "period", "period_name", "value")
+
+# Ordinals pack (year, period number) into a single sortable integer
+_PERIODS_PER_YEAR = 100
+
+# Regular periods per year for each BLS period prefix; higher period
+# numbers (M13, S03) are period averages
+PERIODS_PER_YEAR = {"M": 12, "Q": 4, "S": 2, "A": 1}
+
+
+def period_number(period: str) -> int:
+    """
+    Extract the numeric part of a BLS period code.
+
+    Args:
+        period: Period code such as 'M09', 'Q02', 'S01' or 'A01'
+
+    Returns:
+        Period number, or 0 if the code has no numeric part
+    """
+    try:
+        return int(period[1:])
+    except ValueError:
+        return 0
+
+
+def period_ordinal(year: int, period: str) -> int:
+    """Return a sortable ordinal for a (year, period) pair."""
+    return year * _PERIODS_PER_YEAR + period_number(period)
+
+
+def _parse_value(value: str) -> float:
+    """Parse a BLS value string, mapping placeholders like '-' to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class SeriesColumns:
+    """
+    One series stored as parallel arrays sorted by ascending time.
+
+    Values are kept both as floats (for arithmetic) and as the original
+    strings, so rows can be rebuilt exactly as they appeared in the source.
+    Footnotes are deduplicated into a per-series table and referenced by
+    index; any other per-point keys are kept sparsely in ``extras``.
+    """
+
+    __slots__ = (
+        "series_id",
+        "ordinals",
+        "values",
+        "years",
+        "periods",
+        "period_names",
+        "value_strs",
+        "footnote_refs",
+        "footnotes",
+        "extras",
+        "descending",
+        "derived",
+    )
+
+    def __init__(
+        self,
+        series_id: str,
+        ordinals: "array[int]",
+        values: "array[float]",
+        years: List[str],
+        periods: List[str],
+        period_names: List[str],
+        value_strs: List[str],
+        footnote_refs: "array[int]",
+        footnotes: List[Any],
+        extras: Optional[Dict[int, Dict[str, Any]]] = None,
+        descending: bool = True,
+    ) -> None:
+        """
+        Initialize from prebuilt columns.
+
+        Use ``SeriesColumns.from_points`` to build from BLS data points.
+        """
+        self.series_id = series_id
+        self.ordinals = ordinals
+        self.values = values
+        self.years = years
+        self.periods = periods
+        self.period_names = period_names
+        self.value_strs = value_strs
+        self.footnote_refs = footnote_refs
+        self.footnotes = footnotes
+        self.extras = extras or {}
+        self.descending = descending
+        # Derived transforms, materialized by ``derived.derived_columns``
+        self.derived: Optional[Any] = None
+
+    @classmethod
+    def from_points(cls, series_id: str, points: List[Dict[str, Any]]) -> "SeriesColumns":
+        """
+        Build columns from a list of BLS data point dictionaries.
+
+        Args:
+            series_id: BLS series ID
+            points: Data points as found in ``historical_data.json``
+
+        Returns:
+            Time-sorted columns for the series
+        """
+        keyed = [
+            (period_ordinal(int(point["year"]), point["period"]), i)
+            for i, point in enumerate(points)
+        ]
+        # BLS payloads list the newest observation first; remember the
+        # orientation so rows come back out in the order they went in.
+        descending = len(keyed) < 2 or keyed[0][0] >= keyed[-1][0]
+        keyed.sort()
+
+        ordinals = array("i")
+        values = array("d")
+        footnote_refs = array("i")
+        years: List[str] = []
+        periods: List[str] = []
+        period_names: List[str] = []
+        value_strs: List[str] = []
+        footnotes: List[Any] = []
+        footnote_ids: Dict[str, int] = {}
+        extras: Dict[int, Dict[str, Any]] = {}
+
+        for row, (ordinal, i) in enumerate(keyed):
+            point = points[i]
+            ordinals.append(ordinal)
+            years.append(point["year"])
+            periods.append(point["period"])
+            period_names.append(point.get("period_name", ""))
+            value_strs.append(point["value"])
+            values.append(_parse_value(point["value"]))
+
+            if "footnotes" in point:
+                key = json.dumps(point["footnotes"], sort_keys=True)
+                if key not in footnote_ids:
+                    footnote_ids[key] = len(footnotes)
+                    footnotes.append(point["footnotes"])
+                footnote_refs.append(footnote_ids[key])
+            else:
+                footnote_refs.append(-1)
+
+            extra = {
+                k: v for k, v in point.items() if k not in CORE_FIELDS and k != "footnotes"
+            }
+            if extra:
+                extras[row] = extra
+
+        return cls(
+            series_id,
+            ordinals,
+            values,
+            years,
+            periods,
+            period_names,
+            value_strs,
+            footnote_refs,
+            footnotes,
+            extras,
+            descending,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def copy(self) -> "SeriesColumns":
+        """
+        Return an independent copy of the columns and their derived values.
+
+        Merging into the copy leaves this object untouched, so readers that
+        still hold it keep seeing a consistent series.
+        """
+        clone = SeriesColumns(
+            self.series_id,
+            array("i", self.ordinals),
+            array("d", self.values),
+            list(self.years),
+            list(self.periods),
+            list(self.period_names),
+            list(self.value_strs),
+            array("i", self.footnote_refs),
+            list(self.footnotes),
+            dict(self.extras),
+            self.descending,
+        )
+        if self.derived is not None:
+            clone.derived = self.derived.copy(clone)
+        return clone
+
+    def changed_points(self, points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return the points that are new to the series or differ from its rows.
+
+        Args:
+            points: BLS data point dictionaries
+
+        Returns:
+            The subset of ``points`` that merging would change
+        """
+        changed = []
+        for point in points:
+            ordinal = period_ordinal(int(point["year"]), point["period"])
+            i = bisect_left(self.ordinals, ordinal)
+            if i < len(self.ordinals) and self.ordinals[i] == ordinal and self.row(i) == point:
+                continue
+            changed.append(point)
+        return changed
+
+    def merge_points(self, points: List[Dict[str, Any]]) -> int:
+        """
+        Merge new and revised observations into the series.
+
+        Points newer than the last row are appended in place; anything else
+        (a revision or a backfill) rebuilds the columns. Derived columns are
+        recomputed from the first changed row on.
+
+        Args:
+            points: BLS data point dictionaries, in any order
+
+        Returns:
+            Index of the first row that changed, or ``len(self)`` if none did
+        """
+        incoming = SeriesColumns.from_points(self.series_id, points)
+        if not len(incoming):
+            return len(self)
+
+        first = len(self)
+        if first and incoming.ordinals[0] <= self.ordinals[-1]:
+            # Revision or backfill: rebuild, letting incoming rows win
+            first = bisect_left(self.ordinals, incoming.ordinals[0])
+            merged = {self.ordinals[i]: self.row(i) for i in range(len(self))}
+            merged.update(
+                (incoming.ordinals[i], incoming.row(i)) for i in range(len(incoming))
+            )
+            rebuilt = SeriesColumns.from_points(
+                self.series_id, [merged[ordinal] for ordinal in sorted(merged)]
+            )
+            for name in self.__slots__:
+                if name not in ("series_id", "descending", "derived"):
+                    setattr(self, name, getattr(rebuilt, name))
+        else:
+            footnote_ids = {
+                json.dumps(note, sort_keys=True): i for i, note in enumerate(self.footnotes)
+            }
+            for row in range(len(incoming)):
+                ref = incoming.footnote_refs[row]
+                if ref >= 0:
+                    note = incoming.footnotes[ref]
+                    key = json.dumps(note, sort_keys=True)
+                    if key not in footnote_ids:
+                        footnote_ids[key] = len(self.footnotes)
+                        self.footnotes.append(note)
+                    ref = footnote_ids[key]
+                self.footnote_refs.append(ref)
+                extra = incoming.extras.get(row)
+                if extra:
+                    self.extras[first + row] = extra
+            self.ordinals.extend(incoming.ordinals)
+            self.values.extend(incoming.values)
+            self.years.extend(incoming.years)
+            self.periods.extend(incoming.periods)
+            self.period_names.extend(incoming.period_names)
+            self.value_strs.extend(incoming.value_strs)
+
+        if self.derived is not None:
+            self.derived.invalidate_from(first)
+        return first
+
+    def year_slice(
+        self, start_year: Optional[int] = None, end_year: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Locate the rows that fall inside a year range.
+
+        Args:
+            start_year: Inclusive start year, or None for no lower bound
+            end_year: Inclusive end year, or None for no upper bound
+
+        Returns:
+            ``(lo, hi)`` row bounds into the ascending columns
+        """
+        lo = 0
+        hi = len(self.ordinals)
+        if start_year:
+            lo = bisect_left(self.ordinals, start_year * _PERIODS_PER_YEAR)
+        if end_year:
+            hi = bisect_right(
+                self.ordinals, end_year * _PERIODS_PER_YEAR + _PERIODS_PER_YEAR - 1
+            )
+        return lo, max(lo, hi)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Rebuild the BLS data point dictionary for row ``i``."""
+        point: Dict[str, Any] = {
+            "year": self.years[i],
+            "period": self.periods[i],
+            "period_name": self.period_names[i],
+            "value": self.value_strs[i],
+        }
+        ref = self.footnote_refs[i]
+        if ref >= 0:
+            point["footnotes"] = self.footnotes[ref]
+        extra = self.extras.get(i)
+        if extra:
+            point.update(extra)
+        return point
+
+    def iter_rows(self, lo: int, hi: int) -> Iterator[Dict[str, Any]]:
+        """Yield rows ``lo..hi`` in the series' original orientation."""
+        indices = range(hi - 1, lo - 1, -1) if self.descending else range(lo, hi)
+        for i in indices:
+            yield self.row(i)
+
+    def iter_pages(self, lo: int, hi: int, page_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield rows ``lo..hi`` in pages, in the series' original orientation.
+
+        Only one page of row dictionaries is built at a time.
+        """
+        if self.descending:
+            for top in range(hi, lo, -page_size):
+                yield [self.row(i) for i in range(top - 1, max(lo, top - page_size) - 1, -1)]
+        else:
+            for bottom in range(lo, hi, page_size):
+                yield [self.row(i) for i in range(bottom, min(hi, bottom + page_size))]
+
+    def rows(
+        self, start_year: Optional[int] = None, end_year: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Return data points within a year range.
+
+        Args:
+            start_year: Inclusive start year, or None for no lower bound
+            end_year: Inclusive end year, or None for no upper bound
+
+        Returns:
+            Data point dictionaries in the series' original orientation
+        """
+        lo, hi = self.year_slice(start_year, end_year)
+        return list(self.iter_rows(lo, hi))
+
+
+def build_series_store(historical: Dict[str, Any]) -> Dict[str, SeriesColumns]:
+    """
+    Convert parsed ``historical_data.json`` content into columnar series.
+
+    Args:
+        historical: Mapping of series ID to ``{"series_id", "data"}``
+
+    Returns:
+        Mapping of series ID to its columns
+    """
+    return {
+        series_id: SeriesColumns.from_points(series_id, entry["data"])
+        for series_id, entry in historical.items()
+    }
+
+
+class LayeredSeriesStore(Mapping[str, SeriesColumns]):
+    """
+    Updated series layered over a base store.
+
+    The layer holds replacement columns for series that changed since the
+    base was loaded (or series the base lacks); everything else is read from
+    the base. Both are treated as immutable: an update builds a new layered
+    store, which is published by swapping a single reference.
+    """
+
+    def __init__(
+        self, base: Mapping[str, SeriesColumns], updated: Dict[str, SeriesColumns]
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            base: Store loaded from the fixtures
+            updated: Series ID to columns replacing (or adding to) the base
+        """
+        self.base = base
+        self.updated = updated
+
+    def replace(self, series: Dict[str, SeriesColumns]) -> "LayeredSeriesStore":
+        """Return a new store with ``series`` replacing their current columns."""
+        return LayeredSeriesStore(self.base, {**self.updated, **series})
+
+    def __getitem__(self, series_id: str) -> SeriesColumns:
+        columns = self.updated.get(series_id)
+        if columns is not None:
+            return columns
+        return self.base[series_id]
+
+    def __contains__(self, series_id: object) -> bool:
+        return series_id in self.updated or series_id in self.base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        for series_id in self.updated:
+            if series_id not in self.base:
+                yield series_id
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(1 for series_id in self.updated if series_id not in self.base)
+
+    def row_count(self, series_id: str) -> int:
+        """
+        Return the number of observations for a series.
+
+        Raises:
+            KeyError: If the series is not in the store
+        """
+        columns = self.updated.get(series_id)
+        if columns is not None:
+            return len(columns)
+        if hasattr(self.base, "row_count"):
+            return int(self.base.row_count(series_id))
+        return len(self.base[series_id])
@@ -0,0 +1,164 @@
+"""Transport-independent tool dispatch shared by the stdio and HTTP servers."""
+
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from .metrics import ServerMetrics, collect_phases
+from .tools.base import BaseTool
+from .utils.logger import get_request_logger
+from .utils.serialization import dumps, dumps_bytes
+
+logger = get_request_logger(__name__)
+
+
+class UnknownToolError(LookupError):
+    """Raised when a call names a tool that is not registered."""
+
+
+class ToolDispatcher:
+    """
+    Registry of tools with a single call path for every transport.
+
+    Tool definitions and their JSON schemas are generated once, when the
+    dispatcher is built, and the encoded ``tools/list`` result is kept as
+    bytes so listings cost no schema generation or serialization.
+    """
+
+    def __init__(
+        self, tools: Iterable[BaseTool], metrics: Optional[ServerMetrics] = None
+    ) -> None:
+        """
+        Build the registry and precompute the tool listing.
+
+        Args:
+            tools: Tools to register, in listing order
+            metrics: Metrics to record each call's latency, phases and size in
+        """
+        self.metrics = metrics
+        self.tools: Dict[str, BaseTool] = {tool.name: tool for tool in tools}
+        self.definitions: List[Dict[str, Any]] = [
+            tool.to_mcp_tool() for tool in self.tools.values()
+        ]
+        self.tools_list_json: bytes = dumps_bytes({"tools": self.definitions})
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.tools
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    async def aclose(self) -> None:
+        """Release the resources held by every tool."""
+        for tool in self.tools.values():
+            await tool.aclose()
+
+    def get(self, name: str) -> BaseTool:
+        """
+        Look up a tool by name.
+
+        Raises:
+            UnknownToolError: If no tool has that name
+        """
+        try:
+            return self.tools[name]
+        except KeyError:
+            raise UnknownToolError(f"Unknown tool: {name}") from None
+
+    async def call(self, name: str, arguments: Dict[str, Any]) -> Tuple[str, bool]:
+        """
+        Run a tool and serialize its result.
+
+        Tools validate their own arguments and report problems as an
+        ``{"error": ...}`` result; an exception escaping the tool is turned
+        into an error text here, so callers only have to handle unknown tools.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            ``(text, is_error)``: the JSON result text, or an error message
+
+        Raises:
+            UnknownToolError: If no tool has that name
+        """
+        tool = self.get(name)
+        if self.metrics is None:
+            try:
+                result = await tool.execute(arguments or {})
+            except Exception as e:
+                return self._failure(e)
+            logger.debug("Tool result: %s", result)
+            return dumps(result), "error" in result
+
+        with collect_phases() as phases:
+            start = time.perf_counter()
+            try:
+                result = await tool.execute(arguments or {})
+            except Exception as e:
+                self.metrics.finish_call(
+                    name, phases, time.perf_counter() - start, "exception"
+                )
+                return self._failure(e)
+            elapsed = time.perf_counter() - start
+
+        logger.debug("Tool result: %s", result)
+        start = time.perf_counter()
+        text = dumps(result)
+        is_error = "error" in result
+        self.metrics.finish_call(
+            name,
+            phases,
+            elapsed,
+            "error" if is_error else "ok",
+            size=len(text),
+            serialize_seconds=time.perf_counter() - start,
+        )
+        return text, is_error
+
+    @staticmethod
+    def _failure(e: Exception) -> Tuple[str, bool]:
+        error_msg = f"Tool execution failed: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        return f"Error: {error_msg}", True
+
+    def stream(self, name: str, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run a tool, yielding its result in chunks.
+
+        Raises:
+            UnknownToolError: If no tool has that name
+        """
+        tool = self.get(name)
+        if self.metrics is None:
+            return tool.stream(arguments or {})
+        return self._timed_stream(tool, arguments or {}, self.metrics)
+
+    @staticmethod
+    async def _timed_stream(
+        tool: BaseTool, arguments: Dict[str, Any], metrics: ServerMetrics
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a tool's result, recording the time spent producing chunks."""
+        chunks = tool.stream(arguments)
+        phases: Dict[str, float] = {}
+        status = "ok"
+        spent = 0.0
+        try:
+            while True:
+                # Collect phases per step: the consumer runs between chunks
+                with collect_phases(phases):
+                    start = time.perf_counter()
+                    try:
+                        chunk = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    except Exception:
+                        status = "exception"
+                        raise
+                    finally:
+                        spent += time.perf_counter() - start
+                if "error" in chunk:
+                    status = "error"
+                yield chunk
+        finally:
+            metrics.finish_call(tool.name, phases, spent, status)
@@ -0,0 +1,372 @@
+"""Low-overhead server metrics in the Prometheus text exposition format.
+
+Histograms have fixed buckets chosen up front, so recording a value is a
+binary search and two additions. Nothing on the hot path takes a lock:
+metrics are updated from the event loop thread, and a rare lost increment
+from another thread is an acceptable price for that.
+"""
+
+import contextlib
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Content type of the text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds, in seconds, for latency histograms
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Upper bounds, in bytes, for response size histograms
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Seconds spent per phase ("validation", "provider") of the tool call the
+# current task is running, or None outside a call
+_call_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "bls_mcp_call_timings", default=None
+)
+
+
+@contextlib.contextmanager
+def collect_phases(
+    timings: Optional[Dict[str, float]] = None,
+) -> Iterator[Dict[str, float]]:
+    """
+    Collect the phase timings of a tool call run in the current context.
+
+    Args:
+        timings: Timings to add to, e.g. from an earlier step of a stream
+
+    Yields:
+        Phase name to seconds, filled in by ``record_phase`` during the call
+    """
+    if timings is None:
+        timings = {}
+    token = _call_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _call_timings.reset(token)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """Add time spent in a phase to the tool call in progress, if any."""
+    timings = _call_timings.get()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class HistogramChild:
+    """Bucket counts of one label combination."""
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # One count per bucket plus the overflow (+Inf) bucket, not cumulative
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by interpolating within its bucket.
+
+        Uses the same method as PromQL's ``histogram_quantile``; values in
+        the overflow bucket are reported as the largest finite bound.
+
+        Returns:
+            The estimate, or None without observations
+        """
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+class Histogram:
+    """Histogram with fixed buckets, optionally split by labels."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name
+            help_text: Description for the HELP line
+            labelnames: Label names, in the order values are passed to ``labels``
+            buckets: Ascending bucket upper bounds; +Inf is implied
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(float(b) for b in buckets)
+        self._children: Dict[Tuple[str, ...], HistogramChild] = {}
+
+    def labels(self, *values: str) -> HistogramChild:
+        """Return the child for a label combination, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            child = self._children.setdefault(values, HistogramChild(self.buckets))
+        return child
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for a label combination."""
+        self.labels(*labels).observe(value)
+
+    def render(self) -> List[str]:
+        """Return exposition lines for every label combination."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for values, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+                cumulative += count
+                le = f'le="{_format_number(bound)}"'
+                labels = _format_labels(self.labelnames, values, le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_number(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter, optionally split by labels."""
+
+    def __init__(
+        self, name: str, help_text: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """
+        Initialize the counter.
+
+        Args:
+            name: Metric name, conventionally ending in ``_total``
+            help_text: Description for the HELP line
+            labelnames: Label names, in the order values are passed to ``inc``
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Increase the counter for a label combination."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Return the current value for a label combination."""
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        """Return exposition lines for every label combination."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for values, value in list(self._values.items()):
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}{labels} {_format_number(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """A set of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: List[Any] = []
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        histogram = Histogram(name, help_text, labelnames, buckets)
+        self._metrics.append(histogram)
+        return histogram
+
+    def counter(
+        self, name: str, help_text: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        counter = Counter(name, help_text, labelnames)
+        self._metrics.append(counter)
+        return counter
+
+    def add_collector(self, collect: Callable[[], Iterable[str]]) -> None:
+        """Register a function returning exposition lines, called on each render."""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        """Return every metric in the text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collect in self._collectors:
+            lines.extend(collect())
+        return "\n".join(lines) + "\n"
+
+
+class ServerMetrics:
+    """The metrics a BLS MCP server records."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        """
+        Create the server's metrics.
+
+        Args:
+            registry: Registry to add them to (default: a new one)
+        """
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.tool_seconds = r.histogram(
+            "bls_mcp_tool_duration_seconds", "Tool call latency.", ("tool",)
+        )
+        self.phase_seconds = r.histogram(
+            "bls_mcp_tool_phase_seconds",
+            "Time spent per phase (validation, provider, serialization) of tool calls.",
+            ("tool", "phase"),
+        )
+        self.response_bytes = r.histogram(
+            "bls_mcp_tool_response_bytes",
+            "Size of serialized tool results.",
+            ("tool",),
+            SIZE_BUCKETS,
+        )
+        self.tool_calls = r.counter(
+            "bls_mcp_tool_calls_total", "Tool calls by outcome.", ("tool", "status")
+        )
+        self.provider_seconds = r.histogram(
+            "bls_mcp_provider_call_seconds", "Data provider call latency.", ("method",)
+        )
+        self.rpc_seconds = r.histogram(
+            "bls_mcp_rpc_duration_seconds",
+            "JSON-RPC request latency on /mcp.",
+            ("method",),
+        )
+
+    def finish_call(
+        self,
+        tool: str,
+        timings: Dict[str, float],
+        seconds: float,
+        status: str,
+        size: Optional[int] = None,
+        serialize_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Record a finished tool call.
+
+        Args:
+            tool: Tool name
+            timings: Phase timings collected by ``collect_phases``
+            seconds: Time spent in the tool
+            status: 'ok', 'error' (an error result) or 'exception'
+            size: Serialized result size in bytes, if serialized
+            serialize_seconds: Time spent serializing the result
+        """
+        self.tool_seconds.observe(seconds, tool)
+        self.tool_calls.inc(tool, status)
+        for phase, spent in timings.items():
+            self.phase_seconds.observe(spent, tool, phase)
+        if serialize_seconds is not None:
+            self.phase_seconds.observe(serialize_seconds, tool, "serialization")
+        if size is not None:
+            self.response_bytes.observe(size, tool)
+
+    def watch(self, prefix: str, stats: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Export a component's ``stats()`` counters as gauges on each render.
+
+        Args:
+            prefix: Metric name prefix, e.g. 'bls_mcp_cache'
+            stats: Function returning a flat mapping of numeric stats
+        """
+
+        def collect() -> List[str]:
+            lines = []
+            for key, value in stats().items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    name = f"{prefix}_{key}"
+                    lines.append(f"# TYPE {name} gauge")
+                    lines.append(f"{name} {_format_number(value)}")
+            return lines
+
+        self.registry.add_collector(collect)
+
+    def render(self) -> str:
+        """Return every metric in the text exposition format."""
+        return self.registry.render()
+
@@ -0,0 +1,166 @@
+"""JSON-RPC message handling shared by the HTTP and fast-start stdio transports.
+
+Only the small subset of MCP the server needs is implemented here, without
+the MCP SDK, so a transport built on it starts without importing the SDK
+or the tool modules.
+"""
+
+import time
+from typing import Any, Optional
+
+from .utils.logger import get_logger
+from .utils.serialization import dumps_bytes
+
+logger = get_logger(__name__)
+
+
+# MCP protocol versions the server speaks, newest first
+SUPPORTED_PROTOCOL_VERSIONS = ("2025-06-18", "2025-03-26", "2024-11-05")
+
+INITIALIZE_RESULT = {
+    "protocolVersion": SUPPORTED_PROTOCOL_VERSIONS[0],
+    "capabilities": {
+        "experimental": {},
+        "tools": {"listChanged": False},
+    },
+    "serverInfo": {
+        "name": "bls-mcp-server",
+        "version": "1.18.0",
+    },
+}
+
+# Encoded initialize result per protocol version
+_INITIALIZE_JSON = {
+    version: dumps_bytes({**INITIALIZE_RESULT, "protocolVersion": version})
+    for version in SUPPORTED_PROTOCOL_VERSIONS
+}
+
+
+# JSON-RPC methods timed under their own label
+RPC_METHODS = ("initialize", "tools/list", "tools/call")
+
+
+def result_response(request_id: Any, result: bytes) -> bytes:
+    """Encode a JSON-RPC response around an already-encoded result."""
+    return (
+        b'{"jsonrpc":"2.0","id":'
+        + dumps_bytes(request_id)
+        + b',"result":'
+        + result
+        + b"}"
+    )
+
+
+def initialize_result(params: Any) -> bytes:
+    """
+    Return the encoded initialize result for a client's requested version.
+
+    The requested version is echoed back if the server supports it;
+    otherwise the server answers with the newest version it supports and
+    the client decides whether to proceed.
+    """
+    requested = params.get("protocolVersion") if isinstance(params, dict) else None
+    if requested not in _INITIALIZE_JSON:
+        requested = SUPPORTED_PROTOCOL_VERSIONS[0]
+    return _INITIALIZE_JSON[requested]
+
+
+def error_response(request_id: Any, code: int, message: str) -> bytes:
+    """Encode a JSON-RPC error response."""
+    return dumps_bytes(
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+    )
+
+
+class RPCHandler:
+    """
+    Answer MCP JSON-RPC messages for a server.
+
+    ``initialize`` and ``tools/list`` are answered from precomputed bytes;
+    the server's tools, and the data provider behind them, are only built
+    when the first ``tools/call`` arrives.
+    """
+
+    def __init__(self, mcp_server: Any) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            mcp_server: ``BLSMCPServer`` providing the tool listing, the
+                dispatcher and the metrics
+        """
+        self.mcp_server = mcp_server
+        self.metrics = mcp_server.metrics
+
+    async def handle(self, message: Any) -> Optional[bytes]:
+        """
+        Handle one JSON-RPC message.
+
+        Args:
+            message: Decoded request object
+
+        Returns:
+            The encoded response, or None for a notification
+        """
+        if not isinstance(message, dict) or not isinstance(
+            message.get("method"), str
+        ):
+            return error_response(
+                message.get("id") if isinstance(message, dict) else None,
+                -32600,
+                "Invalid Request",
+            )
+
+        method = message["method"]
+        params = message.get("params") or {}
+        is_notification = "id" not in message
+        request_id = message.get("id")
+        start = time.perf_counter()
+
+        try:
+            if method == "initialize":
+                reply = result_response(request_id, initialize_result(params))
+            elif method == "ping":
+                reply = result_response(request_id, b"{}")
+            elif method == "tools/list":
+                # Listing is precomputed; splice it into the envelope
+                reply = result_response(request_id, self.mcp_server.tools_list_json)
+            elif method == "tools/call":
+                dispatcher = self.mcp_server.dispatcher
+                tool_name = params.get("name")
+                if tool_name not in dispatcher:
+                    reply = error_response(
+                        request_id, -32601, f"Unknown tool: {tool_name}"
+                    )
+                else:
+                    # Same call path as the SDK stdio server; the (possibly
+                    # large) result is serialized once, and the envelope
+                    # only has to escape the finished string
+                    text, is_error = await dispatcher.call(
+                        tool_name, params.get("arguments", {})
+                    )
+                    reply = result_response(
+                        request_id,
+                        dumps_bytes(
+                            {
+                                "content": [{"type": "text", "text": text}],
+                                "isError": is_error,
+                            }
+                        ),
+                    )
+            elif method.startswith("notifications/"):
+                reply = None
+            else:
+                reply = error_response(request_id, -32601, f"Unknown method: {method}")
+        except Exception as e:
+            logger.error("Error handling MCP request: %s", e)
+            reply = error_response(request_id, -32603, str(e))
+
+        # Label by known methods only, so clients cannot add label values
+        label = method if method in RPC_METHODS else "other"
+        self.metrics.rpc_seconds.observe(time.perf_counter() - start, label)
+        return None if is_notification else reply
@@ -1,118 +1,402 @@
 """Main MCP server implementation for BLS data."""
 
 import asyncio
+import json
 import os
-from typing import Any, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 
-from dotenv import load_dotenv
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from .metrics import ServerMetrics
+from .utils.logger import get_logger, get_request_logger, setup_logging
+from .utils.serialization import dumps_bytes
 
-from .data.mock_data import MockDataProvider
-from .tools.get_series import GetSeriesTool
-from .tools.get_series_info import GetSeriesInfoTool
-from .tools.list_series import ListSeriesTool
-from .utils.logger import get_logger, setup_logging
+if TYPE_CHECKING:
+    from mcp.server import Server
 
-# Load environment variables
-load_dotenv()
-
-# Setup logging
-log_level = os.getenv("LOG_LEVEL", "INFO")
-setup_logging(log_level)
+    from .data.base import DataProvider
+    from .data.cache import CachingDataProvider
+    from .data.refresh import DataRefresher
+    from .dispatch import ToolDispatcher
 
 logger = get_logger(__name__)
+request_logger = get_request_logger(__name__)
+
+# Precomputed ``tools/list`` result, regenerated by scripts/build_tool_listing.py
+TOOL_LISTING_PATH = Path(__file__).parent / "tools" / "tool_listing.json"
+
+_configured = False
+
+
+def load_config() -> None:
+    """
+    Load environment variables from ``.env`` and set up logging.
+
+    Runs once per process, when a server is first created rather than on
+    import, so importing the package stays cheap.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    setup_logging(
+        os.getenv("LOG_LEVEL", "INFO"),
+        sample_rate=float(os.getenv("LOG_SAMPLE_RATE", "1")),
+        log_format=os.getenv("LOG_FORMAT", "text"),
+    )
+
+
+def load_tool_listing(path: Path = TOOL_LISTING_PATH) -> Optional[bytes]:
+    """
+    Read the precomputed tool listing.
+
+    Args:
+        path: Listing file written by ``scripts/build_tool_listing.py``
+
+    Returns:
+        The encoded ``tools/list`` result, or None if the file is missing
+    """
+    try:
+        with open(path, "rb") as f:
+            return dumps_bytes(json.load(f))
+    except FileNotFoundError:
+        return None
 
 
 class BLSMCPServer:
-    """BLS MCP Server implementation."""
+    """
+    BLS MCP Server implementation.
+
+    Construction is cheap: the data provider, the tools and the MCP SDK
+    server are built when they are first used, and the tool listing is
+    read from a precomputed file until then.
+    """
 
     def __init__(self) -> None:
         """Initialize BLS MCP server."""
+        load_config()
         logger.info("Initializing BLS MCP Server")
 
-        # Create MCP server
-        self.server = Server("bls-mcp-server")
+        # Latency, size and cache metrics, served at /metrics over HTTP
+        self.metrics = ServerMetrics()
 
-        # Initialize data provider
-        data_provider_type = os.getenv("DATA_PROVIDER", "mock")
-        logger.info(f"Using data provider: {data_provider_type}")
-        self.data_provider = MockDataProvider()
+        self.data_provider_type = os.getenv("DATA_PROVIDER", "mock")
+        self.cache: Optional["CachingDataProvider"] = None
+        self.refresher: Optional["DataRefresher"] = None
+        self._data_provider: Optional["DataProvider"] = None
+        self._dispatcher: Optional["ToolDispatcher"] = None
+        self._tool_listing: Optional[bytes] = None
+        self._server: Optional["Server"] = None
 
-        # Initialize tools
-        self.tools = {
-            "get_series": GetSeriesTool(self.data_provider),
-            "list_series": ListSeriesTool(self.data_provider),
-            "get_series_info": GetSeriesInfoTool(self.data_provider),
-        }
+        logger.info("BLS MCP Server initialized successfully")
 
-        # Register handlers
-        self._register_handlers()
+    @property
+    def data_provider(self) -> "DataProvider":
+        """Data provider, created on first use."""
+        if self._data_provider is None:
+            logger.info("Using data provider: %s", self.data_provider_type)
+            self._data_provider = self._create_data_provider(self.data_provider_type)
+        return self._data_provider
 
-        logger.info("BLS MCP Server initialized successfully")
+    @property
+    def dispatcher(self) -> "ToolDispatcher":
+        """Tool dispatcher, created on first use; schemas are generated once, here."""
+        if self._dispatcher is None:
+            self._dispatcher = self._create_dispatcher()
+        return self._dispatcher
+
+    @property
+    def tools(self) -> Any:
+        """Registered tools by name."""
+        return self.dispatcher.tools
+
+    @property
+    def tools_list_json(self) -> bytes:
+        """
+        Encoded ``tools/list`` result.
+
+        Served from the precomputed listing until the tools have been built,
+        so listing tools does not import the tool modules.
+        """
+        if self._dispatcher is None:
+            if self._tool_listing is None:
+                self._tool_listing = load_tool_listing()
+            if self._tool_listing is not None:
+                return self._tool_listing
+        return self.dispatcher.tools_list_json
+
+    @property
+    def server(self) -> "Server":
+        """MCP SDK server, created with its handlers on first use."""
+        if self._server is None:
+            from mcp.server import Server
+
+            self._server = Server("bls-mcp-server")
+            self._register_handlers(self._server)
+        return self._server
+
+    def _create_dispatcher(self) -> "ToolDispatcher":
+        """Create the tools and the dispatcher that routes calls to them."""
+        from .dispatch import ToolDispatcher
+        from .tools.compare_series import CompareSeriesTool
+        from .tools.compute_series_stats import ComputeSeriesStatsTool
+        from .tools.forecast_series import ForecastSeriesTool
+        from .tools.get_series import GetSeriesTool
+        from .tools.get_series_batch import GetSeriesBatchTool
+        from .tools.get_series_info import GetSeriesInfoTool
+        from .tools.list_series import ListSeriesTool
+        from .tools.search_series import SearchSeriesTool
+
+        provider = self.data_provider
+        return ToolDispatcher(
+            [
+                GetSeriesTool(
+                    provider,
+                    page_size=int(os.getenv("STREAM_PAGE_SIZE", "500")),
+                ),
+                GetSeriesBatchTool(
+                    provider,
+                    max_concurrency=int(os.getenv("BATCH_MAX_CONCURRENCY", "8")),
+                ),
+                ListSeriesTool(provider),
+                GetSeriesInfoTool(provider),
+                SearchSeriesTool(provider),
+                ComputeSeriesStatsTool(provider),
+                CompareSeriesTool(provider),
+                ForecastSeriesTool(provider),
+            ],
+            metrics=self.metrics,
+        )
+
+    def _create_data_provider(self, provider_type: str) -> "DataProvider":
+        """
+        Create the data provider selected by ``DATA_PROVIDER``.
+
+        Args:
+            provider_type: 'mock' for fixtures (``MOCK_DATA_DIR``, default: the
+                bundled ones), 'real' for the BLS API
+
+        The provider is wrapped in a ``CachingDataProvider`` unless
+        ``CACHE_MAX_BYTES`` is 0; ``CACHE_DB_PATH`` enables the disk tier.
+        Concurrent identical calls are coalesced, and the outermost layer
+        times every call for the server metrics.
+
+        Returns:
+            Data provider instance
+
+        Raises:
+            ValueError: If the provider type is unknown
+        """
+        from .data.cache import CachingDataProvider
+        from .data.coalesce import CoalescingDataProvider
+        from .data.instrumented import InstrumentedDataProvider
+        from .data.mock_data import MockDataProvider
+
+        provider: DataProvider
+        provider_type = provider_type.lower()
+        if provider_type == "mock":
+            provider = MockDataProvider(os.getenv("MOCK_DATA_DIR") or None)
+        elif provider_type in ("real", "bls", "api"):
+            from .data.bls_api import BLSApiProvider
+
+            provider = BLSApiProvider(api_key=os.getenv("BLS_API_KEY") or None)
+        else:
+            raise ValueError(f"Unknown data provider: {provider_type}")
+
+        # Put the response cache in front unless it is disabled
+        cache_max_bytes = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+        if cache_max_bytes > 0:
+            provider = self.cache = CachingDataProvider(
+                provider,
+                max_bytes=cache_max_bytes,
+                disk_path=os.getenv("CACHE_DB_PATH") or None,
+            )
+            self.metrics.watch("bls_mcp_cache", self.cache.stats)
+
+        # Share in-flight fetches between concurrent identical tool calls
+        coalescing = CoalescingDataProvider(provider)
+        self.metrics.watch("bls_mcp_coalesce", coalescing.stats)
+        return InstrumentedDataProvider(coalescing, self.metrics)
+
+    def _create_refresher(self, provider_type: str) -> Optional["DataRefresher"]:
+        """
+        Create the data refresher enabled by ``REFRESH_INTERVAL``.
 
-    def _register_handlers(self) -> None:
+        The refresher polls ``REFRESH_DIR`` (default: a ``releases``
+        directory next to the mock fixtures) for release files and merges
+        them into the running dataset.
+
+        Args:
+            provider_type: Value of ``DATA_PROVIDER``
+
+        Returns:
+            Refresher, or None if refreshing is disabled
+        """
+        interval = float(os.getenv("REFRESH_INTERVAL", "0"))
+        if interval <= 0:
+            return None
+        if provider_type.lower() != "mock":
+            logger.warning("REFRESH_INTERVAL is ignored: only the mock provider accepts updates")
+            return None
+
+        from .data.mock_data import MockDataProvider
+        from .data.refresh import DataRefresher, ReleaseDirectory
+
+        fixtures_dir = MockDataProvider(os.getenv("MOCK_DATA_DIR") or None).fixtures_dir
+        release_dir = os.getenv("REFRESH_DIR") or fixtures_dir / "releases"
+        logger.info("Watching %s for data releases every %gs", release_dir, interval)
+        return DataRefresher(self.data_provider, ReleaseDirectory(release_dir), interval=interval)
+
+    def start_refresh(self) -> None:
+        """Start polling for data releases, if enabled."""
+        if self.refresher is None:
+            self.refresher = self._create_refresher(self.data_provider_type)
+        if self.refresher is not None:
+            self.refresher.start()
+
+    async def stop_refresh(self) -> None:
+        """Stop polling for data releases."""
+        if self.refresher is not None:
+            await self.refresher.stop()
+
+    async def aclose(self) -> None:
+        """
+        Stop refreshing and release what the server has built.
+
+        Shuts down the tools (e.g. the forecast worker processes) and closes
+        the provider stack (e.g. the BLS API client and the disk cache).
+        Parts that were never built are left alone.
+        """
+        await self.stop_refresh()
+        if self._dispatcher is not None:
+            await self._dispatcher.aclose()
+        if self._data_provider is not None:
+            await self._data_provider.aclose()
+
+    async def warm(self, series_ids: Optional[Sequence[str]] = None) -> None:
+        """
+        Prepare the server to answer requests at full speed.
+
+        Loads the provider's dataset and indexes, then fetches each series in
+        ``series_ids`` (default: the comma-separated ``PREWARM_SERIES``) so
+        it is cached before the first client asks for it.
+
+        Args:
+            series_ids: Series to fetch into the cache
+        """
+        if series_ids is None:
+            series_ids = [
+                series_id.strip()
+                for series_id in os.getenv("PREWARM_SERIES", "").split(",")
+                if series_id.strip()
+            ]
+
+        await self.data_provider.warm()
+        results = await asyncio.gather(
+            *(self.data_provider.get_series(series_id) for series_id in series_ids),
+            return_exceptions=True,
+        )
+        for series_id, result in zip(series_ids, results):
+            if isinstance(result, Exception):
+                logger.warning("Could not prewarm %s: %s", series_id, result)
+        logger.info("Server warmed (%s series prefetched)", len(series_ids))
+
+    def _register_handlers(self, server: "Server") -> None:
         """Register MCP protocol handlers."""
+        from mcp.types import TextContent, Tool
+
+        from .dispatch import UnknownToolError
 
-        @self.server.list_tools()
+        mcp_tools: List[Tool] = []
+
+        @server.list_tools()
         async def list_tools() -> list[Tool]:
             """List available tools."""
             logger.debug("Listing tools")
-            return [
-                Tool(
-                    name=tool.name,
-                    description=tool.description,
-                    inputSchema=tool.input_schema.model_json_schema(),
-                )
-                for tool in self.tools.values()
-            ]
+            if not mcp_tools:
+                listing = json.loads(self.tools_list_json)
+                mcp_tools.extend(Tool(**definition) for definition in listing["tools"])
+            return mcp_tools
 
-        @self.server.call_tool()
+        @server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
             """Call a tool by name with arguments."""
-            logger.info(f"Tool called: {name}")
-            logger.debug(f"Arguments: {arguments}")
-
-            if name not in self.tools:
-                error_msg = f"Unknown tool: {name}"
-                logger.error(error_msg)
-                return [TextContent(type="text", text=f"Error: {error_msg}")]
-
-            tool = self.tools[name]
+            request_logger.info("Tool called: %s", name, extra={"tool": name})
+            request_logger.debug("Arguments: %s", arguments)
 
             try:
-                result = await tool.execute(arguments)
-                logger.debug(f"Tool result: {result}")
-
-                # Convert result to JSON string for text content
-                import json
+                result_text, _ = await self.dispatcher.call(name, arguments)
+            except UnknownToolError as e:
+                logger.error(str(e))
+                return [TextContent(type="text", text=f"Error: {e}")]
 
-                result_text = json.dumps(result, indent=2)
-                return [TextContent(type="text", text=result_text)]
-
-            except Exception as e:
-                error_msg = f"Tool execution failed: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                return [TextContent(type="text", text=f"Error: {error_msg}")]
+            return [TextContent(type="text", text=result_text)]
 
     async def run_stdio(self) -> None:
         """Run server with stdio transport."""
+        from mcp.server.stdio import stdio_server
+
         logger.info("Starting MCP server with stdio transport")
 
         async with stdio_server() as (read_stream, write_stream):
             logger.info("stdio streams established")
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+            self.start_refresh()
+            try:
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+            finally:
+                await self.aclose()
+
+    async def run_fast_stdio(self) -> None:
+        """Run server with the fast-start stdio transport, without the MCP SDK."""
+        from .transports.stdio import StdioTransport
+
+        logger.info("Starting MCP server with fast-start stdio transport")
+        self.start_refresh()
+        try:
+            await StdioTransport(self).run()
+        finally:
+            await self.aclose()
+
+
+def prepare_shared_dataset() -> None:
+    """
+    Prepare data that worker processes share, before they start.
+
+    For the mock provider this compiles the fixtures to the binary format,
+    which every worker then memory-maps instead of parsing its own copy.
+    """
+    load_config()
+    if os.getenv("DATA_PROVIDER", "mock").lower() != "mock":
+        return
+    from .data.mock_data import MockDataProvider
+
+    try:
+        path = MockDataProvider(os.getenv("MOCK_DATA_DIR") or None).ensure_compiled()
+        logger.info("Workers will share the compiled dataset at %s", path)
+    except OSError as e:
+        logger.warning("Could not compile fixtures, each worker will parse JSON: %s", e)
 
 
 def main() -> None:
-    """Main entry point for stdio server."""
+    """
+    Main entry point for stdio server.
+
+    With ``MCP_FAST_START`` set, the server speaks MCP through its own
+    lightweight stdio transport instead of the MCP SDK, which shortens the
+    time from launch to the ``initialize`` response.
+    """
     server = BLSMCPServer()
-    asyncio.run(server.run_stdio())
+    if os.getenv("MCP_FAST_START", "false").lower() in ("1", "true", "yes"):
+        asyncio.run(server.run_fast_stdio())
+    else:
+        asyncio.run(server.run_stdio())
 
 
 if __name__ == "__main__":
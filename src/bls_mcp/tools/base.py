@@ -1,10 +1,15 @@
 """Base tool class for BLS MCP tools."""
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, TypeVar
 
 from pydantic import BaseModel
 
+from ..metrics import record_phase
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class BaseTool(ABC):
     """Base class for MCP tools."""
@@ -43,6 +48,44 @@ class BaseTool(ABC):
         """
         pass
 
+    def validate_input(self, model: type[ModelT], arguments: Dict[str, Any]) -> ModelT:
+        """
+        Validate tool arguments, timing it as the call's validation phase.
+
+        Args:
+            model: Input model, normally ``input_schema``
+            arguments: Tool arguments as dictionary
+
+        Returns:
+            Validated input
+
+        Raises:
+            pydantic.ValidationError: If the arguments are invalid
+        """
+        start = time.perf_counter()
+        try:
+            return model(**arguments)
+        finally:
+            record_phase("validation", time.perf_counter() - start)
+
+    async def stream(self, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the tool, yielding its result in chunks as they are ready.
+
+        The default yields the whole ``execute`` result as a single chunk.
+        Tools with large results override this to stream them in pages.
+
+        Args:
+            arguments: Tool arguments as dictionary
+
+        Yields:
+            Result chunks; an ``{"error": ...}`` chunk ends the stream
+        """
+        yield await self.execute(arguments)
+
+    async def aclose(self) -> None:
+        """Release any resources held by the tool, such as worker processes."""
+
     def to_mcp_tool(self) -> Dict[str, Any]:
         """
         Convert tool to MCP tool definition.
@@ -0,0 +1,126 @@
+"""Compare series tool for aligned multi-series comparisons."""
+
+import asyncio
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from ..data.base import DataProvider
+from ..utils.logger import get_request_logger
+from ..utils.validators import find_invalid_series_ids, validate_year_range
+from .base import BaseTool
+
+logger = get_request_logger(__name__)
+
+MAX_COMPARE_SERIES = 20
+
+
+class CompareSeriesInput(BaseModel):
+    """Input schema for compare_series tool."""
+
+    series_ids: List[str] = Field(
+        min_length=2,
+        max_length=MAX_COMPARE_SERIES,
+        description=(
+            "BLS series IDs to compare; the first is the baseline for spreads "
+            "(e.g., ['CUUR0000SA0', 'CUUR0000SAF'])"
+        ),
+    )
+    start_year: Optional[int] = Field(
+        default=None, description="Start year (optional, e.g., 2020)"
+    )
+    end_year: Optional[int] = Field(
+        default=None, description="End year (optional, e.g., 2024)"
+    )
+    basis: Literal["level", "yoy", "mom"] = Field(
+        default="level",
+        description="Values in the matrix: 'level', 'yoy' or 'mom' percent changes",
+    )
+    weights: Optional[List[float]] = Field(
+        default=None,
+        description="Weight per series for contributions, e.g. CPI relative importance (optional)",
+    )
+
+
+class CompareSeriesTool(BaseTool):
+    """Tool for comparing several BLS series on one time axis."""
+
+    def __init__(self, data_provider: DataProvider) -> None:
+        """Initialize tool with data provider."""
+        self.data_provider = data_provider
+
+    @property
+    def name(self) -> str:
+        return "compare_series"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Compare several BLS series of the same frequency over a date range. "
+            "Returns one matrix of values (rows are periods, columns are series), "
+            "correlations of their period-over-period changes, spreads against the "
+            "first series, and each series' change and weighted contribution."
+        )
+
+    @property
+    def input_schema(self) -> type[BaseModel]:
+        return CompareSeriesInput
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute compare_series tool."""
+        logger.info("Executing compare_series with arguments: %s", arguments)
+
+        # Validate input
+        try:
+            input_data = self.validate_input(CompareSeriesInput, arguments)
+        except Exception as e:
+            logger.error("Input validation failed: %s", e)
+            return {"error": f"Invalid input: {str(e)}"}
+
+        invalid = find_invalid_series_ids(input_data.series_ids)
+        if invalid:
+            return {"error": f"Invalid series ID format: {invalid[0]}"}
+        if len(set(input_data.series_ids)) != len(input_data.series_ids):
+            return {"error": "series_ids must not repeat"}
+
+        # Validate year range
+        is_valid, error_msg = validate_year_range(
+            input_data.start_year, input_data.end_year
+        )
+        if not is_valid:
+            return {"error": error_msg}
+
+        try:
+            from ..analytics.compare import compare_series
+        except ImportError:
+            return {
+                "error": "compare_series requires NumPy (pip install -e \".[analytics]\")"
+            }
+
+        # Fetch columns concurrently, looking back a year for changes
+        try:
+            columns = await asyncio.gather(
+                *(
+                    self.data_provider.get_columns(
+                        series_id,
+                        input_data.start_year - 1 if input_data.start_year else None,
+                        input_data.end_year,
+                    )
+                    for series_id in input_data.series_ids
+                )
+            )
+            result = compare_series(
+                columns,
+                start_year=input_data.start_year,
+                end_year=input_data.end_year,
+                basis=input_data.basis,
+                weights=input_data.weights,
+            )
+            logger.info("Compared %s series", len(columns))
+            return result
+        except ValueError as e:
+            logger.warning("Could not compare series: %s", e)
+            return {"error": str(e)}
+        except Exception as e:
+            logger.error("Error comparing series: %s", e)
+            return {"error": f"Failed to compare series: {str(e)}"}
@@ -0,0 +1,110 @@
+"""Compute series stats tool for summary statistics of a BLS series."""
+
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from ..data.base import DataProvider
+from ..utils.logger import get_request_logger
+from ..utils.validators import validate_series_id, validate_year_range
+from .base import BaseTool
+
+logger = get_request_logger(__name__)
+
+
+class ComputeSeriesStatsInput(BaseModel):
+    """Input schema for compute_series_stats tool."""
+
+    series_id: str = Field(description="BLS series ID (e.g., 'CUUR0000SA0')")
+    start_year: Optional[int] = Field(
+        default=None, description="Start year (optional, e.g., 2020)"
+    )
+    end_year: Optional[int] = Field(
+        default=None, description="End year (optional, e.g., 2024)"
+    )
+    window: int = Field(
+        default=12, ge=2, le=120, description="Rolling window length in observations"
+    )
+    include_series: bool = Field(
+        default=False,
+        description="Also return every period's value and rates as parallel arrays",
+    )
+
+
+class ComputeSeriesStatsTool(BaseTool):
+    """Tool for computing summary statistics of a BLS series."""
+
+    def __init__(self, data_provider: DataProvider) -> None:
+        """Initialize tool with data provider."""
+        self.data_provider = data_provider
+
+    @property
+    def name(self) -> str:
+        return "compute_series_stats"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Compute statistics for a BLS series over a date range: the latest "
+            "period-over-period change (month-over-month for monthly series), its "
+            "annualized rate and the year-over-year change, min/max/mean, total "
+            "change, CAGR and a rolling mean and standard deviation. All rates "
+            "are percentages."
+        )
+
+    @property
+    def input_schema(self) -> type[BaseModel]:
+        return ComputeSeriesStatsInput
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute compute_series_stats tool."""
+        logger.info("Executing compute_series_stats with arguments: %s", arguments)
+
+        # Validate input
+        try:
+            input_data = self.validate_input(ComputeSeriesStatsInput, arguments)
+        except Exception as e:
+            logger.error("Input validation failed: %s", e)
+            return {"error": f"Invalid input: {str(e)}"}
+
+        # Validate series ID format
+        if not validate_series_id(input_data.series_id):
+            return {"error": f"Invalid series ID format: {input_data.series_id}"}
+
+        # Validate year range
+        is_valid, error_msg = validate_year_range(
+            input_data.start_year, input_data.end_year
+        )
+        if not is_valid:
+            return {"error": error_msg}
+
+        try:
+            from ..analytics.stats import compute_series_stats
+        except ImportError:
+            return {
+                "error": "compute_series_stats requires NumPy "
+                "(pip install -e \".[analytics]\")"
+            }
+
+        # Fetch columns, looking back a year for year-over-year changes
+        try:
+            columns = await self.data_provider.get_columns(
+                series_id=input_data.series_id,
+                start_year=input_data.start_year - 1 if input_data.start_year else None,
+                end_year=input_data.end_year,
+            )
+            stats = compute_series_stats(
+                columns,
+                start_year=input_data.start_year,
+                end_year=input_data.end_year,
+                window=input_data.window,
+                include_series=input_data.include_series,
+            )
+            logger.info("Computed stats for %s", input_data.series_id)
+            return stats
+        except ValueError as e:
+            logger.warning("Could not compute stats: %s", e)
+            return {"error": str(e)}
+        except Exception as e:
+            logger.error("Error computing stats: %s", e)
+            return {"error": f"Failed to compute stats: {str(e)}"}
@@ -0,0 +1,128 @@
+"""Forecast series tool for simple model-based BLS forecasts."""
+
+from typing import Any, Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from ..data.base import DataProvider
+from ..utils.logger import get_request_logger
+from ..utils.validators import validate_series_id, validate_year_range
+from .base import BaseTool
+
+logger = get_request_logger(__name__)
+
+
+class ForecastSeriesInput(BaseModel):
+    """Input schema for forecast_series tool."""
+
+    series_id: str = Field(description="BLS series ID (e.g., 'CUUR0000SA0')")
+    model: Literal["seasonal_naive", "ets", "ar"] = Field(
+        default="ets",
+        description=(
+            "'seasonal_naive' repeats the last year, 'ets' is additive "
+            "Holt-Winters, 'ar' is an autoregression on period changes"
+        ),
+    )
+    horizon: int = Field(default=12, ge=1, le=36, description="Periods to forecast")
+    level: float = Field(
+        default=95.0, ge=50.0, le=99.9, description="Prediction interval coverage in percent"
+    )
+    start_year: Optional[int] = Field(
+        default=None, description="First year of training data (optional)"
+    )
+
+
+class ForecastSeriesTool(BaseTool):
+    """Tool for forecasting a BLS series with simple models."""
+
+    def __init__(self, data_provider: DataProvider, max_workers: Optional[int] = None) -> None:
+        """
+        Initialize tool with data provider.
+
+        Args:
+            data_provider: Data provider to fetch from
+            max_workers: Worker processes for model fitting
+        """
+        self.data_provider = data_provider
+        self.max_workers = max_workers
+        self._engine: Optional[Any] = None
+
+    @property
+    def name(self) -> str:
+        return "forecast_series"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Forecast a BLS series with a simple model (seasonal naive, Holt-Winters "
+            "or autoregression). Returns point forecasts with prediction intervals "
+            "for the next periods, and the fitted model parameters."
+        )
+
+    @property
+    def input_schema(self) -> type[BaseModel]:
+        return ForecastSeriesInput
+
+    def _get_engine(self) -> Any:
+        """Return the forecast engine, creating it on first use."""
+        if self._engine is None:
+            from ..analytics.forecast import ForecastEngine
+
+            self._engine = ForecastEngine(max_workers=self.max_workers)
+        return self._engine
+
+    async def aclose(self) -> None:
+        """Stop the forecast engine's worker processes, if started."""
+        if self._engine is not None:
+            self._engine.shutdown()
+            self._engine = None
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute forecast_series tool."""
+        logger.info("Executing forecast_series with arguments: %s", arguments)
+
+        # Validate input
+        try:
+            input_data = self.validate_input(ForecastSeriesInput, arguments)
+        except Exception as e:
+            logger.error("Input validation failed: %s", e)
+            return {"error": f"Invalid input: {str(e)}"}
+
+        # Validate series ID format
+        if not validate_series_id(input_data.series_id):
+            return {"error": f"Invalid series ID format: {input_data.series_id}"}
+
+        is_valid, error_msg = validate_year_range(input_data.start_year, None)
+        if not is_valid:
+            return {"error": error_msg}
+
+        try:
+            from ..analytics.stats import SeriesArrays
+
+            engine = self._get_engine()
+        except ImportError:
+            return {
+                "error": "forecast_series requires NumPy (pip install -e \".[analytics]\")"
+            }
+
+        try:
+            columns = await self.data_provider.get_columns(
+                input_data.series_id, start_year=input_data.start_year
+            )
+            arrays = SeriesArrays(columns, start_year=input_data.start_year)
+            result = await engine.forecast(
+                arrays, input_data.model, input_data.horizon, input_data.level
+            )
+            logger.info(
+                "Forecast %s with %s (%s)",
+                input_data.series_id,
+                input_data.model,
+                "cached" if result["cached"] else "fitted",
+            )
+            return {"series_id": input_data.series_id, **result}
+        except ValueError as e:
+            logger.warning("Could not forecast series: %s", e)
+            return {"error": str(e)}
+        except Exception as e:
+            logger.error("Error forecasting series: %s", e)
+            return {"error": f"Failed to forecast series: {str(e)}"}
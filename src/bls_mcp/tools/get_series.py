@@ -1,15 +1,16 @@
 """Get series tool for fetching BLS data."""
 
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
-from ..data.mock_data import MockDataProvider
-from ..utils.logger import get_logger
+from ..data.base import DataProvider
+from ..data.derived import annotate
+from ..utils.logger import get_request_logger
 from ..utils.validators import validate_series_id, validate_year_range
 from .base import BaseTool
 
-logger = get_logger(__name__)
+logger = get_request_logger(__name__)
 
 
 class GetSeriesInput(BaseModel):
@@ -24,14 +25,29 @@ class GetSeriesInput(BaseModel):
     end_year: Optional[int] = Field(
         default=None, description="End year for data range (optional)"
     )
+    transform: Optional[Literal["yoy", "mom", "annualized_3m"]] = Field(
+        default=None,
+        description=(
+            "Add a percent change to each point (optional): 'yoy' year-over-year, "
+            "'mom' month-over-month (period-over-period), 'annualized_3m' "
+            "3-month change at an annual rate"
+        ),
+    )
 
 
 class GetSeriesTool(BaseTool):
     """Tool for fetching BLS data series."""
 
-    def __init__(self, data_provider: MockDataProvider) -> None:
-        """Initialize tool with data provider."""
+    def __init__(self, data_provider: DataProvider, page_size: int = 500) -> None:
+        """
+        Initialize tool with data provider.
+
+        Args:
+            data_provider: Data provider to fetch from
+            page_size: Data points per chunk when streaming
+        """
         self.data_provider = data_provider
+        self.page_size = page_size
 
     @property
     def name(self) -> str:
@@ -48,27 +64,37 @@ class GetSeriesTool(BaseTool):
     def input_schema(self) -> type[BaseModel]:
         return GetSeriesInput
 
-    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute get_series tool."""
-        logger.info(f"Executing get_series with arguments: {arguments}")
-
-        # Validate input
+    def _validate(
+        self, arguments: Dict[str, Any]
+    ) -> Union[Tuple[GetSeriesInput, None], Tuple[None, Dict[str, Any]]]:
+        """Validate arguments, returning the parsed input or an error result."""
         try:
-            input_data = GetSeriesInput(**arguments)
+            input_data = self.validate_input(GetSeriesInput, arguments)
         except Exception as e:
-            logger.error(f"Input validation failed: {e}")
-            return {"error": f"Invalid input: {str(e)}"}
+            logger.error("Input validation failed: %s", e)
+            return None, {"error": f"Invalid input: {str(e)}"}
 
         # Validate series ID format
         if not validate_series_id(input_data.series_id):
-            return {"error": f"Invalid series ID format: {input_data.series_id}"}
+            return None, {"error": f"Invalid series ID format: {input_data.series_id}"}
 
         # Validate year range
         is_valid, error_msg = validate_year_range(
             input_data.start_year, input_data.end_year
         )
         if not is_valid:
-            return {"error": error_msg}
+            return None, {"error": error_msg}
+
+        return input_data, None
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute get_series tool."""
+        logger.info("Executing get_series with arguments: %s", arguments)
+
+        # Validate input
+        input_data, error = self._validate(arguments)
+        if input_data is None:
+            return error or {}
 
         # Fetch data
         try:
@@ -77,13 +103,60 @@ class GetSeriesTool(BaseTool):
                 start_year=input_data.start_year,
                 end_year=input_data.end_year,
             )
+            if input_data.transform:
+                # Precomputed transforms, looked up on columns reaching a
+                # year back so the earliest points have values
+                columns = await self.data_provider.get_columns(
+                    input_data.series_id,
+                    input_data.start_year - 1 if input_data.start_year else None,
+                    input_data.end_year,
+                )
+                result = {
+                    **result,
+                    "data": annotate(result["data"], columns, input_data.transform),
+                    "transform": input_data.transform,
+                }
             logger.info(
-                f"Successfully fetched {result['count']} data points for {input_data.series_id}"
+                "Successfully fetched %s data points for %s",
+                result["count"],
+                input_data.series_id,
             )
             return result
         except ValueError as e:
-            logger.warning(f"Series not found: {e}")
+            logger.warning("Series not found: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error fetching series: {e}")
+            logger.error("Error fetching series: %s", e)
             return {"error": f"Failed to fetch series: {str(e)}"}
+
+    async def stream(self, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream get_series results: a header chunk, then pages of data points.
+
+        The header carries ``series_id``, ``metadata`` and ``count``; each
+        page is ``{"data": [...]}`` with at most ``page_size`` points.
+        """
+        logger.info("Streaming get_series with arguments: %s", arguments)
+
+        input_data, error = self._validate(arguments)
+        if input_data is None:
+            yield error or {}
+            return
+        if input_data.transform:
+            yield await self.execute(arguments)
+            return
+
+        try:
+            async for chunk in self.data_provider.iter_series(
+                input_data.series_id,
+                input_data.start_year,
+                input_data.end_year,
+                page_size=self.page_size,
+            ):
+                yield chunk
+        except ValueError as e:
+            logger.warning("Series not found: %s", e)
+            yield {"error": str(e)}
+        except Exception as e:
+            logger.error("Error streaming series: %s", e)
+            yield {"error": f"Failed to fetch series: {str(e)}"}
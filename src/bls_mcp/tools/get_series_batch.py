@@ -0,0 +1,221 @@
+"""Batch get series tool for fetching many BLS series in one call."""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..data.base import DataProvider
+from ..utils.logger import get_request_logger
+from ..utils.validators import (
+    find_invalid_series_ids,
+    validate_limit,
+    validate_year_range,
+)
+from .base import BaseTool
+
+logger = get_request_logger(__name__)
+
+MAX_BATCH_SIZE = 200
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class YearRange(BaseModel):
+    """Per-series year range override."""
+
+    start_year: Optional[int] = Field(default=None, description="Start year (optional)")
+    end_year: Optional[int] = Field(default=None, description="End year (optional)")
+
+
+class GetSeriesBatchInput(BaseModel):
+    """Input schema for get_series_batch tool."""
+
+    series_ids: List[str] = Field(
+        description=(
+            "BLS series IDs to fetch (e.g., ['CUUR0000SA0', 'CUUR0000SAF']). "
+            f"At most {MAX_BATCH_SIZE}."
+        )
+    )
+    start_year: Optional[int] = Field(
+        default=None, description="Start year applied to every series (optional)"
+    )
+    end_year: Optional[int] = Field(
+        default=None, description="End year applied to every series (optional)"
+    )
+    year_ranges: Optional[Dict[str, YearRange]] = Field(
+        default=None,
+        description="Per-series year ranges keyed by series ID, overriding the shared range (optional)",
+    )
+
+
+class GetSeriesBatchTool(BaseTool):
+    """Tool for fetching several BLS data series concurrently."""
+
+    def __init__(
+        self, data_provider: DataProvider, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> None:
+        """
+        Initialize tool with data provider.
+
+        Args:
+            data_provider: Data provider to fetch from
+            max_concurrency: Maximum provider calls in flight per batch
+        """
+        self.data_provider = data_provider
+        self.max_concurrency = max_concurrency
+
+    @property
+    def name(self) -> str:
+        return "get_series_batch"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Fetch several BLS data series in one call, with a shared or per-series "
+            "date range. Returns each series' data points and metadata, plus a "
+            "separate error for each series that could not be fetched."
+        )
+
+    @property
+    def input_schema(self) -> type[BaseModel]:
+        return GetSeriesBatchInput
+
+    async def _fetch_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        series_id: str,
+        start_year: Optional[int],
+        end_year: Optional[int],
+    ) -> Dict[str, Any]:
+        """Fetch one series, returning ``{"error": ...}`` on failure."""
+        is_valid, error_msg = validate_year_range(start_year, end_year)
+        if not is_valid:
+            return {"error": error_msg}
+
+        async with semaphore:
+            try:
+                return await self.data_provider.get_series(
+                    series_id=series_id, start_year=start_year, end_year=end_year
+                )
+            except ValueError as e:
+                return {"error": str(e)}
+            except Exception as e:
+                logger.error("Error fetching series %s: %s", series_id, e)
+                return {"error": f"Failed to fetch series: {str(e)}"}
+
+    def _plan(
+        self, arguments: Dict[str, Any]
+    ) -> Tuple[
+        List[Tuple[str, Optional[int], Optional[int]]],
+        Dict[str, str],
+        Optional[Dict[str, Any]],
+    ]:
+        """
+        Validate arguments and resolve each series' year range.
+
+        Returns:
+            ``(requests, invalid, error)``; requests are ``(series_id, start,
+            end)`` in request order with duplicates removed, and ``invalid``
+            maps malformed series IDs, which are not requested, to their error
+        """
+        try:
+            input_data = self.validate_input(GetSeriesBatchInput, arguments)
+        except Exception as e:
+            logger.error("Input validation failed: %s", e)
+            return [], {}, {"error": f"Invalid input: {str(e)}"}
+
+        # Drop duplicates, keeping request order
+        series_ids = list(dict.fromkeys(input_data.series_ids))
+        is_valid, error_msg = validate_limit(len(series_ids), max_limit=MAX_BATCH_SIZE)
+        if not is_valid:
+            return [], {}, {"error": f"Invalid batch size: {error_msg}"}
+
+        # Check every ID in one pass rather than once per fetch
+        invalid = {
+            series_id: f"Invalid series ID format: {series_id}"
+            for series_id in find_invalid_series_ids(series_ids)
+        }
+
+        year_ranges = input_data.year_ranges or {}
+        requests = []
+        for series_id in series_ids:
+            if series_id in invalid:
+                continue
+            if series_id in year_ranges:
+                requests.append(
+                    (
+                        series_id,
+                        year_ranges[series_id].start_year,
+                        year_ranges[series_id].end_year,
+                    )
+                )
+            else:
+                requests.append((series_id, input_data.start_year, input_data.end_year))
+        return requests, invalid, None
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute get_series_batch tool."""
+        logger.info("Executing get_series_batch with arguments: %s", arguments)
+
+        # Validate input
+        requests, errors, error = self._plan(arguments)
+        if error is not None:
+            return error
+        requested = len(requests) + len(errors)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._fetch_one(semaphore, *request) for request in requests)
+        )
+
+        series: List[Dict[str, Any]] = []
+        for (series_id, _, _), result in zip(requests, results):
+            if "error" in result:
+                errors[series_id] = result["error"]
+            else:
+                series.append(result)
+
+        logger.info(
+            "Fetched %s of %s series in batch (%s errors)",
+            len(series),
+            requested,
+            len(errors),
+        )
+        return {
+            "series": series,
+            "errors": errors,
+            "count": len(series),
+            "requested": requested,
+        }
+
+    async def stream(self, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream batch results: one ``{"series": ...}`` chunk per series as it
+        completes, then a summary chunk with ``errors``, ``count`` and
+        ``requested``.
+        """
+        logger.info("Streaming get_series_batch with arguments: %s", arguments)
+
+        requests, errors, error = self._plan(arguments)
+        if error is not None:
+            yield error
+            return
+        requested = len(requests) + len(errors)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(
+            request: Tuple[str, Optional[int], Optional[int]]
+        ) -> Tuple[str, Dict[str, Any]]:
+            return request[0], await self._fetch_one(semaphore, *request)
+
+        count = 0
+        for next_done in asyncio.as_completed([fetch(request) for request in requests]):
+            series_id, result = await next_done
+            if "error" in result:
+                errors[series_id] = result["error"]
+            else:
+                count += 1
+                yield {"series": result}
+
+        yield {"errors": errors, "count": count, "requested": requested}
@@ -4,12 +4,12 @@ from typing import Any, Dict
 
 from pydantic import BaseModel, Field
 
-from ..data.mock_data import MockDataProvider
-from ..utils.logger import get_logger
+from ..data.base import DataProvider
+from ..utils.logger import get_request_logger
 from ..utils.validators import validate_series_id
 from .base import BaseTool
 
-logger = get_logger(__name__)
+logger = get_request_logger(__name__)
 
 
 class GetSeriesInfoInput(BaseModel):
@@ -21,7 +21,7 @@ class GetSeriesInfoInput(BaseModel):
 class GetSeriesInfoTool(BaseTool):
     """Tool for getting BLS series metadata."""
 
-    def __init__(self, data_provider: MockDataProvider) -> None:
+    def __init__(self, data_provider: DataProvider) -> None:
         """Initialize tool with data provider."""
         self.data_provider = data_provider
 
@@ -42,13 +42,13 @@ class GetSeriesInfoTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute get_series_info tool."""
-        logger.info(f"Executing get_series_info with arguments: {arguments}")
+        logger.info("Executing get_series_info with arguments: %s", arguments)
 
         # Validate input
         try:
-            input_data = GetSeriesInfoInput(**arguments)
+            input_data = self.validate_input(GetSeriesInfoInput, arguments)
         except Exception as e:
-            logger.error(f"Input validation failed: {e}")
+            logger.error("Input validation failed: %s", e)
             return {"error": f"Invalid input: {str(e)}"}
 
         # Validate series ID format
@@ -60,11 +60,11 @@ class GetSeriesInfoTool(BaseTool):
             info = await self.data_provider.get_series_info(
                 series_id=input_data.series_id
             )
-            logger.info(f"Successfully retrieved info for {input_data.series_id}")
+            logger.info("Successfully retrieved info for %s", input_data.series_id)
             return info
         except ValueError as e:
-            logger.warning(f"Series not found: {e}")
+            logger.warning("Series not found: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error getting series info: {e}")
+            logger.error("Error getting series info: %s", e)
             return {"error": f"Failed to get series info: {str(e)}"}
@@ -4,12 +4,12 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
 
-from ..data.mock_data import MockDataProvider
-from ..utils.logger import get_logger
+from ..data.base import SERIES_FILTERS, DataProvider
+from ..utils.logger import get_request_logger
 from ..utils.validators import validate_limit
 from .base import BaseTool
 
-logger = get_logger(__name__)
+logger = get_request_logger(__name__)
 
 
 class ListSeriesInput(BaseModel):
@@ -19,15 +19,40 @@ class ListSeriesInput(BaseModel):
         default=None,
         description="Filter by category (e.g., 'CPI', 'Employment'). Optional.",
     )
+    survey_name: Optional[str] = Field(
+        default=None,
+        description="Filter by survey name (e.g., 'Consumer Price Index'). Optional.",
+    )
+    area: Optional[str] = Field(
+        default=None,
+        description="Filter by area (e.g., 'U.S. City Average'). Optional.",
+    )
+    item: Optional[str] = Field(
+        default=None, description="Filter by item (e.g., 'Food'). Optional."
+    )
+    seasonality: Optional[str] = Field(
+        default=None,
+        description=(
+            "Filter by seasonality ('Seasonally Adjusted' or "
+            "'Not Seasonally Adjusted'). Optional."
+        ),
+    )
     limit: int = Field(
         default=50, description="Maximum number of results to return (default: 50)"
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Opaque cursor from a previous response's next_cursor, to fetch the "
+            "next page. Optional."
+        ),
+    )
 
 
 class ListSeriesTool(BaseTool):
     """Tool for listing available BLS series."""
 
-    def __init__(self, data_provider: MockDataProvider) -> None:
+    def __init__(self, data_provider: DataProvider) -> None:
         """Initialize tool with data provider."""
         self.data_provider = data_provider
 
@@ -38,8 +63,10 @@ class ListSeriesTool(BaseTool):
     @property
     def description(self) -> str:
         return (
-            "List available BLS data series with optional category filtering. "
-            "Returns series metadata including titles, IDs, and categories."
+            "List available BLS data series, optionally filtered by category, "
+            "survey, area, item and seasonality (case-insensitive exact matches). "
+            "Returns series metadata including titles, IDs, and categories. "
+            "Results are paginated: pass next_cursor back as cursor for the next page."
         )
 
     @property
@@ -48,13 +75,13 @@ class ListSeriesTool(BaseTool):
 
     async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute list_series tool."""
-        logger.info(f"Executing list_series with arguments: {arguments}")
+        logger.info("Executing list_series with arguments: %s", arguments)
 
         # Validate input
         try:
-            input_data = ListSeriesInput(**arguments)
+            input_data = self.validate_input(ListSeriesInput, arguments)
         except Exception as e:
-            logger.error(f"Input validation failed: {e}")
+            logger.error("Input validation failed: %s", e)
             return {"error": f"Invalid input: {str(e)}"}
 
         # Validate limit
@@ -62,17 +89,37 @@ class ListSeriesTool(BaseTool):
         if not is_valid:
             return {"error": error_msg}
 
-        # List series
+        filters = {
+            name: getattr(input_data, name)
+            for name in SERIES_FILTERS
+            if getattr(input_data, name)
+        }
+
+        # List one page of series
         try:
-            series_list = await self.data_provider.list_series(
-                category=input_data.category, limit=input_data.limit
+            page = await self.data_provider.list_series_page(
+                category=input_data.category,
+                limit=input_data.limit,
+                cursor=input_data.cursor,
+                **filters,
             )
-            logger.info(f"Successfully listed {len(series_list)} series")
-            return {
-                "series": series_list,
-                "count": len(series_list),
-                "category_filter": input_data.category,
-            }
+        except ValueError as e:
+            logger.error("Invalid cursor: %s", e)
+            return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error listing series: {e}")
+            logger.error("Error listing series: %s", e)
             return {"error": f"Failed to list series: {str(e)}"}
+
+        series_list = page["series"]
+        logger.info("Successfully listed %s series", len(series_list))
+        result = {
+            "series": series_list,
+            "count": len(series_list),
+            "category_filter": input_data.category,
+            "next_cursor": page["next_cursor"],
+        }
+        if filters:
+            result["filters"] = filters
+        if page.get("total") is not None:
+            result["total"] = page["total"]
+        return result
@@ -0,0 +1,81 @@
+"""Search series tool for finding BLS series by keyword."""
+
+from typing import Any, Dict
+
+from pydantic import BaseModel, Field
+
+from ..data.base import DataProvider
+from ..utils.logger import get_request_logger
+from ..utils.validators import validate_limit
+from .base import BaseTool
+
+logger = get_request_logger(__name__)
+
+
+class SearchSeriesInput(BaseModel):
+    """Input schema for search_series tool."""
+
+    query: str = Field(
+        description="Keywords to search for (e.g., 'food at home', 'gasol'). "
+        "Words also match as prefixes."
+    )
+    limit: int = Field(
+        default=10, description="Maximum number of results to return (default: 10)"
+    )
+
+
+class SearchSeriesTool(BaseTool):
+    """Tool for searching the BLS series catalog."""
+
+    def __init__(self, data_provider: DataProvider) -> None:
+        """Initialize tool with data provider."""
+        self.data_provider = data_provider
+
+    @property
+    def name(self) -> str:
+        return "search_series"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Search BLS data series by keywords across titles, items, areas, "
+            "surveys and categories. Returns the best-matching series first."
+        )
+
+    @property
+    def input_schema(self) -> type[BaseModel]:
+        return SearchSeriesInput
+
+    async def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute search_series tool."""
+        logger.info("Executing search_series with arguments: %s", arguments)
+
+        # Validate input
+        try:
+            input_data = self.validate_input(SearchSeriesInput, arguments)
+        except Exception as e:
+            logger.error("Input validation failed: %s", e)
+            return {"error": f"Invalid input: {str(e)}"}
+
+        if not input_data.query.strip():
+            return {"error": "Query must not be empty"}
+
+        # Validate limit
+        is_valid, error_msg = validate_limit(input_data.limit, max_limit=100)
+        if not is_valid:
+            return {"error": error_msg}
+
+        # Search series
+        try:
+            results = await self.data_provider.search_series(
+                input_data.query, limit=input_data.limit
+            )
+            logger.info("Found %s series for query '%s'", len(results), input_data.query)
+            return {
+                "query": input_data.query,
+                "series": results,
+                "count": len(results),
+            }
+        except Exception as e:
+            logger.error("Error searching series: %s", e)
+            return {"error": f"Failed to search series: {str(e)}"}
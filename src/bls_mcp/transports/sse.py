@@ -1,31 +1,129 @@
 """SSE transport implementation for remote MCP server access."""
 
 import asyncio
-import json
-from typing import Any, Dict, Optional
+import contextlib
+import os
+from typing import Any, AsyncIterator, Dict, Optional
 
 from sse_starlette import EventSourceResponse
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Route
 
-from ..utils.logger import get_logger
+from ..dispatch import ToolDispatcher
+from ..metrics import CONTENT_TYPE
+from ..rpc import RPCHandler, error_response
+from ..utils.logger import get_logger, get_request_logger
+from ..utils.serialization import dumps, loads
 
 logger = get_logger(__name__)
+request_logger = get_request_logger(__name__)
+
+
+class RawJSONResponse(Response):
+    """Response whose body is already-encoded JSON."""
+
+    media_type = "application/json"
+
+
+def _wants_stream(request: Request, params: Dict[str, Any]) -> bool:
+    """
+    Return whether the client opted in to a chunked tool result.
+
+    Spec clients send ``Accept: text/event-stream`` on every request and
+    expect the complete result in the JSON-RPC response, so the header alone
+    is not enough: the call must also set ``_meta.stream`` in its params.
+    """
+    meta = params.get("_meta")
+    return (
+        isinstance(meta, dict)
+        and meta.get("stream") is True
+        and "text/event-stream" in request.headers.get("accept", "")
+    )
+
+
+async def _stream_tool_call(
+    dispatcher: ToolDispatcher, name: str, arguments: Dict[str, Any], request_id: Any
+) -> AsyncIterator[Dict[str, str]]:
+    """
+    Run a tool and emit its result as a stream of SSE ``message`` events.
+
+    Each chunk the tool yields is serialized and sent on its own as a
+    ``notifications/tools/chunk`` notification, so the client can start
+    decoding before the whole result exists. The stream ends with the
+    JSON-RPC response for the request, whose ``_meta`` gives the chunk count.
+    """
+    chunks = 0
+    is_error = False
+    try:
+        async for chunk in dispatcher.stream(name, arguments):
+            is_error = is_error or "error" in chunk
+            yield {
+                "event": "message",
+                "data": dumps({
+                    "jsonrpc": "2.0",
+                    "method": "notifications/tools/chunk",
+                    "params": {
+                        "requestId": request_id,
+                        "index": chunks,
+                        "content": [{"type": "text", "text": dumps(chunk)}],
+                    },
+                }),
+            }
+            chunks += 1
+    except Exception as e:
+        logger.error("Error streaming tool result: %s", e)
+        yield {
+            "event": "message",
+            "data": dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": -32603, "message": str(e)},
+            }),
+        }
+        return
+
+    yield {
+        "event": "message",
+        "data": dumps({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {
+                "content": [],
+                "isError": is_error,
+                "_meta": {"chunked": True, "chunks": chunks},
+            },
+        }),
+    }
 
 
 class SSETransport:
     """Server-Sent Events transport for MCP server."""
     
-    def __init__(self, mcp_server):
+    def __init__(self, mcp_server, max_batch_concurrency: Optional[int] = None):
+        """
+        Initialize the transport.
+
+        Args:
+            mcp_server: Server whose tool dispatcher handles requests
+            max_batch_concurrency: Maximum entries of a JSON-RPC batch run at
+                once (default: ``RPC_BATCH_MAX_CONCURRENCY``, or 16)
+        """
         self.mcp_server = mcp_server
+        self.dispatcher: ToolDispatcher = mcp_server.dispatcher
+        self.metrics = mcp_server.metrics
+        self.rpc = RPCHandler(mcp_server)
+        if max_batch_concurrency is None:
+            max_batch_concurrency = int(os.getenv("RPC_BATCH_MAX_CONCURRENCY", "16"))
+        self.max_batch_concurrency = max(1, max_batch_concurrency)
         self.app = self._create_app()
-    
+
     def _create_app(self):
         """Create Starlette app with SSE endpoints."""
+        dispatcher = self.dispatcher
         
         async def health_check(request: Request):
             """Health check endpoint."""
@@ -39,12 +137,17 @@ class SSETransport:
                 "transport": "SSE",
                 "endpoints": {
                     "health": "/health",
+                    "metrics": "/metrics",
                     "mcp": "/mcp (POST only)",
                     "sse": "/sse"
                 },
                 "description": "Bureau of Labor Statistics data server via MCP protocol"
             })
         
+        async def metrics_endpoint(request: Request):
+            """Server metrics in the Prometheus text exposition format."""
+            return Response(self.metrics.render(), media_type=CONTENT_TYPE)
+
         async def mcp_info(request: Request):
             """MCP endpoint info (GET request)."""
             return JSONResponse({
@@ -65,7 +168,7 @@ class SSETransport:
                     # Send initial connection event
                     yield {
                         "event": "connected",
-                        "data": json.dumps({
+                        "data": dumps({
                             "type": "connection",
                             "status": "established"
                         })
@@ -76,129 +179,84 @@ class SSETransport:
                         await asyncio.sleep(1)
                         yield {
                             "event": "ping",
-                            "data": json.dumps({"type": "ping"})
+                            "data": dumps({"type": "ping"})
                         }
                         
                 except asyncio.CancelledError:
                     logger.info("SSE connection cancelled")
                 except Exception as e:
-                    logger.error(f"SSE error: {e}")
+                    logger.error("SSE error: %s", e)
             
             return EventSourceResponse(event_generator())
         
         async def handle_mcp_request(request: Request):
-            """Handle MCP requests via HTTP POST."""
+            """Handle MCP requests, single or batched, via HTTP POST."""
             try:
-                body = await request.json()
-                logger.debug(f"Received MCP request: {body}")
-                
-                # Process MCP request through the actual MCP server
-                method = body.get("method")
-                params = body.get("params", {})
-                request_id = body.get("id")
-                
-                if method == "initialize":
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {
-                                "experimental": {},
-                                "tools": {"listChanged": False}
-                            },
-                            "serverInfo": {
-                                "name": "bls-mcp-server",
-                                "version": "1.18.0"
-                            }
-                        }
-                    }
-                elif method == "tools/list":
-                    tools = [
-                        {
-                            "name": "get_series",
-                            "description": "Fetch BLS data series by ID with optional date range filtering",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "series_id": {"type": "string", "description": "BLS series ID"},
-                                    "start_year": {"type": "integer", "description": "Start year"},
-                                    "end_year": {"type": "integer", "description": "End year"}
-                                },
-                                "required": ["series_id"]
-                            }
-                        },
-                        {
-                            "name": "list_series",
-                            "description": "List available BLS data series",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "category": {"type": "string", "description": "Filter by category"},
-                                    "limit": {"type": "integer", "description": "Maximum results"}
-                                }
-                            }
-                        },
-                        {
-                            "name": "get_series_info",
-                            "description": "Get detailed metadata about a series",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "series_id": {"type": "string", "description": "BLS series ID"}
-                                },
-                                "required": ["series_id"]
-                            }
-                        }
-                    ]
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": {"tools": tools}
-                    }
-                elif method == "tools/call":
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-                    
-                    # Call the actual MCP server tool
-                    if hasattr(self.mcp_server, 'tools') and tool_name in self.mcp_server.tools:
-                        tool = self.mcp_server.tools[tool_name]
-                        result = await tool.execute(arguments)
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "result": {
-                                "content": [{"type": "text", "text": str(result)}],
-                                "isError": False
-                            }
-                        }
-                    else:
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request_id,
-                            "error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}
-                        }
-                else:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {"code": -32601, "message": f"Unknown method: {method}"}
-                    }
-                
-                return JSONResponse(response)
-                
+                body = loads(await request.body())
             except Exception as e:
-                logger.error(f"Error handling MCP request: {e}")
-                return JSONResponse(
-                    {"jsonrpc": "2.0", "id": request_id, "error": {"code": -32603, "message": str(e)}},
-                    status_code=500
+                logger.error("Error parsing MCP request: %s", e)
+                return RawJSONResponse(
+                    error_response(None, -32700, f"Parse error: {e}"), status_code=400
                 )
+            request_logger.debug("Received MCP request: %s", body)
+
+            if isinstance(body, list):
+                if not body:
+                    return RawJSONResponse(
+                        error_response(None, -32600, "Invalid Request: empty batch"),
+                        status_code=400,
+                    )
+                # Run the entries concurrently, answering in request order;
+                # notifications get no entry in the reply
+                semaphore = asyncio.Semaphore(self.max_batch_concurrency)
+
+                async def bounded(message: Any) -> Optional[bytes]:
+                    async with semaphore:
+                        return await self.rpc.handle(message)
+
+                replies = await asyncio.gather(*(bounded(message) for message in body))
+                encoded = [reply for reply in replies if reply is not None]
+                if not encoded:
+                    return Response(status_code=202)
+                return RawJSONResponse(b"[" + b",".join(encoded) + b"]")
+
+            params = body.get("params") if isinstance(body, dict) else None
+            if (
+                isinstance(params, dict)
+                and body.get("method") == "tools/call"
+                and "id" in body
+                and _wants_stream(request, params)
+            ):
+                tool_name = params.get("name")
+                if tool_name in dispatcher:
+                    return EventSourceResponse(
+                        _stream_tool_call(
+                            dispatcher, tool_name, params.get("arguments", {}), body["id"]
+                        )
+                    )
+
+            reply = await self.rpc.handle(body)
+            if reply is None:
+                return Response(status_code=202)
+            return RawJSONResponse(reply)
         
+        @contextlib.asynccontextmanager
+        async def lifespan(app: Starlette):
+            """Warm the server before the app starts taking requests."""
+            await self.mcp_server.warm()
+            self.mcp_server.start_refresh()
+            try:
+                yield
+            finally:
+                await self.mcp_server.aclose()
+
         # Create Starlette app
         app = Starlette(
+            lifespan=lifespan,
             routes=[
                 Route("/", root_endpoint),
                 Route("/health", health_check),
+                Route("/metrics", metrics_endpoint),
                 Route("/sse", sse_endpoint),
                 Route("/mcp", handle_mcp_request, methods=["POST"]),
                 Route("/mcp", mcp_info, methods=["GET"]),
@@ -220,10 +278,10 @@ class SSETransport:
         """Run the SSE server."""
         import uvicorn
         
-        logger.info(f"Starting SSE server on {host}:{port}")
-        logger.info(f"Health check: http://{host}:{port}/health")
-        logger.info(f"SSE endpoint: http://{host}:{port}/sse")
-        logger.info(f"MCP endpoint: http://{host}:{port}/mcp")
+        logger.info("Starting SSE server on %s:%s", host, port)
+        logger.info("Health check: http://%s:%s/health", host, port)
+        logger.info("SSE endpoint: http://%s:%s/sse", host, port)
+        logger.info("MCP endpoint: http://%s:%s/mcp", host, port)
         
         config = uvicorn.Config(
             app=self.app,
@@ -233,3 +291,44 @@ class SSETransport:
         )
         server = uvicorn.Server(config)
         await server.serve()
+
+
+def create_app() -> Starlette:
+    """
+    Build the HTTP app for one worker process.
+
+    Used as a uvicorn app factory, so each worker creates its own server and
+    provider; the provider memory-maps the shared compiled dataset.
+    """
+    from ..server import BLSMCPServer
+
+    return SSETransport(BLSMCPServer()).app
+
+
+def run_workers(host: str = "localhost", port: int = 3000, workers: int = 1) -> None:
+    """
+    Run the HTTP server in ``workers`` processes sharing one listening socket.
+
+    The dataset is compiled once up front so the workers share it through
+    the page cache; each worker warms itself before accepting connections.
+    Blocks until the server exits.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        workers: Number of worker processes
+    """
+    import uvicorn
+
+    from ..server import prepare_shared_dataset
+
+    prepare_shared_dataset()
+    logger.info("Starting SSE server on %s:%s with %s workers", host, port, workers)
+    uvicorn.run(
+        "bls_mcp.transports.sse:create_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info",
+    )
@@ -0,0 +1,74 @@
+"""Fast-start stdio transport that speaks MCP without the MCP SDK."""
+
+import asyncio
+import sys
+from typing import Any, BinaryIO, Optional, Set
+
+from ..rpc import RPCHandler, error_response
+from ..utils.logger import get_logger
+from ..utils.serialization import loads
+
+logger = get_logger(__name__)
+
+
+class StdioTransport:
+    """
+    Newline-delimited JSON-RPC over stdin/stdout.
+
+    Importing the MCP SDK takes longer than everything else the server does
+    before its first response, which matters to clients that spawn a new
+    stdio session per conversation. This transport answers the handshake
+    and the tool listing from precomputed bytes and builds the tools and
+    data provider on the first tool call. Requests are handled concurrently,
+    so responses may be written out of order.
+    """
+
+    def __init__(
+        self,
+        mcp_server: Any,
+        stdin: Optional[BinaryIO] = None,
+        stdout: Optional[BinaryIO] = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            mcp_server: Server whose tools answer the requests
+            stdin: Stream to read requests from (default: ``sys.stdin``)
+            stdout: Stream to write responses to (default: ``sys.stdout``)
+        """
+        self.rpc = RPCHandler(mcp_server)
+        self.stdin = stdin if stdin is not None else sys.stdin.buffer
+        self.stdout = stdout if stdout is not None else sys.stdout.buffer
+
+    def _write(self, reply: bytes) -> None:
+        self.stdout.write(reply + b"\n")
+        self.stdout.flush()
+
+    async def _respond(self, line: bytes) -> None:
+        try:
+            message = loads(line)
+        except Exception as e:
+            logger.error("Error parsing MCP request: %s", e)
+            self._write(error_response(None, -32700, f"Parse error: {e}"))
+            return
+        reply = await self.rpc.handle(message)
+        if reply is not None:
+            self._write(reply)
+
+    async def run(self) -> None:
+        """Serve requests until stdin is closed, then finish pending ones."""
+        loop = asyncio.get_running_loop()
+        pending: Set["asyncio.Task[None]"] = set()
+        while True:
+            # Blocking reads run in a thread; pipes and files both work
+            line = await loop.run_in_executor(None, self.stdin.readline)
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(self._respond(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
@@ -1,26 +1,171 @@
-"""Logging configuration for BLS MCP server."""
+"""Logging configuration for BLS MCP server.
 
+Records are handed to a background thread through a queue with only their
+message rendered, so formatting the rest of the line, any traceback, and
+writing to stderr never block the event loop. Per-request messages go through a
+``SampledLogger``, which checks the level and the sampling rate before a
+record is created; together with %-style arguments this means a message
+that will not be written costs no string formatting.
+"""
+
+import atexit
+import copy
+import json
 import logging
+import queue
+import random
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional, TextIO
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Attributes every LogRecord has; anything else was passed in ``extra``
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "taskName"}
+
+# Fraction of per-request messages below WARNING that are kept
+_sample_rate = 1.0
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["DeferredQueueHandler"] = None
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue records with their message rendered, leaving the rest to the listener.
+
+    ``QueueHandler.prepare`` formats the whole record on the logging thread
+    and folds the traceback into ``msg``, which a JSON formatter then writes
+    twice. Here only the %-message is rendered, so the logged line shows
+    the arguments as they were at the call and the queue does not keep them
+    alive; the timestamp, level and traceback are formatted by the
+    listener. Records reaching this point already passed the level and
+    sampling checks.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of the record with its message rendered."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as JSON."""
+        entry = {
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class SampledLogger(logging.LoggerAdapter):
+    """
+    Logger for per-request messages.
+
+    Messages below WARNING are kept at the rate set by ``setup_logging``;
+    warnings and errors are always kept. The decision is made in
+    ``isEnabledFor``, before the record or its message is built.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        """
+        Wrap a logger.
 
+        Args:
+            logger: Logger to write kept messages to
+        """
+        super().__init__(logger, {})
 
-def setup_logging(log_level: str = "INFO") -> None:
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - logging API
+        """Return whether a message at ``level`` is written, sampling below WARNING."""
+        if not self.logger.isEnabledFor(level):
+            return False
+        if level >= logging.WARNING or _sample_rate >= 1.0:
+            return True
+        return random.random() < _sample_rate
+
+    def process(self, msg: Any, kwargs: Any) -> Any:
+        """Pass ``extra`` through unchanged."""
+        return msg, kwargs
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    sample_rate: float = 1.0,
+    log_format: str = "text",
+    stream: Optional[TextIO] = None,
+    force: bool = False,
+) -> None:
     """
     Configure logging for the MCP server.
 
+    The root logger gets a ``QueueHandler``; a listener thread formats the
+    records and writes them to ``stream``. Like ``logging.basicConfig``,
+    handlers are left alone if the root logger already has some that this
+    function did not install, unless ``force`` is set.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        sample_rate: Fraction of per-request messages below WARNING to keep
+        log_format: 'text' for human-readable lines, 'json' for one JSON
+            object per record
+        stream: Where to write (default: stderr, keeping stdout clean for
+            the MCP protocol)
+        force: Replace existing root handlers' configuration anyway
     """
+    global _listener, _queue_handler, _sample_rate
     level = getattr(logging, log_level.upper(), logging.INFO)
+    _sample_rate = min(max(sample_rate, 0.0), 1.0)
+
+    root = logging.getLogger()
+    if not force and any(h is not _queue_handler for h in root.handlers):
+        return
+
+    handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    if log_format.lower() == "json":
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
+
+    stop_logging()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = DeferredQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+
+
+def stop_logging() -> None:
+    """Write out queued records and stop the listener thread, if running."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
-    # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        stream=sys.stderr,  # Log to stderr to keep stdout clean for MCP protocol
-    )
+
+atexit.register(stop_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -34,3 +179,16 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(name)
+
+
+def get_request_logger(name: str) -> SampledLogger:
+    """
+    Get a logger for messages written on every request.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        Logger that samples messages below WARNING
+    """
+    return SampledLogger(logging.getLogger(name))
@@ -0,0 +1,65 @@
+"""Opaque cursors for paginated tool results."""
+
+import base64
+import zlib
+from typing import Any, Optional, Tuple
+
+
+def cursor_scope(kind: str, **filters: Optional[Any]) -> str:
+    """
+    Fingerprint the query a cursor belongs to.
+
+    Filters are normalized the way the catalog matches them: values compare
+    case-insensitively and unset (None or empty) filters are left out, so
+    equivalent queries share a scope.
+
+    Args:
+        kind: Name of the paginated operation
+        **filters: Filter values that define the result set
+
+    Returns:
+        Short hex digest; a cursor only decodes under the same scope
+    """
+    parts = (
+        kind,
+        sorted((name, str(value).casefold()) for name, value in filters.items() if value),
+    )
+    return f"{zlib.crc32(repr(parts).encode('utf-8')):08x}"
+
+
+def encode_cursor(offset: int, scope: str) -> str:
+    """Encode a result offset as an opaque, URL-safe cursor."""
+    raw = f"{scope}:{offset}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str) -> int:
+    """
+    Decode a cursor back to a result offset.
+
+    Args:
+        cursor: Value returned as ``next_cursor`` by an earlier page
+        scope: Scope of the current query, from ``cursor_scope``
+
+    Returns:
+        Offset of the first result on the page
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        found, offset = _split(base64.urlsafe_b64decode(padded).decode("ascii"))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor") from None
+    if found != scope:
+        raise ValueError("Cursor does not match the query it is used with")
+    return offset
+
+
+def _split(raw: str) -> Tuple[str, int]:
+    scope, _, offset = raw.partition(":")
+    value = int(offset)
+    if value < 0:
+        raise ValueError(offset)
+    return scope, value
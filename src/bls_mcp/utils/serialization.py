@@ -0,0 +1,121 @@
+"""JSON serialization for tool results and protocol messages."""
+
+import json
+import math
+import os
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+_pretty_default: Optional[bool] = None
+
+
+def _nan_to_none(obj: Any) -> Any:
+    """Replace non-finite floats with None, matching orjson's output."""
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, dict):
+        return {k: _nan_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(v) for v in obj]
+    return obj
+
+
+def backend() -> str:
+    """Return the name of the JSON library in use."""
+    return "orjson" if orjson is not None else "json"
+
+
+def set_pretty(pretty: Optional[bool]) -> None:
+    """
+    Set the default output style.
+
+    Args:
+        pretty: True for indented output, False for compact, None to read
+            the ``JSON_PRETTY`` environment variable again
+    """
+    global _pretty_default
+    _pretty_default = pretty
+
+
+def is_pretty() -> bool:
+    """Return whether output is indented by default."""
+    global _pretty_default
+    if _pretty_default is None:
+        _pretty_default = os.getenv("JSON_PRETTY", "false").lower() in ("1", "true", "yes")
+    return _pretty_default
+
+
+def dumps_bytes(obj: Any, pretty: Optional[bool] = None) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes.
+
+    Uses orjson when installed, the standard library otherwise. Output is
+    compact unless ``pretty`` (or the configured default) asks for indentation.
+    Non-finite floats are written as null so the output is always valid JSON.
+
+    Args:
+        obj: JSON-compatible object
+        pretty: Override the configured output style
+
+    Returns:
+        Encoded JSON
+    """
+    if pretty is None:
+        pretty = is_pretty()
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return dumps(obj, pretty=pretty).encode("utf-8")
+
+
+def dumps(obj: Any, pretty: Optional[bool] = None) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-compatible object
+        pretty: Override the configured output style
+
+    Returns:
+        Encoded JSON
+    """
+    if pretty is None:
+        pretty = is_pretty()
+
+    if orjson is not None:
+        return dumps_bytes(obj, pretty=pretty).decode("utf-8")
+
+    try:
+        return _stdlib_dumps(obj, pretty)
+    except ValueError:
+        # Non-finite floats; rewrite them as null and retry
+        return _stdlib_dumps(_nan_to_none(obj), pretty)
+
+
+def _stdlib_dumps(obj: Any, pretty: bool) -> str:
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, allow_nan=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,7 +1,26 @@
-"""Input validation utilities for BLS MCP server."""
+"""Input validation utilities for BLS MCP server.
+
+The series ID pattern is compiled once, at import, and IDs that passed are
+remembered, so checking an ID seen before is a set lookup.
+"""
 
 import re
-from typing import Optional
+from typing import Iterable, List, Optional, Set
+
+# Basic validation: a 2-4 letter survey prefix and 6-16 more alphanumerics,
+# so 8-20 characters in all, in either case
+SERIES_ID_PATTERN = re.compile(r"[A-Z]{2,4}[A-Z0-9]{6,16}", re.IGNORECASE)
+
+# Known-good series IDs are remembered up to this many, then forgotten at once
+MAX_KNOWN_SERIES_IDS = 65536
+
+_known_series_ids: Set[str] = set()
+
+
+def _remember(series_id: str) -> None:
+    if len(_known_series_ids) >= MAX_KNOWN_SERIES_IDS:
+        _known_series_ids.clear()
+    _known_series_ids.add(series_id)
 
 
 def validate_series_id(series_id: str) -> bool:
@@ -18,12 +37,35 @@ def validate_series_id(series_id: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not series_id:
+    if series_id in _known_series_ids:
+        return True
+    if not series_id or SERIES_ID_PATTERN.fullmatch(series_id) is None:
         return False
+    _remember(series_id)
+    return True
+
 
-    # Basic validation: 10-20 alphanumeric characters
-    pattern = r"^[A-Z]{2,4}[A-Z0-9]{6,16}$"
-    return bool(re.match(pattern, series_id.upper()))
+def find_invalid_series_ids(series_ids: Iterable[str]) -> List[str]:
+    """
+    Validate many series IDs in one pass.
+
+    Args:
+        series_ids: Series IDs to validate
+
+    Returns:
+        The IDs that are not valid, in the order given; empty if all are
+    """
+    known = _known_series_ids
+    fullmatch = SERIES_ID_PATTERN.fullmatch
+    invalid = []
+    for series_id in series_ids:
+        if series_id in known:
+            continue
+        if series_id and fullmatch(series_id) is not None:
+            _remember(series_id)
+        else:
+            invalid.append(series_id)
+    return invalid
 
 
 def validate_year_range(
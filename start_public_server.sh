@@ -10,6 +10,6 @@ cd /Users/rafaelkovashikawa/Downloads/projects/bls_food/bls_mcp
 echo "🧹 Cleaning up existing processes..."
 pkill -f ngrok 2>/dev/null || true
 
-# Start the server
-echo "🌐 Starting server with ngrok tunnel..."
+# Start the server (set MCP_WORKERS=N to run N worker processes)
+echo "🌐 Starting server with ngrok tunnel (${MCP_WORKERS:-1} worker(s))..."
 uv run python scripts/start_ngrok.py
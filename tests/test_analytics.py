@@ -0,0 +1,182 @@
+"""Tests for vectorized series statistics."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bls_mcp.analytics.compare import compare_series
+from bls_mcp.analytics.forecast import (
+    MODELS,
+    _known_span,
+    fit_model,
+    predict,
+    regularize,
+)
+from bls_mcp.analytics.stats import SeriesArrays, annualize, compute_series_stats, pct_change, rolling
+from bls_mcp.data.series_store import SeriesColumns
+
+
+def _monthly(values, first_year=2020, annual_averages=False):
+    """Build newest-first monthly points from oldest-first values."""
+    points = []
+    for i, value in enumerate(values):
+        year, month = first_year + i // 12, i % 12 + 1
+        points.append(
+            {"year": str(year), "period": f"M{month:02d}", "period_name": "", "value": str(value)}
+        )
+        if annual_averages and month == 12:
+            points.append({"year": str(year), "period": "M13", "period_name": "", "value": "0"})
+    return SeriesColumns.from_points("S", points[::-1])
+
+
+def test_arrays_drop_period_averages():
+    """Test that M13 annual averages are not treated as observations."""
+    arrays = SeriesArrays(_monthly(range(1, 25), annual_averages=True))
+
+    assert len(arrays) == 24
+    assert arrays.frequency == "monthly"
+    assert list(arrays.time[:2]) == [2020 * 12, 2020 * 12 + 1]
+    assert arrays.label(23) == "2021-M12"
+
+
+def test_changes_match_on_time_not_position():
+    """Test that a gap gives NaN instead of comparing the wrong periods."""
+    columns = _monthly([100, 110, 121])
+    arrays = SeriesArrays(columns)
+    change = pct_change(arrays, 1)
+
+    assert math.isnan(change[0])
+    assert change[1:] == pytest.approx([10.0, 10.0])
+
+    gapped = SeriesColumns.from_points(
+        "S",
+        [
+            {"year": "2020", "period": "M03", "period_name": "", "value": "121"},
+            {"year": "2020", "period": "M01", "period_name": "", "value": "100"},
+        ],
+    )
+    assert math.isnan(pct_change(SeriesArrays(gapped), 1)[1])
+
+
+def test_annualize_and_rolling():
+    """Test compounding to an annual rate and rolling windows."""
+    assert annualize(np.array([1.0]), 1, 12)[0] == pytest.approx((1.01**12 - 1) * 100)
+
+    out = rolling(np.arange(5, dtype=float), 3)
+    assert math.isnan(out[0, 1])
+    assert list(out[0, 2:]) == [1.0, 2.0, 3.0]
+    assert out[1, 2] == pytest.approx(1.0)
+
+
+def test_compute_series_stats_uses_prior_year():
+    """Test that year-over-year changes at the range start look back a year."""
+    columns = _monthly([100 * 1.01**i for i in range(36)])
+    stats = compute_series_stats(columns, start_year=2021, end_year=2021, include_series=True)
+
+    assert stats["observations"] == 12
+    assert stats["start"]["period"] == "2021-M01"
+    assert stats["yoy_pct"]["min"] == pytest.approx((1.01**12 - 1) * 100, abs=1e-3)
+    assert stats["latest"]["change_pct"] == pytest.approx(1.0, abs=1e-3)
+    assert stats["cagr_pct"] == pytest.approx(stats["yoy_pct"]["mean"], abs=1e-2)
+    assert None not in stats["series"]["yoy_pct"]
+
+
+def test_compute_series_stats_empty_range():
+    """Test that an empty range is an error."""
+    with pytest.raises(ValueError):
+        compute_series_stats(_monthly(range(1, 13)), start_year=2030)
+
+
+def test_compare_series_aligns_on_time():
+    """Test that series with different spans share one period axis."""
+    long = _monthly([100 + i for i in range(24)])
+    short = SeriesColumns.from_points(
+        "T",
+        [
+            {"year": "2021", "period": f"M{m:02d}", "period_name": "", "value": str(50 + m)}
+            for m in range(12, 0, -1)
+        ],
+    )
+
+    result = compare_series([long, short], start_year=2020)
+
+    assert result["series_ids"] == ["S", "T"]
+    assert len(result["periods"]) == 24
+    assert result["matrix"][0] == [100.0, None]
+    assert result["matrix"][12] == [112.0, 51.0]
+    assert result["spreads"]["latest"] == [0.0, 62.0 - 123.0]
+    assert result["contributions"]["span"] == ["2021-M01", "2021-M12"]
+
+
+def test_compare_series_correlation_and_contributions():
+    """Test correlations of changes and weighted contributions."""
+    up = _monthly([100 * 1.01**i for i in range(13)])
+    double = _monthly([100 * 1.02**i for i in range(13)])
+
+    result = compare_series([up, double], basis="mom", weights=[3, 1])
+
+    assert result["matrix"][1] == pytest.approx([1.0, 2.0])
+    assert result["contributions"]["change_pct"][1] > result["contributions"]["change_pct"][0]
+    assert sum(result["contributions"]["share"]) == pytest.approx(1.0)
+
+
+def test_compare_series_rejects_mixed_frequencies():
+    """Test that monthly and annual series cannot be aligned."""
+    annual = SeriesColumns.from_points(
+        "A", [{"year": "2020", "period": "A01", "period_name": "", "value": "1"}]
+    )
+
+    with pytest.raises(ValueError):
+        compare_series([_monthly(range(1, 13)), annual])
+
+
+def _seasonal(years=6):
+    """A trending monthly series with a fixed seasonal pattern."""
+    month = np.arange(years * 12)
+    return 100 + 0.5 * month + 3 * np.sin(2 * np.pi * month / 12)
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_forecast_models_follow_trend_and_season(model):
+    """Test that every model extends a clean trend and seasonal cycle."""
+    y = _seasonal()
+    fitted = fit_model(model, y, 12)
+    out = predict(fitted, 12)
+
+    month = np.arange(len(y), len(y) + 12)
+    expected = 100 + 0.5 * month + 3 * np.sin(2 * np.pi * month / 12)
+    tolerance = 7.0 if model == "seasonal_naive" else 1.5
+    assert np.abs(out["mean"] - expected).max() < tolerance
+    assert (out["lower"] <= out["mean"]).all() and (out["mean"] <= out["upper"]).all()
+
+
+def test_forecast_intervals_widen_with_horizon():
+    """Test that intervals grow with the horizon and shrink with the level."""
+    rng = np.random.default_rng(0)
+    y = _seasonal() + rng.normal(0, 0.5, 72)
+    fitted = fit_model("ets", y, 12)
+
+    wide = predict(fitted, 24, level=95)
+    narrow = predict(fitted, 24, level=80)
+    width = wide["upper"] - wide["lower"]
+    assert width[-1] > width[0]
+    assert ((narrow["upper"] - narrow["lower"]) < width).all()
+
+
+def test_regularize_fills_gaps():
+    """Test that missing periods are interpolated onto a regular grid."""
+    filled = regularize(np.array([0, 1, 3]), np.array([1.0, 2.0, 4.0]))
+
+    assert list(filled) == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_known_span_skips_missing_ends():
+    """Test that the fit window ignores missing values at either end."""
+    time = np.array([0, 1, 3, 4])
+
+    assert _known_span(time, np.array([np.nan, 2.0, 4.0, np.nan])) == (1, 3)
+    assert _known_span(time, np.array([1.0, 2.0, 4.0, 5.0])) == (0, 4)
+    with pytest.raises(ValueError):
+        _known_span(time, np.full(4, np.nan))
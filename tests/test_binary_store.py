@@ -0,0 +1,198 @@
+"""Tests for the compiled binary fixture format."""
+
+import json
+import shutil
+
+import pytest
+
+from bls_mcp.data.binary_store import (
+    VERSION,
+    BinarySeriesStore,
+    BinaryStoreWriter,
+    compile_fixture_file,
+    compile_historical_data,
+)
+from bls_mcp.data.mock_data import MockDataProvider
+from bls_mcp.data.series_store import build_series_store
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path):
+    """Copy the bundled fixtures into a temporary directory."""
+    source = MockDataProvider().fixtures_dir
+    for name in ("cpi_series.json", "historical_data.json"):
+        shutil.copy(source / name, tmp_path / name)
+    return tmp_path
+
+
+def test_round_trip_matches_json(fixtures_dir):
+    """Test that decoded series match columns built from JSON."""
+    with open(fixtures_dir / "historical_data.json") as f:
+        expected = build_series_store(json.load(f))
+
+    store = BinarySeriesStore(compile_fixture_file(fixtures_dir / "historical_data.json"))
+
+    assert sorted(store) == sorted(expected)
+    assert len(store) == len(expected)
+    for series_id, columns in expected.items():
+        assert store[series_id].rows() == columns.rows()
+        assert store.row_count(series_id) == len(columns)
+    assert "MISSING" not in store
+    with pytest.raises(KeyError):
+        store["MISSING"]
+    store.close()
+
+
+def test_footnotes_and_extras_survive(tmp_path):
+    """Test that footnotes and extra keys are preserved."""
+    points = [
+        {
+            "year": "2024",
+            "period": "Q02",
+            "period_name": "2nd Quarter",
+            "value": "-",
+            "footnotes": [{"code": "P"}],
+            "latest": "true",
+        },
+        {"year": "2024", "period": "Q01", "period_name": "1st Quarter", "value": "1.5"},
+    ]
+    path = compile_historical_data(
+        {"B": {"series_id": "B", "data": points}, "A": {"series_id": "A", "data": []}},
+        tmp_path / "data.bin",
+    )
+    store = BinarySeriesStore(path)
+
+    assert store["B"].rows() == points
+    assert store["A"].rows() == []
+    store.close()
+
+
+def test_writer_streams_series_in_any_order(tmp_path):
+    """Test that series added one at a time round-trip past the dedup limit."""
+    expected = {
+        series_id: [
+            {
+                "year": str(2000 + i),
+                "period": "A01",
+                "period_name": "Annual",
+                "value": f"{i}.{series_id}",
+            }
+            for i in range(3)
+        ]
+        for series_id in ("C", "A", "B")
+    }
+    with BinaryStoreWriter(tmp_path / "data.bin", max_shared_strings=2) as writer:
+        for series_id, points in expected.items():
+            writer.add_series(series_id, points)
+    store = BinarySeriesStore(writer.output_path)
+
+    assert list(store) == ["A", "B", "C"]
+    for series_id, points in expected.items():
+        assert store[series_id].rows() == points
+    store.close()
+
+
+def test_decoded_series_are_bounded(fixtures_dir):
+    """Test that the decoded-series LRU respects its bound."""
+    store = BinarySeriesStore(
+        compile_fixture_file(fixtures_dir / "historical_data.json"), max_decoded=1
+    )
+    for series_id in store:
+        store[series_id]
+
+    assert len(store._decoded) == 1
+    store.close()
+
+
+def test_rejects_non_fixture_file(tmp_path):
+    """Test opening a file that is not a compiled fixture."""
+    path = tmp_path / "bogus.bin"
+    path.write_bytes(b"not a fixture" * 20)
+
+    with pytest.raises(ValueError, match="not a compiled fixture"):
+        BinarySeriesStore(path)
+
+
+def test_rejects_empty_truncated_and_other_version_files(fixtures_dir):
+    """Test that unreadable compiled fixtures raise ValueError on open."""
+    path = compile_fixture_file(fixtures_dir / "historical_data.json")
+    data = path.read_bytes()
+    empty = fixtures_dir / "empty.bin"
+    empty.write_bytes(b"")
+    truncated = fixtures_dir / "truncated.bin"
+    truncated.write_bytes(data[: len(data) // 2])
+    other_version = fixtures_dir / "other.bin"
+    other_version.write_bytes(
+        data[:8] + (VERSION + 1).to_bytes(4, "little") + data[12:]
+    )
+
+    with pytest.raises(ValueError, match="not a compiled fixture"):
+        BinarySeriesStore(empty)
+    with pytest.raises(ValueError, match="truncated"):
+        BinarySeriesStore(truncated)
+    with pytest.raises(ValueError, match="version"):
+        BinarySeriesStore(other_version)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("contents", [b"", b"version"])
+async def test_provider_falls_back_from_unreadable_compiled_fixture(
+    fixtures_dir, contents
+):
+    """Test that a bad compiled fixture is skipped and then recompiled."""
+    path = fixtures_dir / "historical_data.bin"
+    if contents:
+        compile_fixture_file(fixtures_dir / "historical_data.json")
+        data = path.read_bytes()
+        contents = data[:8] + (VERSION + 1).to_bytes(4, "little") + data[12:]
+    path.write_bytes(contents)
+    provider = MockDataProvider(fixtures_dir=fixtures_dir)
+
+    result = await provider.get_series("CUUR0000SA0", start_year=2024)
+
+    assert not isinstance(provider._load_historical_data(), BinarySeriesStore)
+    assert result == await MockDataProvider().get_series("CUUR0000SA0", start_year=2024)
+    assert provider.ensure_compiled() == path
+    BinarySeriesStore(path).close()
+
+
+@pytest.mark.asyncio
+async def test_provider_prefers_compiled_fixture(fixtures_dir):
+    """Test that the provider memory-maps a compiled fixture when present."""
+    compile_fixture_file(fixtures_dir / "historical_data.json")
+    provider = MockDataProvider(fixtures_dir=fixtures_dir)
+
+    result = await provider.get_series("CUUR0000SA0", start_year=2024)
+    info = await provider.get_series_info("CUUR0000SA0")
+
+    assert isinstance(provider._load_historical_data(), BinarySeriesStore)
+    assert result == await MockDataProvider().get_series("CUUR0000SA0", start_year=2024)
+    assert info["data_point_count"] == 57
+
+
+def test_ensure_compiled_only_when_stale(fixtures_dir):
+    """Test that fixtures are compiled once and reused while current."""
+    provider = MockDataProvider(fixtures_dir=fixtures_dir)
+
+    path = provider.ensure_compiled()
+    mtime = path.stat().st_mtime_ns
+    provider.ensure_compiled()
+
+    assert path == fixtures_dir / "historical_data.bin"
+    assert path.stat().st_mtime_ns == mtime
+    assert isinstance(provider._load_historical_data(), BinarySeriesStore)
+
+
+def test_bundled_fixtures_compile_to_cache_dir(tmp_path, monkeypatch):
+    """Test that compiling the bundled fixtures leaves the package untouched."""
+    monkeypatch.setenv("BLS_MCP_CACHE_DIR", str(tmp_path))
+    provider = MockDataProvider()
+    bundled = provider.fixtures_dir / "historical_data.bin"
+    existed = bundled.exists()
+
+    path = provider.ensure_compiled()
+
+    assert path.is_relative_to(tmp_path)
+    assert bundled.exists() == existed
+    assert isinstance(provider._load_historical_data(), BinarySeriesStore)
+    provider._load_historical_data().close()
@@ -0,0 +1,243 @@
+"""Tests for the BLS API provider against a local stub server."""
+
+import asyncio
+import json
+from datetime import date
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from bls_mcp.data.bls_api import BLSApiProvider, QuotaExceededError, RateBudget
+
+
+class StubBLSServer:
+    """Minimal HTTP/1.1 keep-alive server speaking the BLS v2 data API."""
+
+    def __init__(self, known_series):
+        self.known_series = known_series
+        self.requests = []
+        self.connections = 0
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self):
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/publicAPI/v2/"
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().strip()
+                    if not line:
+                        break
+                    key, _, value = line.partition(":")
+                    headers[key.lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                payload = json.loads(body)
+                self.requests.append(payload)
+
+                response = json.dumps(self._respond(payload)).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(response)}\r\n\r\n".encode()
+                    + response
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, payload):
+        series = []
+        for series_id in payload["seriesid"]:
+            data = []
+            if series_id in self.known_series:
+                start = int(payload.get("startyear", 2023))
+                end = int(payload.get("endyear", 2024))
+                data = [
+                    {
+                        "year": str(year),
+                        "period": "M01",
+                        "periodName": "January",
+                        "value": f"{year}.0",
+                        "footnotes": [{}],
+                    }
+                    for year in range(end, start - 1, -1)
+                ]
+            series.append({"seriesID": series_id, "data": data})
+        return {"status": "REQUEST_SUCCEEDED", "message": [], "Results": {"series": series}}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_batched():
+    """Test that concurrent get_series calls share one multi-series POST."""
+    async with StubBLSServer({"CUUR0000SA0", "CUUR0000SAF"}) as stub:
+        provider = BLSApiProvider(base_url=stub.url)
+        results = await asyncio.gather(
+            provider.get_series("CUUR0000SA0", 2023, 2024),
+            provider.get_series("CUUR0000SAF", 2023, 2024),
+            provider.get_series("CUUR0000SA0", 2023, 2024),
+        )
+        await provider.aclose()
+
+    assert len(stub.requests) == 1
+    assert stub.requests[0]["seriesid"] == ["CUUR0000SA0", "CUUR0000SAF"]
+    assert results[0]["count"] == 2
+    assert results[0]["data"][0] == {
+        "year": "2024",
+        "period": "M01",
+        "period_name": "January",
+        "value": "2024.0",
+    }
+    assert results[0]["metadata"]["series_title"]
+    assert results[1]["series_id"] == "CUUR0000SAF"
+
+
+@pytest.mark.asyncio
+async def test_batched_callers_get_independent_results():
+    """Test that callers sharing a batched series do not share one result."""
+    async with StubBLSServer({"CUUR0000SA0"}) as stub:
+        provider = BLSApiProvider(base_url=stub.url)
+        first, second = await asyncio.gather(
+            provider.get_series("CUUR0000SA0", 2023, 2024),
+            provider.get_series("CUUR0000SA0", 2023, 2024),
+        )
+        await provider.aclose()
+
+    assert len(stub.requests) == 1
+    assert first == second
+    first["data"][0]["value"] = "0.0"
+    first["metadata"]["series_title"] = "changed"
+    first["data"].clear()
+
+    assert second["data"][0]["value"] == "2024.0"
+    assert second["metadata"]["series_title"] != "changed"
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_across_batches():
+    """Test that sequential batches reuse one keep-alive connection."""
+    async with StubBLSServer({"CUUR0000SA0"}) as stub:
+        provider = BLSApiProvider(base_url=stub.url, batch_window=0)
+        for _ in range(3):
+            await provider.get_series("CUUR0000SA0", 2024, 2024)
+        await provider.aclose()
+
+    assert len(stub.requests) == 3
+    assert stub.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_long_ranges_are_split():
+    """Test that ranges beyond the per-request year limit are chunked."""
+    async with StubBLSServer({"CUUR0000SA0"}) as stub:
+        provider = BLSApiProvider(base_url=stub.url)
+        result = await provider.get_series("CUUR0000SA0", 2001, 2024)
+        await provider.aclose()
+
+    assert [(r["startyear"], r["endyear"]) for r in stub.requests] == [
+        ("2015", "2024"),
+        ("2005", "2014"),
+        ("2001", "2004"),
+    ]
+    assert result["count"] == 24
+    assert result["data"][0]["year"] == "2024"
+    assert result["data"][-1]["year"] == "2001"
+
+
+@pytest.mark.asyncio
+async def test_unknown_series_raises():
+    """Test that a series without data surfaces as not found."""
+    async with StubBLSServer(set()) as stub:
+        provider = BLSApiProvider(base_url=stub.url)
+        with pytest.raises(ValueError, match="not found"):
+            await provider.get_series("CUUR0000XXX")
+        await provider.aclose()
+
+
+@pytest.mark.asyncio
+async def test_rate_budget_waits_for_window():
+    """Test that requests over the window limit wait instead of failing."""
+    now = [0.0]
+    budget = RateBudget(daily_limit=10, window_limit=2, window_seconds=0.05)
+    budget._clock = lambda: now[0]
+
+    await budget.acquire()
+    await budget.acquire()
+    waiter = asyncio.ensure_future(budget.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    now[0] = 0.05
+    await asyncio.wait_for(waiter, timeout=1)
+    assert budget.remaining_today == 7
+
+
+@pytest.mark.asyncio
+async def test_rate_budget_daily_quota():
+    """Test that the daily quota is enforced and resets on a new day."""
+    day = [date(2024, 1, 1)]
+    budget = RateBudget(daily_limit=1, today=lambda: day[0])
+
+    await budget.acquire()
+    with pytest.raises(QuotaExceededError):
+        await budget.acquire()
+
+    day[0] = date(2024, 1, 2)
+    await budget.acquire()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_releases_callers():
+    """Test that callers waiting on a cancelled batch do not hang."""
+    provider = BLSApiProvider(batch_window=0)
+
+    async def never_answers(series_ids, years):
+        await asyncio.Event().wait()
+
+    provider._post = never_answers
+    caller = asyncio.ensure_future(provider.get_series("CUUR0000SA0", 2024, 2024))
+    while not provider._tasks:
+        await asyncio.sleep(0)
+    for task in provider._tasks:
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(caller, timeout=1)
+    await provider.aclose()
+
+
+@pytest.mark.asyncio
+async def test_series_info_is_cached():
+    """Test that repeated get_series_info calls spend one request until expiry."""
+    now = [0.0]
+    async with StubBLSServer({"CUUR0000SA0"}) as stub:
+        provider = BLSApiProvider(
+            base_url=stub.url, batch_window=0, info_ttl=60, clock=lambda: now[0]
+        )
+        first = await provider.get_series_info("CUUR0000SA0")
+        first["data_point_count"] = -1
+        second = await provider.get_series_info("CUUR0000SA0")
+        now[0] = 61
+        await provider.get_series_info("CUUR0000SA0")
+        await provider.aclose()
+
+    assert len(stub.requests) == 2
+    assert second["available_data"] is True
+    assert second["data_point_count"] > 0
@@ -0,0 +1,216 @@
+"""Tests for the tiered response cache."""
+
+import copy
+from datetime import datetime, timezone
+
+import pytest
+
+from bls_mcp.data.cache import CachingDataProvider, ReleaseCalendar
+from bls_mcp.data.mock_data import MockDataProvider
+
+
+class CountingProvider(MockDataProvider):
+    """Mock provider that counts get_series calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def get_series(self, series_id, start_year=None, end_year=None):
+        self.calls += 1
+        return await super().get_series(series_id, start_year, end_year)
+
+
+@pytest.fixture
+def provider():
+    """Create a counting mock provider."""
+    return CountingProvider()
+
+
+@pytest.mark.asyncio
+async def test_exact_hit(provider):
+    """Test that repeated requests are served from memory."""
+    cache = CachingDataProvider(provider)
+
+    first = await cache.get_series("CUUR0000SA0", 2023, 2024)
+    second = await cache.get_series("CUUR0000SA0", 2023, 2024)
+
+    assert first == second
+    assert provider.calls == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_superset_hit(provider):
+    """Test that a narrower range is sliced from a cached wider one."""
+    cache = CachingDataProvider(provider)
+
+    await cache.get_series("CUUR0000SA0")
+    narrow = await cache.get_series("CUUR0000SA0", 2023, 2023)
+
+    assert provider.calls == 1
+    assert cache.superset_hits == 1
+    assert narrow == await provider.get_series("CUUR0000SA0", 2023, 2023)
+
+
+@pytest.mark.asyncio
+async def test_superset_hit_open_ranges(provider):
+    """Test slicing ranges open at either end from a cached full series."""
+    cache = CachingDataProvider(provider)
+    await cache.get_series("CUUR0000SA0", 2000)
+
+    for start, end in ((2022, None), (2000, 2021), (2021, 2022)):
+        expected = await provider.get_series("CUUR0000SA0", start, end)
+        assert await cache.get_series("CUUR0000SA0", start, end) == expected
+    assert cache.superset_hits == 3
+
+
+@pytest.mark.asyncio
+async def test_mutating_a_result_does_not_corrupt_the_cache(provider):
+    """Test that callers get copies of cached results."""
+    cache = CachingDataProvider(provider)
+    expected = copy.deepcopy(await provider.get_series("CUUR0000SA0"))
+
+    for start_year in (None, None, 2023):
+        result = await cache.get_series("CUUR0000SA0", start_year)
+        result["data"][0]["value"] = "0"
+        result["data"].pop()
+        result["metadata"]["series_title"] = "changed"
+
+    assert await cache.get_series("CUUR0000SA0") == expected
+    assert cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_byte_cap_evicts_least_recent(provider):
+    """Test that the memory cap evicts the least recently used entry."""
+    cache = CachingDataProvider(provider)
+    await cache.get_series("CUUR0000SA0", 2024, 2024)
+    one_entry = cache.current_bytes
+    cache.clear()
+    cache.max_bytes = one_entry * 2 + one_entry // 2
+
+    await cache.get_series("CUUR0000SA0", 2024, 2024)
+    await cache.get_series("CUUR0000SAF", 2024, 2024)
+    await cache.get_series("CUUR0000SA0", 2024, 2024)
+    await cache.get_series("CUUR0000SA0", 2023, 2023)
+
+    assert cache.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+    assert ("CUUR0000SAF", 2024, 2024) not in cache._entries
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(provider, tmp_path):
+    """Test that the SQLite tier serves a fresh process."""
+    path = tmp_path / "cache.sqlite"
+    cache = CachingDataProvider(provider, disk_path=path)
+    expected = await cache.get_series("CUUR0000SAF", 2022, 2024)
+    await cache.aclose()
+
+    restarted = CachingDataProvider(provider, disk_path=path)
+    result = await restarted.get_series("CUUR0000SAF", 2022, 2024)
+
+    assert result == expected
+    assert provider.calls == 1
+    assert restarted.disk_hits == 1
+    await restarted.aclose()
+
+
+@pytest.mark.asyncio
+async def test_invalidate(provider, tmp_path):
+    """Test that invalidation drops every tier for a series."""
+    cache = CachingDataProvider(provider, disk_path=tmp_path / "cache.sqlite")
+    await cache.get_series("CUUR0000SA0")
+    cache.invalidate("CUUR0000SA0")
+    await cache.get_series("CUUR0000SA0")
+
+    assert provider.calls == 2
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_series_served_from_cache(provider):
+    """Test that a cached series streams without calling the provider."""
+    cache = CachingDataProvider(provider)
+    expected = await cache.get_series("CUUR0000SA0")
+
+    chunks = [c async for c in cache.iter_series("CUUR0000SA0", 2023, 2024, page_size=10)]
+
+    assert provider.calls == 1
+    assert [p for c in chunks[1:] for p in c["data"]] == [
+        p for p in expected["data"] if p["year"] in ("2023", "2024")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_columns_uses_cache_for_non_columnar_provider(provider):
+    """Test that columns for a non-columnar provider come from cached results."""
+    provider.columnar = False
+    cache = CachingDataProvider(provider)
+    await cache.get_series("CUUR0000SA0")
+
+    columns = await cache.get_columns("CUUR0000SA0", 2023, 2024)
+
+    assert provider.calls == 1
+    assert columns.rows() == (await provider.get_series("CUUR0000SA0", 2023, 2024))["data"]
+
+
+def test_release_calendar():
+    """Test expiry at the next scheduled or typical release."""
+    now = datetime(2024, 10, 20, tzinfo=timezone.utc)
+    scheduled = datetime(2024, 11, 13, 13, 30, tzinfo=timezone.utc)
+    calendar = ReleaseCalendar(schedules={"CU": [scheduled]})
+
+    assert calendar.next_release("CUUR0000SA0", now) == scheduled
+    assert calendar.next_release("CES0000000001", now) == datetime(
+        2024, 11, 7, 13, 30, tzinfo=timezone.utc
+    )
+    assert calendar.next_release("ZZ", datetime(2024, 12, 20, tzinfo=timezone.utc)).month == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_racing_invalidate_is_not_cached(provider):
+    """Test that a result fetched before an invalidation is not cached."""
+    cache = CachingDataProvider(provider)
+    fetch = provider.get_series
+
+    async def invalidated_mid_fetch(series_id, start_year=None, end_year=None):
+        result = await fetch(series_id, start_year, end_year)
+        cache.invalidate(series_id)
+        return result
+
+    provider.get_series = invalidated_mid_fetch
+    await cache.get_series("CUUR0000SA0")
+    provider.get_series = fetch
+    await cache.get_series("CUUR0000SA0")
+
+    assert provider.calls == 2
+    assert cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_hit_racing_invalidate_is_not_promoted(provider, tmp_path):
+    """Test that a disk row read before an invalidation stays out of memory."""
+    path = tmp_path / "cache.sqlite"
+    writer = CachingDataProvider(provider, disk_path=path)
+    await writer.get_series("CUUR0000SA0")
+    await writer.aclose()
+
+    cache = CachingDataProvider(provider, disk_path=path)
+    read = cache._disk.get
+
+    def invalidated_mid_read(key, now):
+        stored = read(key, now)
+        cache.invalidate(key[0])
+        return stored
+
+    cache._disk.get = invalidated_mid_read
+    await cache.get_series("CUUR0000SA0")
+    cache._disk.get = read
+    await cache.get_series("CUUR0000SA0")
+
+    assert cache.disk_hits == 1
+    assert provider.calls == 2
+    await cache.aclose()
@@ -0,0 +1,60 @@
+"""Tests for the series catalog index."""
+
+import pytest
+
+from bls_mcp.data.catalog import SeriesCatalogIndex
+
+
+@pytest.fixture
+def catalog_index():
+    """Create a small catalog index."""
+    return SeriesCatalogIndex(
+        [
+            {"series_id": "A", "category": "CPI", "area": "West", "item": "Food"},
+            {"series_id": "B", "category": "CPI", "area": "South", "item": "Food"},
+            {"series_id": "C", "category": "CES", "area": "West", "item": "Jobs"},
+        ]
+    )
+
+
+def test_get_by_id(catalog_index):
+    """Test primary key lookups."""
+    assert catalog_index.get("B")["area"] == "South"
+    assert catalog_index.get("MISSING") is None
+    assert "A" in catalog_index
+    assert len(catalog_index) == 3
+
+
+def test_find_single_field_is_case_insensitive(catalog_index):
+    """Test secondary index lookups ignore case."""
+    result = catalog_index.find(category="cpi")
+
+    assert [s["series_id"] for s in result] == ["A", "B"]
+
+
+def test_find_multiple_fields(catalog_index):
+    """Test combined filters intersect in catalog order."""
+    assert [s["series_id"] for s in catalog_index.find(area="West")] == ["A", "C"]
+    assert [s["series_id"] for s in catalog_index.find(area="West", item="Food")] == ["A"]
+    assert catalog_index.find(category="PPI") == []
+
+
+def test_find_without_filters_returns_catalog(catalog_index):
+    """Test that no filters returns every entry."""
+    assert len(catalog_index.find(category=None)) == 3
+
+
+def test_find_unindexed_field(catalog_index):
+    """Test filtering on a field without an index."""
+    with pytest.raises(ValueError, match="not indexed"):
+        catalog_index.find(series_title="x")
+
+
+def test_iter_page_reuses_filter_results(catalog_index):
+    """Test paging by offset and that multi-field results are built once."""
+    first = catalog_index.find(area="West", category="CPI")
+
+    assert catalog_index.find(category="cpi", area="west") is first
+    assert [s["series_id"] for s in catalog_index.iter_page(1, 5)] == ["B", "C"]
+    assert list(catalog_index.iter_page(3, 5)) == []
+    assert catalog_index.count(category="CPI") == 2
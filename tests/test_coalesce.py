@@ -0,0 +1,104 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from bls_mcp.data.coalesce import CoalescingDataProvider, SingleFlight
+from bls_mcp.data.mock_data import MockDataProvider
+
+
+class SlowProvider(MockDataProvider):
+    """Mock provider whose get_series takes a moment and counts calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def get_series(self, series_id, start_year=None, end_year=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return await super().get_series(series_id, start_year, end_year)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_fetch():
+    """Test that a burst of identical calls hits the provider once."""
+    provider = SlowProvider()
+    coalescing = CoalescingDataProvider(provider)
+
+    results = await asyncio.gather(
+        *(coalescing.get_series("CUUR0000SA0", 2024, 2024) for _ in range(10))
+    )
+
+    assert provider.calls == 1
+    assert coalescing.deduplicated == 9
+    assert all(result == results[0] for result in results)
+    assert coalescing.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiters_get_independent_results():
+    """Test that a caller mutating its result does not affect other waiters."""
+    coalescing = CoalescingDataProvider(SlowProvider())
+
+    first, second = await asyncio.gather(
+        coalescing.get_series("CUUR0000SA0", 2024, 2024),
+        coalescing.get_series("CUUR0000SA0", 2024, 2024),
+    )
+    first["data"][0]["value"] = "0"
+    first["data"].clear()
+    first["metadata"]["series_title"] = "changed"
+
+    assert second["data"] and second["data"][0]["value"] != "0"
+    assert second["metadata"]["series_title"] != "changed"
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_shared():
+    """Test that distinct arguments run separately."""
+    provider = SlowProvider()
+    coalescing = CoalescingDataProvider(provider)
+
+    await asyncio.gather(
+        coalescing.get_series("CUUR0000SA0", 2024, 2024),
+        coalescing.get_series("CUUR0000SA0", 2023, 2023),
+    )
+    await coalescing.get_series("CUUR0000SA0", 2024, 2024)
+
+    assert provider.calls == 3
+    assert coalescing.deduplicated == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared():
+    """Test that every waiter sees the shared failure."""
+    coalescing = CoalescingDataProvider(SlowProvider())
+
+    results = await asyncio.gather(
+        coalescing.get_series("CUUR0000XXXX"),
+        coalescing.get_series("CUUR0000XXXX"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling the first caller leaves the fetch running."""
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def work():
+        started.set()
+        await asyncio.sleep(0.01)
+        return 42
+
+    first = asyncio.ensure_future(flight.do("k", work))
+    await started.wait()
+    second = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 42
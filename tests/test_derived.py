@@ -0,0 +1,84 @@
+"""Tests for materialized derived series."""
+
+import math
+
+import pytest
+
+from bls_mcp.data.derived import DerivedColumns, annotate, derived_columns
+from bls_mcp.data.series_store import SeriesColumns
+
+
+def _point(year, month, value):
+    return {"year": str(year), "period": f"M{month:02d}", "period_name": "", "value": str(value)}
+
+
+def _points(values, first_year=2020):
+    """Newest-first monthly points from oldest-first values."""
+    return [_point(first_year + i // 12, i % 12 + 1, v) for i, v in enumerate(values)][::-1]
+
+
+def test_transforms():
+    """Test year-over-year, month-over-month and 3-month annualized values."""
+    columns = SeriesColumns.from_points("S", _points([100 * 1.01**i for i in range(24)]))
+    derived = DerivedColumns(columns)
+
+    assert len(derived) == 24
+    assert math.isnan(derived.values("yoy")[11])
+    assert derived.values("yoy")[12] == pytest.approx((1.01**12 - 1) * 100)
+    assert derived.values("mom")[1] == pytest.approx(1.0)
+    assert derived.values("annualized_3m")[3] == pytest.approx((1.01**12 - 1) * 100)
+    with pytest.raises(ValueError):
+        derived.values("nope")
+
+
+def test_annual_series_has_no_3m_rate():
+    """Test that transforms finer than the frequency are undefined."""
+    columns = SeriesColumns.from_points(
+        "S",
+        [{"year": str(y), "period": "A01", "period_name": "", "value": str(y - 2000)} for y in (2021, 2022)],
+    )
+    derived = DerivedColumns(columns)
+
+    assert derived.values("yoy")[1] == pytest.approx(100 / 21)
+    assert all(math.isnan(v) for v in derived.values("annualized_3m"))
+
+
+def test_append_recomputes_only_the_tail():
+    """Test that appended observations extend the materialized values."""
+    values = [100 + i for i in range(30)]
+    columns = SeriesColumns.from_points("S", _points(values[:24]))
+    derived = derived_columns(columns)
+    before = list(derived.values("yoy"))
+
+    first = columns.merge_points(_points(values)[:6])
+
+    fresh = DerivedColumns(SeriesColumns.from_points("S", _points(values)))
+    assert first == 24
+    assert list(derived.values("yoy"))[12:24] == before[12:]
+    assert list(derived.values("yoy"))[24:] == list(fresh.values("yoy"))[24:]
+    assert columns.rows() == _points(values)
+
+
+def test_revision_recomputes_from_the_changed_row():
+    """Test that revising an observation updates the values that depend on it."""
+    columns = SeriesColumns.from_points("S", _points([100 + i for i in range(24)]))
+    derived = derived_columns(columns)
+
+    first = columns.merge_points([_point(2020, 6, 200)])
+
+    assert first == 5
+    assert derived.values("mom")[5] == pytest.approx(100 * (200 / 104 - 1))
+    assert derived.values("yoy")[17] == pytest.approx(100 * (117 / 200 - 1))
+    assert columns.rows()[-6]["value"] == "200"
+
+
+def test_annotate_copies_points():
+    """Test that annotation adds a field to copies of the points."""
+    points = _points([100, 110])
+    columns = SeriesColumns.from_points("S", points)
+
+    annotated = annotate(points, columns, "mom")
+
+    assert annotated[0]["mom_pct"] == 10.0
+    assert annotated[1]["mom_pct"] is None
+    assert "mom_pct" not in points[0]
@@ -0,0 +1,52 @@
+"""Tests for the shared tool dispatcher."""
+
+import json
+
+import pytest
+
+from bls_mcp.data.mock_data import MockDataProvider
+from bls_mcp.dispatch import ToolDispatcher, UnknownToolError
+from bls_mcp.tools.get_series import GetSeriesTool
+from bls_mcp.tools.list_series import ListSeriesTool
+
+
+@pytest.fixture
+def dispatcher():
+    """Create a dispatcher over two tools."""
+    provider = MockDataProvider()
+    return ToolDispatcher([GetSeriesTool(provider), ListSeriesTool(provider)])
+
+
+def test_listing_is_precomputed(dispatcher):
+    """Test that the encoded listing matches the tools' pydantic schemas."""
+    listing = json.loads(dispatcher.tools_list_json)
+
+    assert [tool["name"] for tool in listing["tools"]] == ["get_series", "list_series"]
+    assert listing["tools"][0]["inputSchema"] == GetSeriesTool(
+        MockDataProvider()
+    ).input_schema.model_json_schema()
+
+
+@pytest.mark.asyncio
+async def test_call(dispatcher):
+    """Test calling a tool returns its serialized result."""
+    text, is_error = await dispatcher.call("get_series", {"series_id": "CUUR0000SA0"})
+
+    assert not is_error
+    assert json.loads(text)["series_id"] == "CUUR0000SA0"
+
+
+@pytest.mark.asyncio
+async def test_call_tool_error(dispatcher):
+    """Test that a tool-level error is flagged."""
+    text, is_error = await dispatcher.call("get_series", {"series_id": "INVALID123"})
+
+    assert is_error
+    assert "error" in json.loads(text)
+
+
+@pytest.mark.asyncio
+async def test_call_unknown_tool(dispatcher):
+    """Test calling an unregistered tool."""
+    with pytest.raises(UnknownToolError):
+        await dispatcher.call("nope", {})
@@ -0,0 +1,117 @@
+"""Tests for the logging subsystem."""
+
+import io
+import json
+import logging
+import sys
+
+import pytest
+
+from bls_mcp.utils import logger as logger_module
+from bls_mcp.utils.logger import (
+    get_logger,
+    get_request_logger,
+    setup_logging,
+    stop_logging,
+)
+
+
+class CountingArg:
+    """Log argument that counts how often it is formatted."""
+
+    def __init__(self) -> None:
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "payload"
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Configure logging into a buffer, restoring the previous state after."""
+    root = logging.getLogger()
+    monkeypatch.setattr(logger_module, "_sample_rate", logger_module._sample_rate)
+    monkeypatch.setattr(root, "level", root.level)
+    stream = io.StringIO()
+
+    def configure(**kwargs):
+        setup_logging(stream=stream, force=True, **kwargs)
+        return stream
+
+    yield configure
+    stop_logging()
+
+
+def _lines(stream):
+    # Stopping the listener writes out everything still queued
+    stop_logging()
+    return stream.getvalue().splitlines()
+
+
+def test_records_are_written_by_listener(configure):
+    """Test that records pass through the queue as JSON with their extra fields."""
+    stream = configure(log_level="INFO", log_format="json")
+
+    get_logger("bls_mcp.test").info("Fetched %s points", 9, extra={"tool": "get_series"})
+    get_logger("bls_mcp.test").debug("not written")
+    entries = [json.loads(line) for line in _lines(stream)]
+
+    assert len(entries) == 1
+    assert entries[0]["message"] == "Fetched 9 points"
+    assert entries[0]["tool"] == "get_series"
+    assert entries[0]["level"] == "INFO"
+
+
+def test_request_logs_are_sampled(configure):
+    """Test that sampling drops request messages before formatting, but not warnings."""
+    stream = configure(log_level="DEBUG", sample_rate=0.0)
+    logger = get_request_logger("bls_mcp.test")
+    arg = CountingArg()
+
+    logger.info("Executing with arguments: %s", arg)
+    logger.warning("Series not found: %s", "X")
+    lines = _lines(stream)
+
+    assert arg.formatted == 0
+    assert len(lines) == 1 and "Series not found: X" in lines[0]
+
+
+def test_disabled_levels_are_not_formatted(configure):
+    """Test that messages below the configured level are never formatted."""
+    stream = configure(log_level="INFO")
+    hidden, shown = CountingArg(), CountingArg()
+
+    get_request_logger("bls_mcp.test").debug("Tool result: %s", hidden)
+    get_request_logger("bls_mcp.test").info("Tool result: %s", shown)
+
+    assert len(_lines(stream)) == 1
+    assert hidden.formatted == 0
+    assert shown.formatted > 0
+
+
+
+def test_queued_records_snapshot_message_and_defer_traceback(configure):
+    """Test that the message is rendered at the call and the traceback by the listener."""
+    stream = configure(log_level="INFO", log_format="json")
+    arguments = {"series_id": "CUUR0000SA0"}
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            "bls_mcp.test", logging.ERROR, __file__, 1, "Failed with %s", (arguments,), sys.exc_info()
+        )
+
+    prepared = logger_module._queue_handler.prepare(record)
+    assert prepared.args is None and prepared.exc_text is None
+    assert prepared.exc_info is not None
+
+    logger_module._queue_handler.handle(record)
+    get_logger("bls_mcp.test").info("Arguments: %s", arguments)
+    arguments["series_id"] = "mutated"
+    entries = [json.loads(line) for line in _lines(stream)]
+
+    assert entries[0]["message"] == "Failed with {'series_id': 'CUUR0000SA0'}"
+    assert "ValueError: boom" in entries[0]["exc_info"]
+    assert "Traceback" not in entries[0]["message"]
+    assert entries[1]["message"] == "Arguments: {'series_id': 'CUUR0000SA0'}"
@@ -0,0 +1,57 @@
+"""Tests for server metrics."""
+
+import pytest
+
+from bls_mcp.data.instrumented import InstrumentedDataProvider
+from bls_mcp.data.mock_data import MockDataProvider
+from bls_mcp.dispatch import ToolDispatcher
+from bls_mcp.metrics import Histogram, MetricsRegistry, ServerMetrics
+from bls_mcp.tools.get_series import GetSeriesTool
+
+
+def test_histogram_buckets_and_quantiles():
+    """Test bucket placement, cumulative rendering and quantile estimates."""
+    histogram = Histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, "a")
+
+    child = histogram.labels("a")
+    assert child.counts == [2, 1, 1]
+    assert child.quantile(0.5) == pytest.approx(0.1)
+    assert child.quantile(0.99) == 1.0
+
+    lines = histogram.render()
+    assert 'latency_seconds_bucket{tool="a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{tool="a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{tool="a"} 4' in lines
+
+
+def test_registry_renders_collectors():
+    """Test counters, label escaping and collected gauges."""
+    registry = MetricsRegistry()
+    counter = registry.counter("calls_total", "Calls.", ("tool",))
+    counter.inc('say "hi"')
+    registry.add_collector(lambda: ["# TYPE up gauge", "up 1"])
+
+    text = registry.render()
+    assert 'calls_total{tool="say \\"hi\\""} 1' in text
+    assert text.endswith("up 1\n")
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_records_phases():
+    """Test that a call records latency, phases, size and outcome."""
+    metrics = ServerMetrics()
+    provider = InstrumentedDataProvider(MockDataProvider(), metrics)
+    dispatcher = ToolDispatcher([GetSeriesTool(provider)], metrics=metrics)
+
+    text, _ = await dispatcher.call("get_series", {"series_id": "CUUR0000SA0"})
+    await dispatcher.call("get_series", {"series_id": "CUUR0000XXX"})
+
+    assert metrics.tool_calls.value("get_series", "ok") == 1
+    assert metrics.tool_calls.value("get_series", "error") == 1
+    assert metrics.tool_seconds.labels("get_series").count == 2
+    for phase in ("validation", "provider", "serialization"):
+        assert metrics.phase_seconds.labels("get_series", phase).count == 2
+    assert metrics.response_bytes.labels("get_series").sum >= len(text)
+    assert metrics.provider_seconds.labels("get_series").count == 2
@@ -3,6 +3,7 @@
 import pytest
 
 from bls_mcp.data.mock_data import MockDataProvider
+from bls_mcp.utils.pagination import cursor_scope
 
 
 @pytest.fixture
@@ -93,3 +94,54 @@ async def test_search_series(data_provider):
     assert isinstance(result, list)
     assert len(result) > 0
     assert all("Food" in series["series_title"] or "Food" in series["item"] for series in result)
+
+
+@pytest.mark.asyncio
+async def test_list_series_with_secondary_filters(data_provider):
+    """Test listing series with item and area filters."""
+    result = await data_provider.list_series(item="food", area="U.S. City Average")
+
+    assert [series["series_id"] for series in result] == ["CUUR0000SAF"]
+
+
+@pytest.mark.asyncio
+async def test_list_series_page_follows_cursors(data_provider):
+    """Test that cursors walk the catalog one page at a time."""
+    seen = []
+    cursor = None
+    while True:
+        page = await data_provider.list_series_page(limit=3, cursor=cursor)
+        assert len(page["series"]) <= 3
+        seen.extend(series["series_id"] for series in page["series"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    everything = await data_provider.list_series(limit=1000)
+    assert seen == [series["series_id"] for series in everything]
+    assert page["total"] == len(seen)
+
+
+@pytest.mark.asyncio
+async def test_list_series_page_rejects_foreign_cursor(data_provider):
+    """Test that a cursor only works with the filters it was issued for."""
+    page = await data_provider.list_series_page(limit=1)
+
+    with pytest.raises(ValueError):
+        await data_provider.list_series_page(category="CPI", cursor=page["next_cursor"])
+    with pytest.raises(ValueError):
+        await data_provider.list_series_page(cursor="not a cursor")
+
+
+@pytest.mark.asyncio
+async def test_list_series_page_cursor_ignores_filter_case(data_provider):
+    """Test that a cursor works with filters differing only in case."""
+    page = await data_provider.list_series_page(category="CPI", limit=1)
+    following = await data_provider.list_series_page(
+        category="cpi", area=None, limit=1, cursor=page["next_cursor"]
+    )
+
+    assert following["series"][0] != page["series"][0]
+    assert cursor_scope("list_series", category="CPI", area=None) == cursor_scope(
+        "list_series", category="cpi", item=""
+    )
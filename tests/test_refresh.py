@@ -0,0 +1,206 @@
+"""Tests for incremental data refresh."""
+
+import json
+import math
+import shutil
+from pathlib import Path
+
+import pytest
+
+from bls_mcp.data.cache import CachingDataProvider
+from bls_mcp.data.derived import derived_columns
+from bls_mcp.data.mock_data import JOURNAL_NAME, MockDataProvider
+from bls_mcp.data.refresh import DataRefresher, ReleaseDirectory, parse_release
+
+FIXTURES = Path(__file__).parent.parent / "src" / "bls_mcp" / "data" / "fixtures"
+
+OCTOBER = {"year": "2024", "period": "M10", "period_name": "October", "value": "315.664"}
+
+
+@pytest.fixture
+def fixtures_dir(tmp_path):
+    """Copy the JSON fixtures to a writable directory."""
+    target = tmp_path / "fixtures"
+    target.mkdir()
+    for name in ("cpi_series.json", "historical_data.json"):
+        shutil.copy(FIXTURES / name, target / name)
+    return target
+
+
+def _write_release(directory, name, series):
+    directory.mkdir(exist_ok=True)
+    (directory / name).write_text(
+        json.dumps({sid: {"series_id": sid, "data": points} for sid, points in series.items()})
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_appends_release(fixtures_dir):
+    """Test that a release file is merged, cached copies dropped and old readers untouched."""
+    provider = MockDataProvider(fixtures_dir)
+    cache = CachingDataProvider(provider)
+    releases = fixtures_dir / "releases"
+    refresher = DataRefresher(cache, ReleaseDirectory(releases))
+
+    before = await provider.get_columns("CUUR0000SA0")
+    cached = await cache.get_series("CUUR0000SA0")
+    _write_release(releases, "2024-10.json", {"CUUR0000SA0": [OCTOBER]})
+
+    changed = await refresher.refresh()
+
+    assert changed == {"CUUR0000SA0": 57}
+    assert provider.data_version == 1
+    # Readers holding the previous version keep a consistent series
+    assert len(before) == 57
+    after = await cache.get_series("CUUR0000SA0")
+    assert after["count"] == cached["count"] + 1
+    assert after["data"][0] == OCTOBER
+    assert (await cache.get_series_info("CUUR0000SA0"))["data_point_count"] == 58
+
+    # Nothing new on the next poll
+    assert await refresher.refresh() == {}
+    assert refresher.releases == 1
+
+
+@pytest.mark.asyncio
+async def test_updates_survive_restart(fixtures_dir):
+    """Test that applied updates are journaled and replayed on load."""
+    await MockDataProvider(fixtures_dir).apply_updates({"CUUR0000SA0": [OCTOBER]})
+
+    restarted = MockDataProvider(fixtures_dir)
+    result = await restarted.get_series("CUUR0000SA0", 2024, 2024)
+
+    assert (fixtures_dir / JOURNAL_NAME).exists()
+    assert result["data"][0] == OCTOBER
+    # Replaying the same release again changes nothing
+    assert await restarted.apply_updates({"CUUR0000SA0": [OCTOBER]}) == {}
+
+
+@pytest.mark.asyncio
+async def test_release_after_torn_journal_line_survives_restart(fixtures_dir):
+    """Test that an append after a crash mid-write is replayed."""
+    await MockDataProvider(fixtures_dir).apply_updates({"CUUR0000SA0": [OCTOBER]})
+    journal = fixtures_dir / JOURNAL_NAME
+    with open(journal, "a") as f:
+        f.write('{"series_id":"CUUR0000SA0","data":[{"year":"20')
+
+    november = {**OCTOBER, "period": "M11", "period_name": "November", "value": "315.5"}
+    await MockDataProvider(fixtures_dir).apply_updates({"CUUR0000SA0": [november]})
+    result = await MockDataProvider(fixtures_dir).get_series("CUUR0000SA0", 2024, 2024)
+
+    assert result["data"][:2] == [november, OCTOBER]
+
+
+@pytest.mark.asyncio
+async def test_bundled_fixtures_journal_to_cache_dir(tmp_path, monkeypatch):
+    """Test that journaling the bundled fixtures leaves the package untouched."""
+    monkeypatch.setenv("BLS_MCP_CACHE_DIR", str(tmp_path))
+    provider = MockDataProvider()
+
+    await provider.apply_updates({"CUUR0000SA0": [OCTOBER]})
+
+    assert not (FIXTURES / JOURNAL_NAME).exists()
+    assert (provider.cache_dir / JOURNAL_NAME).exists()
+    assert provider.cache_dir.is_relative_to(tmp_path)
+
+
+@pytest.mark.asyncio
+async def test_updates_over_compiled_store(fixtures_dir):
+    """Test that updates layer over the memory-mapped store, including new series."""
+    provider = MockDataProvider(fixtures_dir)
+    provider.ensure_compiled()
+    new_series = [{"year": "2024", "period": "M09", "period_name": "September", "value": "1.0"}]
+
+    changed = await provider.apply_updates(
+        {"CUUR0000SA0": [OCTOBER], "CUUR0000SEHA": new_series}
+    )
+
+    assert changed == {"CUUR0000SA0": 57, "CUUR0000SEHA": 0}
+    assert (await provider.get_series("CUUR0000SEHA"))["count"] == 1
+    assert (await provider.get_series("CUUR0000SA0"))["count"] == 58
+
+
+@pytest.mark.asyncio
+async def test_revision_recomputes_derived_tail(fixtures_dir):
+    """Test that a revision invalidates derived values from the revised row on."""
+    provider = MockDataProvider(fixtures_dir, journal=False)
+    old = await provider.get_columns("CUUR0000SA0")
+    old_yoy = list(derived_columns(old).values("yoy"))
+    row = old.year_slice(2024)[0]
+    revised = {**old.row(row), "value": "400.000"}
+
+    changed = await provider.apply_updates({"CUUR0000SA0": [revised]})
+    new = await provider.get_columns("CUUR0000SA0")
+    new_yoy = derived_columns(new).values("yoy")
+
+    assert changed == {"CUUR0000SA0": row}
+    assert not (fixtures_dir / JOURNAL_NAME).exists()
+    assert all(
+        a == b or (math.isnan(a) and math.isnan(b)) for a, b in zip(new_yoy[:row], old_yoy)
+    )
+    assert new_yoy[row] > old_yoy[row]
+    assert derived_columns(old).values("yoy")[row] == old_yoy[row]
+
+
+@pytest.mark.asyncio
+async def test_stream_in_progress_sees_one_version(fixtures_dir):
+    """Test that a stream started before an update finishes on the old version."""
+    provider = MockDataProvider(fixtures_dir, journal=False)
+    chunks = provider.iter_series("CUUR0000SA0", page_size=10)
+    header = await chunks.__anext__()
+
+    await provider.apply_updates({"CUUR0000SA0": [OCTOBER]})
+    rows = [point async for chunk in chunks for point in chunk["data"]]
+
+    assert len(rows) == header["count"] == 57
+    assert (await provider.get_series("CUUR0000SA0"))["count"] == 58
+
+
+def test_parse_release_rejects_bad_payload():
+    """Test that malformed release files are rejected."""
+    assert parse_release({"S": [OCTOBER]}) == {"S": [OCTOBER]}
+    with pytest.raises(ValueError):
+        parse_release({"S": {"series_id": "S"}})
+    with pytest.raises(ValueError):
+        parse_release({"S": [{"period": "M10", "value": "1.0"}]})
+    with pytest.raises(ValueError):
+        parse_release({"S": [{**OCTOBER, "year": "twenty"}]})
+
+
+@pytest.mark.asyncio
+async def test_bad_release_does_not_block_later_ones(fixtures_dir):
+    """Test that a malformed release is skipped and the next one still applies."""
+    provider = MockDataProvider(fixtures_dir, journal=False)
+    releases = fixtures_dir / "releases"
+    refresher = DataRefresher(provider, ReleaseDirectory(releases))
+    november = {**OCTOBER, "period": "M11", "period_name": "November", "value": "315.5"}
+    _write_release(releases, "2024-10.json", {"CUUR0000SA0": [{"period": "M10", "value": "1"}]})
+    _write_release(releases, "2024-11.json", {"CUUR0000SA0": [november]})
+
+    assert await refresher.refresh() == {"CUUR0000SA0": 57}
+    assert await refresher.refresh() == {}
+    assert (await provider.get_series("CUUR0000SA0", 2024, 2024))["data"][0] == november
+
+
+@pytest.mark.asyncio
+async def test_failed_apply_is_retried(fixtures_dir, monkeypatch):
+    """Test that a release whose apply fails is retried without blocking others."""
+    provider = MockDataProvider(fixtures_dir, journal=False)
+    releases = fixtures_dir / "releases"
+    refresher = DataRefresher(provider, ReleaseDirectory(releases))
+    _write_release(releases, "2024-10.json", {"CUUR0000SA0": [OCTOBER]})
+    _write_release(releases, "2024-11.json", {"CUUR0000SAF": [OCTOBER]})
+    apply_updates = provider.apply_updates
+    failures = ["CUUR0000SA0"]
+
+    async def flaky(updates):
+        if failures and failures[0] in updates:
+            failures.pop()
+            raise KeyError("year")
+        return await apply_updates(updates)
+
+    monkeypatch.setattr(provider, "apply_updates", flaky)
+
+    assert list(await refresher.refresh()) == ["CUUR0000SAF"]
+    assert list(await refresher.refresh()) == ["CUUR0000SA0"]
+    assert await refresher.refresh() == {}
@@ -0,0 +1,92 @@
+"""Tests for the catalog search index."""
+
+from bls_mcp.data.search import SeriesSearchIndex, tokenize
+
+CATALOG = [
+    {"series_id": "CUUR0000SAF", "series_title": "CPI: Food", "item": "Food", "area": "U.S."},
+    {"series_id": "CUUR0000SAF11", "series_title": "CPI: Food at Home", "item": "Food at Home", "area": "U.S."},
+    {"series_id": "CUUR0000SETA01", "series_title": "CPI: Gasoline", "item": "Gasoline", "area": "West"},
+    {"series_id": "CUUR0000SETA", "series_title": "CPI: Energy", "item": "Energy", "area": "West"},
+]
+
+
+def _ids(results):
+    return [series["series_id"] for series, _ in results]
+
+
+def test_tokenize():
+    """Test tokenization lowercases and drops punctuation."""
+    assert tokenize("Gasoline (All Types), U.S.") == ["gasoline", "all", "types", "u", "s"]
+
+
+def test_ranks_shorter_exact_match_first():
+    """Test that BM25 favours the tighter match."""
+    index = SeriesSearchIndex(CATALOG)
+
+    assert _ids(index.search("food")) == ["CUUR0000SAF", "CUUR0000SAF11"]
+
+
+def test_multi_term_ranks_documents_matching_all_terms():
+    """Test that documents matching more query terms score higher."""
+    index = SeriesSearchIndex(CATALOG)
+
+    assert _ids(index.search("energy west"))[0] == "CUUR0000SETA"
+
+
+def test_prefix_matching():
+    """Test that partial words match as prefixes."""
+    index = SeriesSearchIndex(CATALOG)
+
+    assert _ids(index.search("gasol")) == ["CUUR0000SETA01"]
+    assert _ids(index.search("cuur0000seta")) == ["CUUR0000SETA", "CUUR0000SETA01"]
+
+
+def test_no_match_and_limit():
+    """Test empty results and the result limit."""
+    index = SeriesSearchIndex(CATALOG)
+
+    assert index.search("wages") == []
+    assert index.search("") == []
+    assert len(index.search("cpi", limit=2)) == 2
+
+
+def test_multi_term_top_result_deep_in_every_list():
+    """Test that a document deep in every term's postings is still found."""
+    catalog = [
+        {"series_id": f"APG{i:05d}", "item": "Gasoline", "area": f"Area{i}"}
+        for i in range(5000)
+    ]
+    catalog += [
+        {"series_id": f"APA{i:05d}", "item": "Apparel", "area": f"Los Angeles variant {i}"}
+        for i in range(5000)
+    ]
+    catalog.append(
+        {
+            "series_id": "APTARGET",
+            "series_title": "Gasoline, unleaded regular, per gallon",
+            "item": "Gasoline",
+            "area": "Los Angeles-Long Beach-Anaheim, CA",
+        }
+    )
+    index = SeriesSearchIndex(catalog)
+
+    assert _ids(index.search("gasoline los angeles", limit=3))[0] == "APTARGET"
+
+
+def test_threshold_ranking_matches_exhaustive_scoring():
+    """Test that rankings read from list heads match scoring every match."""
+    catalog = [
+        {
+            "series_id": f"CU{i:05d}",
+            "item": ("Food", "Energy", "Gasoline")[i % 3],
+            "area": ("West", "South", "Los Angeles")[i % 7 % 3],
+            "series_title": f"variant {i % 11}",
+        }
+        for i in range(300)
+    ]
+    index = SeriesSearchIndex(catalog, depth=1)
+
+    for query in ("food west", "gasoline los angeles", "energy south variant"):
+        terms = {term: 1.0 for term in tokenize(query)}
+        expected = sorted(index._exhaustive_top(terms, 5), reverse=True)
+        assert sorted(index._threshold_top(terms, 5), reverse=True) == expected
@@ -0,0 +1,43 @@
+"""Tests for JSON serialization."""
+
+import json
+
+import pytest
+
+from bls_mcp.utils import serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "_pretty_default", None)
+    monkeypatch.delenv("JSON_PRETTY", raising=False)
+    return request.param
+
+
+def test_compact_by_default(backend):
+    """Test that output has no insignificant whitespace."""
+    assert serialization.dumps({"a": [1, "x"]}) == '{"a":[1,"x"]}'
+    assert serialization.dumps_bytes({"a": 1}) == b'{"a":1}'
+
+
+def test_pretty_option(backend, monkeypatch):
+    """Test pretty output via argument and environment."""
+    assert serialization.dumps({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+
+    monkeypatch.setenv("JSON_PRETTY", "true")
+    assert "\n" in serialization.dumps({"a": 1})
+
+
+def test_round_trip_and_non_finite(backend):
+    """Test round trips, unicode and NaN handling."""
+    obj = {"title": "Índice", "value": float("nan"), "n": [1.5, None]}
+
+    encoded = serialization.dumps(obj)
+
+    assert json.loads(encoded) == {"title": "Índice", "value": None, "n": [1.5, None]}
+    assert serialization.loads(encoded.encode()) == serialization.loads(encoded)
@@ -0,0 +1,100 @@
+"""Tests for columnar series storage."""
+
+import json
+
+import pytest
+
+from bls_mcp.data.mock_data import MockDataProvider
+from bls_mcp.data.series_store import SeriesColumns, period_ordinal
+
+
+def _points():
+    """Newest-first monthly points spanning three years."""
+    return [
+        {"year": str(year), "period": f"M{month:02d}", "period_name": "x", "value": f"{year}.{month}"}
+        for year in (2024, 2023, 2022)
+        for month in range(12, 0, -1)
+    ]
+
+
+def test_period_ordinal_sorts_by_time():
+    """Test that ordinals order (year, period) pairs chronologically."""
+    assert period_ordinal(2023, "M12") < period_ordinal(2024, "M01")
+    assert period_ordinal(2024, "Q01") < period_ordinal(2024, "Q02")
+
+
+def test_rows_round_trip_in_original_order():
+    """Test that rebuilt rows match the source points exactly."""
+    points = _points()
+    columns = SeriesColumns.from_points("S", points)
+
+    assert columns.rows() == points
+    assert list(columns.values[:2]) == [2022.1, 2022.2]
+
+
+def test_rows_year_range():
+    """Test year-range slicing."""
+    points = _points()
+    columns = SeriesColumns.from_points("S", points)
+
+    assert columns.rows(2023, 2023) == [p for p in points if p["year"] == "2023"]
+    assert columns.rows(start_year=2024) == [p for p in points if p["year"] == "2024"]
+    assert columns.rows(end_year=2022) == [p for p in points if p["year"] == "2022"]
+    assert columns.rows(2030, 2031) == []
+
+
+def test_iter_pages_matches_rows():
+    """Test that pages concatenate to the same rows in either orientation."""
+    points = _points()
+    for source in (points, points[::-1]):
+        columns = SeriesColumns.from_points("S", source)
+        lo, hi = columns.year_slice(2023, 2024)
+        pages = list(columns.iter_pages(lo, hi, 5))
+
+        assert [len(page) for page in pages] == [5] * 4 + [4]
+        assert [p for page in pages for p in page] == columns.rows(2023, 2024)
+
+
+def test_ascending_source_and_footnotes_preserved():
+    """Test that ascending sources, footnotes and extra keys survive."""
+    points = [
+        {"year": "2023", "period": "M01", "period_name": "January", "value": "1.0"},
+        {
+            "year": "2023",
+            "period": "M02",
+            "period_name": "February",
+            "value": "-",
+            "footnotes": [{"code": "P", "text": "preliminary"}],
+            "latest": "true",
+        },
+    ]
+    columns = SeriesColumns.from_points("S", points)
+
+    assert columns.rows() == points
+    assert columns.footnotes == [[{"code": "P", "text": "preliminary"}]]
+
+
+@pytest.mark.asyncio
+async def test_provider_output_matches_fixture():
+    """Test that get_series returns the fixture points unchanged."""
+    provider = MockDataProvider()
+    with open(provider.fixtures_dir / "historical_data.json") as f:
+        fixture = json.load(f)["CUUR0000SA0"]["data"]
+
+    result = await provider.get_series("CUUR0000SA0", start_year=2021, end_year=2023)
+
+    assert result["data"] == [p for p in fixture if 2021 <= int(p["year"]) <= 2023]
+
+
+@pytest.mark.asyncio
+async def test_iter_series_pages_match_get_series():
+    """Test that streamed pages reassemble to the get_series result."""
+    provider = MockDataProvider()
+    expected = await provider.get_series("CUUR0000SA0", 2020, 2024)
+
+    chunks = [c async for c in provider.iter_series("CUUR0000SA0", 2020, 2024, page_size=7)]
+
+    assert chunks[0]["count"] == expected["count"]
+    assert chunks[0]["metadata"] == expected["metadata"]
+    assert all(len(c["data"]) <= 7 for c in chunks[1:])
+    assert [p for c in chunks[1:] for p in c["data"]] == expected["data"]
@@ -0,0 +1,149 @@
+"""Startup benchmarks and tests for the fast-start stdio transport."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from bls_mcp.server import TOOL_LISTING_PATH, BLSMCPServer
+from bls_mcp.transports.stdio import StdioTransport
+
+SRC = str(Path(__file__).parent.parent / "src")
+
+# Seconds allowed on top of a bare interpreter start. Importing the MCP SDK
+# alone takes longer than either, so a regression fails these by a margin.
+IMPORT_BUDGET = 0.25
+INITIALIZE_BUDGET = 0.4
+
+# Modules that must not be imported before the first tool call
+HEAVY_MODULES = ("mcp", "pydantic", "numpy", "dotenv", "starlette", "bls_mcp.tools.base")
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1.0"},
+    },
+}
+
+
+def _env(**extra):
+    env = dict(os.environ, LOG_LEVEL="WARNING", **extra)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC, env.get("PYTHONPATH")]))
+    return env
+
+
+def _best_of(runs, measure):
+    return min(measure() for _ in range(runs))
+
+
+def _run_python(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], env=_env(), check=True)
+    return time.perf_counter() - start
+
+
+def _time_to_initialize():
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from bls_mcp.server import main; main()"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=_env(MCP_FAST_START="1"),
+    )
+    try:
+        process.stdin.write(json.dumps(INITIALIZE).encode() + b"\n")
+        process.stdin.flush()
+        reply = json.loads(process.stdout.readline())
+        elapsed = time.perf_counter() - start
+        assert reply["result"]["serverInfo"]["name"] == "bls-mcp-server"
+    finally:
+        process.stdin.close()
+        process.wait(timeout=10)
+    return elapsed
+
+
+def test_import_is_light():
+    """Test that importing the server loads no heavy dependencies and stays fast."""
+    probe = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, bls_mcp.server; "
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+        ],
+        env=_env(),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert probe.stdout.strip() == "[]"
+
+    baseline = _best_of(3, lambda: _run_python("pass"))
+    elapsed = _best_of(3, lambda: _run_python("import bls_mcp.server"))
+    assert elapsed - baseline < IMPORT_BUDGET
+
+
+def test_time_to_initialize():
+    """Test that a fast-start stdio session answers initialize within budget."""
+    baseline = _best_of(3, lambda: _run_python("pass"))
+    elapsed = _best_of(3, _time_to_initialize)
+
+    assert elapsed - baseline < INITIALIZE_BUDGET
+
+
+def test_tool_listing_is_current():
+    """Test that the precomputed listing matches the tools' input models."""
+    with open(TOOL_LISTING_PATH) as f:
+        listing = json.load(f)
+
+    assert listing["tools"] == BLSMCPServer().dispatcher.definitions, (
+        "Tool listing is stale; run scripts/build_tool_listing.py"
+    )
+
+
+@pytest.mark.asyncio
+async def test_stdio_session():
+    """Test a session over the fast-start transport builds tools only when called."""
+    server = BLSMCPServer()
+    requests = [
+        INITIALIZE,
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        {"jsonrpc": "2.0", "id": 3, "method": "ping"},
+    ]
+    stdin = io.BytesIO(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+    stdout = io.BytesIO()
+
+    await StdioTransport(server, stdin, stdout).run()
+    replies = {r["id"]: r for r in map(json.loads, stdout.getvalue().splitlines())}
+
+    assert sorted(replies) == [1, 2, 3]
+    assert len(replies[2]["result"]["tools"]) == 8
+    assert replies[3]["result"] == {}
+    assert server._dispatcher is None and server._data_provider is None
+
+    call = {
+        "jsonrpc": "2.0",
+        "id": 4,
+        "method": "tools/call",
+        "params": {"name": "list_series", "arguments": {"limit": 2}},
+    }
+    stdin = io.BytesIO(json.dumps(call).encode() + b"\n{\n")
+    stdout = io.BytesIO()
+
+    await StdioTransport(server, stdin, stdout).run()
+    replies = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    assert {r["id"] for r in replies} == {4, None}
+    result = next(r for r in replies if r["id"] == 4)["result"]
+    assert json.loads(result["content"][0]["text"])["count"] == 2
+    assert next(r for r in replies if r["id"] is None)["error"]["code"] == -32700
@@ -2,10 +2,19 @@
 
 import pytest
 
+from bls_mcp.data.cache import CachingDataProvider
+from bls_mcp.data.coalesce import CoalescingDataProvider
+from bls_mcp.data.instrumented import InstrumentedDataProvider
 from bls_mcp.data.mock_data import MockDataProvider
+from bls_mcp.metrics import ServerMetrics
+from bls_mcp.tools.compare_series import CompareSeriesTool
+from bls_mcp.tools.compute_series_stats import ComputeSeriesStatsTool
+from bls_mcp.tools.forecast_series import ForecastSeriesTool
 from bls_mcp.tools.get_series import GetSeriesTool
+from bls_mcp.tools.get_series_batch import GetSeriesBatchTool
 from bls_mcp.tools.get_series_info import GetSeriesInfoTool
 from bls_mcp.tools.list_series import ListSeriesTool
+from bls_mcp.tools.search_series import SearchSeriesTool
 
 
 @pytest.fixture
@@ -20,6 +29,12 @@ def get_series_tool(data_provider):
     return GetSeriesTool(data_provider)
 
 
+@pytest.fixture
+def get_series_batch_tool(data_provider):
+    """Create get_series_batch tool instance."""
+    return GetSeriesBatchTool(data_provider)
+
+
 @pytest.fixture
 def list_series_tool(data_provider):
     """Create list_series tool instance."""
@@ -32,6 +47,12 @@ def get_series_info_tool(data_provider):
     return GetSeriesInfoTool(data_provider)
 
 
+@pytest.fixture
+def search_series_tool(data_provider):
+    """Create search_series tool instance."""
+    return SearchSeriesTool(data_provider)
+
+
 def test_get_series_tool_properties(get_series_tool):
     """Test get_series tool properties."""
     assert get_series_tool.name == "get_series"
@@ -68,6 +89,82 @@ async def test_get_series_tool_invalid_id(get_series_tool):
     assert "error" in result
 
 
+@pytest.mark.asyncio
+async def test_get_series_tool_transform(get_series_tool):
+    """Test adding a precomputed transform to each point."""
+    result = await get_series_tool.execute(
+        {"series_id": "CUUR0000SA0", "start_year": 2024, "transform": "yoy"}
+    )
+
+    assert result["transform"] == "yoy"
+    assert result["data"][0]["yoy_pct"] == pytest.approx(2.36, abs=0.001)
+    assert all(point["yoy_pct"] is not None for point in result["data"])
+
+
+@pytest.mark.asyncio
+async def test_get_series_tool_stream(data_provider):
+    """Test streaming get_series results in pages."""
+    tool = GetSeriesTool(data_provider, page_size=4)
+    chunks = [c async for c in tool.stream({"series_id": "CUUR0000SA0", "start_year": 2024})]
+
+    assert chunks[0]["series_id"] == "CUUR0000SA0"
+    assert [len(c["data"]) for c in chunks[1:]] == [4, 4, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_series_tool_stream_error(get_series_tool):
+    """Test that a streamed failure is a single error chunk."""
+    chunks = [c async for c in get_series_tool.stream({"series_id": "INVALID123"})]
+
+    assert len(chunks) == 1
+    assert "error" in chunks[0]
+
+
+def test_get_series_batch_tool_properties(get_series_batch_tool):
+    """Test get_series_batch tool properties."""
+    assert get_series_batch_tool.name == "get_series_batch"
+    assert get_series_batch_tool.description
+    assert get_series_batch_tool.input_schema
+
+
+@pytest.mark.asyncio
+async def test_get_series_batch_tool_execute(get_series_batch_tool):
+    """Test get_series_batch tool with shared and per-series ranges."""
+    result = await get_series_batch_tool.execute(
+        {
+            "series_ids": ["CUUR0000SA0", "CUUR0000SAF", "CUUR0000SA0"],
+            "start_year": 2024,
+            "year_ranges": {"CUUR0000SAF": {"start_year": 2023, "end_year": 2023}},
+        }
+    )
+
+    assert "error" not in result
+    assert result["requested"] == 2
+    assert [s["series_id"] for s in result["series"]] == ["CUUR0000SA0", "CUUR0000SAF"]
+    assert {p["year"] for p in result["series"][0]["data"]} == {"2024"}
+    assert {p["year"] for p in result["series"][1]["data"]} == {"2023"}
+
+
+@pytest.mark.asyncio
+async def test_get_series_batch_tool_partial_errors(get_series_batch_tool):
+    """Test that failing IDs get their own error without failing the batch."""
+    result = await get_series_batch_tool.execute(
+        {"series_ids": ["CUUR0000SA0", "INVALID", "CUUR0000SETA"]}
+    )
+
+    assert result["count"] == 1
+    assert set(result["errors"]) == {"INVALID", "CUUR0000SETA"}
+    assert "not found" in result["errors"]["CUUR0000SETA"]
+
+
+@pytest.mark.asyncio
+async def test_get_series_batch_tool_rejects_empty(get_series_batch_tool):
+    """Test get_series_batch tool with no series IDs."""
+    result = await get_series_batch_tool.execute({"series_ids": []})
+
+    assert "error" in result
+
+
 def test_list_series_tool_properties(list_series_tool):
     """Test list_series tool properties."""
     assert list_series_tool.name == "list_series"
@@ -85,6 +182,46 @@ async def test_list_series_tool_execute(list_series_tool):
     assert len(result["series"]) <= 5
 
 
+@pytest.mark.asyncio
+async def test_list_series_tool_paginates(list_series_tool):
+    """Test fetching the next page with next_cursor."""
+    first = await list_series_tool.execute({"limit": 2})
+    second = await list_series_tool.execute({"limit": 2, "cursor": first["next_cursor"]})
+    bad = await list_series_tool.execute({"cursor": "garbage"})
+
+    assert first["total"] > 2
+    assert first["next_cursor"]
+    assert second["series"][0] != first["series"][0]
+    assert {s["series_id"] for s in first["series"]}.isdisjoint(
+        s["series_id"] for s in second["series"]
+    )
+    assert "error" in bad
+
+
+@pytest.mark.asyncio
+async def test_list_series_tool_filters_through_provider_stack():
+    """Test that catalog filters reach the mock provider through every wrapper."""
+    provider = InstrumentedDataProvider(
+        CoalescingDataProvider(CachingDataProvider(MockDataProvider())), ServerMetrics()
+    )
+    tool = ListSeriesTool(provider)
+
+    result = await tool.execute({"item": "food", "area": "U.S. City Average"})
+    first = await tool.execute({"area": "U.S. City Average", "limit": 3})
+    second = await tool.execute(
+        {"area": "U.S. City Average", "limit": 3, "cursor": first["next_cursor"]}
+    )
+
+    assert "error" not in result
+    assert [s["series_id"] for s in result["series"]] == ["CUUR0000SAF"]
+    assert result["filters"] == {"item": "food", "area": "U.S. City Average"}
+    assert first["total"] == 8
+    assert "error" not in second
+    assert {s["series_id"] for s in first["series"]}.isdisjoint(
+        s["series_id"] for s in second["series"]
+    )
+
+
 def test_get_series_info_tool_properties(get_series_info_tool):
     """Test get_series_info tool properties."""
     assert get_series_info_tool.name == "get_series_info"
@@ -100,3 +237,143 @@ async def test_get_series_info_tool_execute(get_series_info_tool):
     assert "error" not in result
     assert result["series_id"] == "CUUR0000SA0"
     assert "series_title" in result
+
+
+def test_search_series_tool_properties(search_series_tool):
+    """Test search_series tool properties."""
+    assert search_series_tool.name == "search_series"
+    assert search_series_tool.description
+    assert search_series_tool.input_schema
+
+
+@pytest.mark.asyncio
+async def test_search_series_tool_execute(search_series_tool):
+    """Test search_series tool execution."""
+    result = await search_series_tool.execute({"query": "food at home", "limit": 3})
+
+    assert "error" not in result
+    assert result["series"][0]["series_id"] == "CUUR0000SAF11"
+    assert result["count"] <= 3
+
+
+@pytest.mark.asyncio
+async def test_search_series_tool_empty_query(search_series_tool):
+    """Test search_series tool with a blank query."""
+    result = await search_series_tool.execute({"query": "  "})
+
+    assert "error" in result
+
+
+@pytest.mark.asyncio
+async def test_compute_series_stats_tool_execute(data_provider):
+    """Test computing statistics for a series."""
+    pytest.importorskip("numpy")
+    tool = ComputeSeriesStatsTool(data_provider)
+    result = await tool.execute({"series_id": "CUUR0000SA0", "start_year": 2024})
+
+    assert tool.name == "compute_series_stats"
+    assert result["frequency"] == "monthly"
+    assert result["observations"] == 9
+    assert result["latest"]["period"] == "2024-M09"
+    assert result["latest"]["yoy_pct"] == pytest.approx(2.36, abs=0.01)
+    assert "series" not in result
+
+
+@pytest.mark.asyncio
+async def test_compute_series_stats_tool_not_found(data_provider):
+    """Test statistics for an unknown series."""
+    result = await ComputeSeriesStatsTool(data_provider).execute({"series_id": "CUUR0000XXX"})
+
+    assert "error" in result
+
+
+@pytest.mark.asyncio
+async def test_compare_series_tool_execute(data_provider):
+    """Test comparing two series on one time axis."""
+    pytest.importorskip("numpy")
+    tool = CompareSeriesTool(data_provider)
+    result = await tool.execute(
+        {"series_ids": ["CUUR0000SA0", "CUUR0000SAF"], "start_year": 2024, "basis": "yoy"}
+    )
+
+    assert tool.name == "compare_series"
+    assert len(result["periods"]) == 9
+    assert len(result["matrix"][0]) == 2
+    assert result["correlation"][0][0] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_compare_series_tool_needs_two_series(data_provider):
+    """Test that a single series is rejected."""
+    result = await CompareSeriesTool(data_provider).execute({"series_ids": ["CUUR0000SA0"]})
+
+    assert "error" in result
+
+
+@pytest.mark.asyncio
+async def test_forecast_series_tool_execute(data_provider):
+    """Test forecasting in the process pool, then reusing the fitted model."""
+    pytest.importorskip("numpy")
+    tool = ForecastSeriesTool(data_provider, max_workers=1)
+    try:
+        first = await tool.execute({"series_id": "CUUR0000SA0", "model": "ar", "horizon": 3})
+        second = await tool.execute(
+            {"series_id": "CUUR0000SA0", "model": "ar", "horizon": 6, "level": 80}
+        )
+    finally:
+        tool._get_engine().shutdown()
+
+    assert tool.name == "forecast_series"
+    assert first["forecast"]["period"] == ["2024-M10", "2024-M11", "2024-M12"]
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert len(second["forecast"]["mean"]) == 6
+
+
+@pytest.mark.asyncio
+async def test_forecast_series_tool_refits_after_revision(tmp_path):
+    """Test that revising the latest observation invalidates the fitted model."""
+    pytest.importorskip("numpy")
+    provider = MockDataProvider(journal=False, cache_dir=tmp_path)
+    tool = ForecastSeriesTool(provider, max_workers=1)
+    arguments = {"series_id": "CUUR0000SA0", "model": "ar", "horizon": 3}
+    try:
+        first = await tool.execute(arguments)
+        latest = (await provider.get_series("CUUR0000SA0"))["data"][0]
+        await provider.apply_updates({"CUUR0000SA0": [{**latest, "value": "400.0"}]})
+        revised = await tool.execute(arguments)
+    finally:
+        await tool.aclose()
+
+    assert first["cached"] is False
+    assert revised["cached"] is False
+    assert revised["forecast"]["mean"] != first["forecast"]["mean"]
+
+
+@pytest.mark.asyncio
+async def test_forecast_series_tool_recovers_from_dead_worker(data_provider):
+    """Test that a crashed worker process does not break later forecasts."""
+    pytest.importorskip("numpy")
+    tool = ForecastSeriesTool(data_provider, max_workers=1)
+    try:
+        await tool.execute({"series_id": "CUUR0000SA0", "model": "ar", "horizon": 3})
+        pool = tool._get_engine()._executor
+        for process in list(pool._processes.values()):
+            process.kill()
+            process.join()
+        result = await tool.execute({"series_id": "CUUR0000SAF", "model": "ar"})
+    finally:
+        await tool.aclose()
+
+    assert "error" not in result
+    assert result["cached"] is False
+
+
+@pytest.mark.asyncio
+async def test_forecast_series_tool_rejects_unknown_model(data_provider):
+    """Test that an unknown model is an input error."""
+    result = await ForecastSeriesTool(data_provider).execute(
+        {"series_id": "CUUR0000SA0", "model": "prophet"}
+    )
+
+    assert "error" in result
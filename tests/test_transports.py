@@ -0,0 +1,237 @@
+"""Tests for the SSE/HTTP transport."""
+
+import json
+
+import pytest
+
+pytest.importorskip("sse_starlette")
+
+from starlette.testclient import TestClient
+
+from bls_mcp.rpc import SUPPORTED_PROTOCOL_VERSIONS
+from bls_mcp.server import BLSMCPServer
+from bls_mcp.transports.sse import SSETransport
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the HTTP transport."""
+    return TestClient(SSETransport(BLSMCPServer()).app)
+
+
+def _call(client, name, arguments, request_id=1):
+    return client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments},
+        },
+    )
+
+
+def test_health(client):
+    """Test the health check endpoint."""
+    assert client.get("/health").json() == {"status": "healthy", "transport": "sse"}
+
+
+def test_tools_call_returns_json_text(client):
+    """Test that tool results are returned as JSON text content."""
+    response = _call(client, "get_series", {"series_id": "CUUR0000SA0", "start_year": 2024})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["id"] == 1
+    result = json.loads(body["result"]["content"][0]["text"])
+    assert result["series_id"] == "CUUR0000SA0"
+    assert result["count"] == 9
+
+
+def test_tools_list_matches_server_schemas(client):
+    """Test that HTTP and stdio list the same tool definitions."""
+    server = BLSMCPServer()
+    body = client.post(
+        "/mcp", json={"jsonrpc": "2.0", "id": "a", "method": "tools/list"}
+    ).json()
+
+    assert body["id"] == "a"
+    assert body["result"]["tools"] == [
+        tool.to_mcp_tool() for tool in server.tools.values()
+    ]
+
+
+def test_initialize_negotiates_protocol_version(client):
+    """Test that a supported version is echoed and others get the newest."""
+
+    def negotiated(version):
+        body = client.post(
+            "/mcp",
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {"protocolVersion": version, "capabilities": {}},
+            },
+        ).json()
+        return body["result"]["protocolVersion"]
+
+    assert negotiated("2024-11-05") == "2024-11-05"
+    assert negotiated("2025-03-26") == "2025-03-26"
+    assert negotiated("1999-01-01") == SUPPORTED_PROTOCOL_VERSIONS[0]
+
+
+def test_unknown_tool(client):
+    """Test calling a tool that does not exist."""
+    body = _call(client, "nope", {}).json()
+
+    assert body["error"]["code"] == -32601
+
+
+def test_spec_accept_header_gets_full_result(client):
+    """Test that a spec client's Accept header alone does not chunk the result."""
+    response = client.post(
+        "/mcp",
+        headers={"Accept": "application/json, text/event-stream"},
+        json={
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools/call",
+            "params": {"name": "get_series", "arguments": {"series_id": "CUUR0000SA0"}},
+        },
+    )
+
+    assert response.headers["content-type"].startswith("application/json")
+    content = response.json()["result"]["content"]
+    assert content
+    assert json.loads(content[0]["text"])["series_id"] == "CUUR0000SA0"
+
+
+def test_tools_call_streams_chunks(client):
+    """Test that a request opting in to streaming receives the result in chunks."""
+    response = client.post(
+        "/mcp",
+        headers={"Accept": "application/json, text/event-stream"},
+        json={
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools/call",
+            "params": {
+                "name": "get_series",
+                "arguments": {"series_id": "CUUR0000SA0"},
+                "_meta": {"stream": True},
+            },
+        },
+    )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    *notifications, final = messages
+    chunks = [json.loads(m["params"]["content"][0]["text"]) for m in notifications]
+
+    assert all(m["method"] == "notifications/tools/chunk" for m in notifications)
+    assert [m["params"]["index"] for m in notifications] == list(range(len(chunks)))
+    assert final["id"] == 7
+    assert final["result"]["_meta"] == {"chunked": True, "chunks": len(chunks)}
+    assert sum(len(c["data"]) for c in chunks[1:]) == chunks[0]["count"]
+
+
+def test_batch_request(client):
+    """Test that a batch gets responses in request order, skipping notifications."""
+    response = client.post(
+        "/mcp",
+        json=[
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+             "params": {"name": "get_series", "arguments": {"series_id": "CUUR0000SA0"}}},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call",
+             "params": {"name": "list_series", "arguments": {"limit": 2}}},
+            {"jsonrpc": "2.0", "id": 3, "method": "nope"},
+        ],
+    )
+
+    body = response.json()
+    assert [entry["id"] for entry in body] == [1, 2, 3]
+    assert json.loads(body[0]["result"]["content"][0]["text"])["series_id"] == "CUUR0000SA0"
+    assert json.loads(body[1]["result"]["content"][0]["text"])["count"] == 2
+    assert body[2]["error"]["code"] == -32601
+
+
+def test_batch_of_notifications(client):
+    """Test that a batch of only notifications gets no body."""
+    response = client.post(
+        "/mcp", json=[{"jsonrpc": "2.0", "method": "notifications/initialized"}]
+    )
+
+    assert response.status_code == 202
+    assert response.content == b""
+
+
+def test_invalid_requests(client):
+    """Test empty batches, invalid entries and unparsable bodies."""
+    assert client.post("/mcp", json=[]).json()["error"]["code"] == -32600
+    assert client.post("/mcp", json=[1]).json()[0]["error"]["code"] == -32600
+    assert client.post("/mcp", content=b"{").json()["error"]["code"] == -32700
+
+
+def test_startup_prewarms_cache(monkeypatch):
+    """Test that the app warms the provider and cache before serving."""
+    monkeypatch.setenv("PREWARM_SERIES", "CUUR0000SA0, CUUR0000SAF")
+    server = BLSMCPServer()
+
+    with TestClient(SSETransport(server).app) as warmed:
+        assert warmed.get("/health").status_code == 200
+        cache = server.cache
+        assert cache.misses == 2
+        assert len(cache._entries) == 2
+
+
+def test_shutdown_releases_resources(monkeypatch):
+    """Test that app shutdown closes the provider stack and the forecast pool."""
+    server = BLSMCPServer()
+    closed = []
+    monkeypatch.setattr(
+        type(server.data_provider), "aclose", lambda self: _record(closed, self)
+    )
+
+    with TestClient(SSETransport(server).app) as app_client:
+        reply = app_client.post(
+            "/mcp",
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/call",
+                "params": {
+                    "name": "forecast_series",
+                    "arguments": {"series_id": "CUUR0000SA0", "horizon": 3},
+                },
+            },
+        )
+        assert "error" not in reply.json()
+        assert server.tools["forecast_series"]._engine is not None
+
+    assert closed == [server.data_provider]
+    assert server.tools["forecast_series"]._engine is None
+
+
+async def _record(calls, provider):
+    calls.append(provider)
+
+
+def test_metrics_endpoint(client):
+    """Test that /metrics reports tool and request latency in text format."""
+    client.post(
+        "/mcp",
+        json={"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+              "params": {"name": "list_series", "arguments": {"limit": 2}}},
+    )
+    response = client.get("/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'bls_mcp_tool_duration_seconds_count{tool="list_series"} 1' in response.text
+    assert 'bls_mcp_rpc_duration_seconds_count{method="tools/call"} 1' in response.text
+    assert "bls_mcp_cache_hit_rate" in response.text
@@ -0,0 +1,43 @@
+"""Tests for input validators."""
+
+from bls_mcp.utils import validators
+from bls_mcp.utils.validators import find_invalid_series_ids, validate_series_id
+
+
+def test_validate_series_id():
+    """Test the series ID format, in either case and without stray characters."""
+    assert validate_series_id("CUUR0000SA0")
+    assert validate_series_id("ces0000000001")
+    assert not validate_series_id("")
+    assert not validate_series_id("INVALID")
+    assert not validate_series_id("CUUR0000SA0\n")
+    assert not validate_series_id("CUUR-0000SA0")
+
+
+def test_series_id_length_bounds():
+    """Test that IDs of 8 to 20 characters are accepted."""
+    assert validate_series_id("LA" + "0" * 6)
+    assert not validate_series_id("LA" + "0" * 5)
+    assert validate_series_id("CUUR" + "0" * 16)
+    assert not validate_series_id("CUUR" + "0" * 17)
+
+
+def test_known_ids_are_remembered(monkeypatch):
+    """Test that valid IDs are memoized, and the memo stays bounded."""
+    monkeypatch.setattr(validators, "_known_series_ids", set())
+    monkeypatch.setattr(validators, "MAX_KNOWN_SERIES_IDS", 2)
+
+    validate_series_id("CUUR0000SA0")
+    validate_series_id("NOPE")
+    assert validators._known_series_ids == {"CUUR0000SA0"}
+
+    find_invalid_series_ids(["CUUR0000SAF", "CUUR0000SAH"])
+    assert validators._known_series_ids == {"CUUR0000SAH"}
+
+
+def test_find_invalid_series_ids():
+    """Test that bulk validation returns the invalid IDs in order."""
+    ids = ["CUUR0000SA0", "X", "cuur0000saf", "", "CUUR0000SA0 "]
+
+    assert find_invalid_series_ids(ids) == ["X", "", "CUUR0000SA0 "]
+    assert find_invalid_series_ids(ids[:1]) == []